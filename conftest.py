@@ -0,0 +1,13 @@
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "benchmarks (leetcode/benchmarks)")
+    group.addoption("--bench", action="store_true", help="Run the benchmarks; they are skipped otherwise.")
+    group.addoption(
+        "--bench-max-size", type=int, default=10 ** 6,
+        help="Largest input size to benchmark (sizes go from 10 to 10**7; default 10**6).",
+    )
+    group.addoption("--bench-output", default="benchmark-results.json", help="File the results are written to.")
+    group.addoption("--bench-baseline", default=None, help="Results file to compare against; regressions fail the run.")
+    group.addoption(
+        "--bench-threshold", type=float, default=0.25,
+        help="Relative slowdown over the baseline reported as a regression (default 0.25).",
+    )
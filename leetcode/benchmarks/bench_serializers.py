@@ -0,0 +1,93 @@
+"""
+Benchmarks of the leetcode serializers across input sizes and shapes.
+
+Each benchmark times three phases separately, on the same JSON body:
+- `parse`: decoding the request body (`FastJSONParser`);
+- `validate`: `serializer.is_valid()`;
+- `compute`: the algorithm (`rotate`, `find_kth_largest`, `find_longest_path`).
+
+Run with `python -m pytest leetcode/benchmarks --bench`; see the root
+`conftest.py` for the options.
+"""
+import io
+from math import isqrt
+
+import numpy as np
+import orjson
+import pytest
+
+from leetcode.serializers import (
+    KthLargestSerializer,
+    LongestIncreasingPathSerializer,
+    RotateArraySerializer,
+)
+from todolist.parsers import FastJSONParser
+
+from .conftest import measure
+
+SIZES = [10 ** exponent for exponent in range(1, 8)]
+
+
+def array_input(shape, size):
+    rng = np.random.default_rng(size)
+    if shape == "random":
+        return rng.integers(-10 ** 9, 10 ** 9, size)
+    if shape == "sorted":
+        return np.arange(size)
+    return np.full(size, 7)
+
+
+def matrix_input(shape, size):
+    side = max(1, isqrt(size))
+    if shape == "snake":
+        # Values increase along a single path through every cell.
+        matrix = np.arange(side * side).reshape(side, side)
+        matrix[1::2] = matrix[1::2, ::-1]
+        return matrix
+    return array_input(shape, side * side).reshape(side, side)
+
+
+PROBLEMS = {
+    "rotate-array": (
+        RotateArraySerializer, "rotate", array_input, ("random", "sorted", "equal"),
+        lambda data: {"nums": data, "k": len(data) // 3},
+    ),
+    "kth-largest": (
+        KthLargestSerializer, "find_kth_largest", array_input, ("random", "sorted", "equal"),
+        lambda data: {"nums": data, "k": max(1, len(data) // 10)},
+    ),
+    "longest-increasing-path": (
+        LongestIncreasingPathSerializer, "find_longest_path", matrix_input, ("random", "sorted", "equal", "snake"),
+        lambda data: {"matrix": data},
+    ),
+}
+
+CASES = [
+    pytest.param(problem, shape, size, id=f"{problem}/{shape}/{size}")
+    for problem, (_, _, _, shapes, _) in PROBLEMS.items()
+    for shape in shapes
+    for size in SIZES
+]
+
+
+@pytest.mark.parametrize("problem, shape, size", CASES)
+def test_serializer(problem, shape, size, bench_recorder, pytestconfig):
+    if size > pytestconfig.getoption("--bench-max-size"):
+        pytest.skip("larger than --bench-max-size")
+    serializer_class, method, make_input, _, make_body = PROBLEMS[problem]
+    body = orjson.dumps(make_body(make_input(shape, size)), option=orjson.OPT_SERIALIZE_NUMPY)
+    name = f"{problem}/{shape}/{size}"
+
+    seconds, data = measure(lambda: FastJSONParser().parse(io.BytesIO(body)))
+    bench_recorder.record(name, "parse", seconds)
+
+    def validate():
+        serializer = serializer_class(data=data)
+        serializer.is_valid(raise_exception=True)
+        return serializer
+
+    seconds, serializer = measure(validate)
+    bench_recorder.record(name, "validate", seconds)
+
+    seconds, _ = measure(getattr(serializer, method))
+    bench_recorder.record(name, "compute", seconds)
@@ -0,0 +1,136 @@
+"""
+Benchmark harness: timing, result recording and baseline comparison.
+
+Results are written to `--bench-output` as JSON, keyed by benchmark and phase:
+
+    {"meta": {...}, "results": {"kth-largest/random/1000": {"parse": 0.0001, ...}}}
+
+With `--bench-baseline`, every phase slower than the baseline by more than
+`--bench-threshold` (and by more than `MIN_DIFFERENCE` seconds, to ignore
+timer noise on tiny inputs) is reported, and the run fails.
+"""
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+# Slowdowns smaller than this many seconds are never reported.
+MIN_DIFFERENCE = 0.001
+
+# Each measurement is repeated until it has run this long (or MAX_REPEAT times), keeping the best time.
+MIN_TIME = 0.2
+MAX_REPEAT = 5
+
+
+def measure(func):
+    """
+    Returns the best time of several calls of `func`, and its result.
+    """
+    times = []
+    while len(times) < MAX_REPEAT and sum(times) < MIN_TIME:
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+class BenchmarkRecorder:
+    """
+    Collects the timings of a run and compares them with a baseline.
+    """
+
+    def __init__(self):
+        self.results = {}
+
+    def record(self, name, phase, seconds):
+        self.results.setdefault(name, {})[phase] = seconds
+
+    def regressions(self, baseline, threshold):
+        """
+        Returns (name, phase, baseline seconds, current seconds) for every phase
+        slower than the baseline by more than `threshold`.
+        """
+        found = []
+        for name, phases in sorted(self.results.items()):
+            for phase, seconds in phases.items():
+                before = baseline.get(name, {}).get(phase)
+                if before is not None and seconds > before * (1 + threshold) and seconds - before > MIN_DIFFERENCE:
+                    found.append((name, phase, before, seconds))
+        return found
+
+    def to_json(self):
+        return {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+            },
+            "results": self.results,
+        }
+
+
+recorder_key = pytest.StashKey[BenchmarkRecorder]()
+regressions_key = pytest.StashKey[list]()
+
+
+@pytest.fixture(scope="session")
+def bench_recorder(request):
+    recorder = BenchmarkRecorder()
+    request.config.stash[recorder_key] = recorder
+    return recorder
+
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --bench")
+    for item in items:
+        if "benchmarks" in item.nodeid.split("/"):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    recorder = config.stash.get(recorder_key, None)
+    if recorder is None or not recorder.results:
+        return
+    with open(config.getoption("--bench-output"), "w") as file:
+        json.dump(recorder.to_json(), file, indent=2, sort_keys=True)
+
+    baseline_path = config.getoption("--bench-baseline")
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)["results"]
+        config.stash[regressions_key] = recorder.regressions(baseline, config.getoption("--bench-threshold"))
+        if config.stash[regressions_key]:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    recorder = config.stash.get(recorder_key, None)
+    if recorder is None or not recorder.results:
+        return
+    terminalreporter.section("benchmarks")
+    for name, phases in sorted(recorder.results.items()):
+        timings = "  ".join(f"{phase} {seconds * 1000:10.3f} ms" for phase, seconds in phases.items())
+        terminalreporter.write_line(f"{name:45} {timings}")
+    terminalreporter.write_line(f"Results written to {config.getoption('--bench-output')}")
+
+    regressions = config.stash.get(regressions_key, None)
+    if regressions is None:
+        return
+    if not regressions:
+        terminalreporter.write_line("No regressions against the baseline.")
+    for name, phase, before, seconds in regressions:
+        terminalreporter.write_line(
+            f"REGRESSION {name} {phase}: {before * 1000:.3f} ms -> {seconds * 1000:.3f} ms "
+            f"(+{(seconds / before - 1) * 100:.0f}%)",
+            red=True,
+        )
@@ -0,0 +1,193 @@
+"""
+Result cache for the leetcode endpoints.
+
+Results are keyed by a SHA-256 fingerprint of the endpoint name and the
+validated input, kept in a size-bounded in-process LRU and, when
+`LEETCODE_RESULT_CACHE["CACHE_ALIAS"]` names a Django cache, shared through
+that cache as well.
+"""
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+_MISSING = object()
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def fingerprint(namespace, data):
+    """
+    Returns a hex digest identifying `data` (validated input) for the endpoint `namespace`.
+
+    Flat integer lists and NumPy arrays are hashed from their packed bytes,
+    so hashing a large array costs far less than the computation it saves.
+    """
+    digest = hashlib.sha256(namespace.encode())
+    _update(digest, data)
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    if isinstance(value, dict):
+        digest.update(b"d%d:" % len(value))
+        for key in sorted(value):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        try:
+            packed = array("q", value).tobytes()
+        except (TypeError, OverflowError):
+            digest.update(b"l%d:" % len(value))
+            for item in value:
+                _update(digest, item)
+        else:
+            digest.update(b"a%d:" % len(packed))
+            digest.update(packed)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"n{value.dtype.str}{value.shape}:".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+        encoded = repr(value).encode()
+        digest.update(b"%s%d:" % (type(value).__name__.encode(), len(encoded)))
+        digest.update(encoded)
+
+
+def result_size(result):
+    """
+    Returns the number of items a result holds, used to bound the cache size.
+    """
+    if isinstance(result, dict):
+        return 1 + sum(result_size(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, np.ndarray):
+        return result.size
+    return 1
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of computed results.
+
+    Memory use is bounded by the total number of items the results hold
+    (`result_size`): least recently used results are evicted once the entries
+    hold more than `max_total_size` items or number more than `max_entries`,
+    and results holding more than `max_result_size` items are never cached.
+    `hits` and `misses` count lookups since the cache was created.
+    """
+
+    def __init__(self, max_entries=1024, max_result_size=100_000, max_total_size=1_000_000, cache_alias=None,
+                 timeout=3600):
+        self.max_entries = max_entries
+        self.max_result_size = max_result_size
+        self.max_total_size = max_total_size
+        self.total_size = 0
+        self.backend = caches[cache_alias] if cache_alias else None
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, namespace, data, compute):
+        """
+        Returns the cached result for `data`, computing and storing it with `compute()` on a miss.
+
+        Also returns whether the result came from the cache. Exceptions raised
+        by `compute` propagate and nothing is stored.
+        """
+        key = fingerprint(namespace, data)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0], True
+
+        if self.backend is not None:
+            result = self.backend.get(f"leetcode:{key}", _MISSING)
+            if result is not _MISSING:
+                size = result_size(result)
+                if size <= self.max_result_size:
+                    self._store(key, result, size)
+                with self._lock:
+                    self.hits += 1
+                return result, True
+
+        with self._lock:
+            self.misses += 1
+        result = compute()
+        size = result_size(result)
+        if size <= self.max_result_size:
+            self._store(key, result, size)
+            if self.backend is not None:
+                self.backend.set(f"leetcode:{key}", result, self.timeout)
+        return result, False
+
+    def _store(self, key, result, size):
+        with self._lock:
+            if key in self._entries:
+                self.total_size -= self._entries[key][1]
+            self._entries[key] = (result, size)
+            self._entries.move_to_end(key)
+            self.total_size += size
+            while len(self._entries) > self.max_entries or self.total_size > self.max_total_size:
+                self.total_size -= self._entries.popitem(last=False)[1][1]
+
+    def stats(self):
+        """
+        Returns the hit and miss counters, and the current number of entries and items they hold.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "total_size": self.total_size,
+                "max_total_size": self.max_total_size,
+            }
+
+    def clear(self):
+        """
+        Drops every in-process entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.total_size = 0
+
+
+def get_result_cache():
+    """
+    Returns the process-wide result cache, configured by `LEETCODE_RESULT_CACHE`.
+    """
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            config = settings.LEETCODE_RESULT_CACHE
+            _result_cache = ResultCache(
+                max_entries=config["MAX_ENTRIES"],
+                max_result_size=config["MAX_RESULT_SIZE"],
+                max_total_size=config["MAX_TOTAL_SIZE"],
+                cache_alias=config["CACHE_ALIAS"],
+                timeout=config["TIMEOUT"],
+            )
+    return _result_cache
+
+
+@receiver(setting_changed)
+def reset_result_cache(setting, **kwargs):
+    """
+    Rebuilds the result cache when its settings change (e.g. in tests).
+    """
+    global _result_cache
+    if setting == "LEETCODE_RESULT_CACHE":
+        with _result_cache_lock:
+            _result_cache = None
@@ -0,0 +1,254 @@
+"""
+Binary request and response formats for the leetcode endpoints.
+
+Negotiated with `Content-Type` / `Accept` next to JSON:
+- `application/x-npy`: a NumPy `.npy` file (dtype and shape header, then the values);
+- `application/x-int64`: raw little-endian int64 values; a `columns=<n>`
+  media type parameter makes them a matrix of n columns;
+- `application/msgpack`: the JSON body, MessagePack-encoded; arrays may also
+  be sent (and are returned) as `bin` values holding `.npy` files.
+
+`.npy` and int64 request bodies hold the view's array argument (`nums` or
+`matrix`, named by the view's `array_field`), and the other arguments (`k`,
+`ks`, `return_path`, ...) are read from the query string. Arrays are decoded
+with `np.frombuffer` over the request body, without creating a Python object
+per value, and validated as arrays by `leetcode.fields`.
+
+The array renderers return the `result` of successful responses as an array;
+other responses (errors, mappings) fall back to JSON.
+"""
+import io
+from collections.abc import Sequence
+
+import msgpack
+import numpy as np
+from django.utils.functional import Promise
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.mediatypes import _MediaType
+
+from todolist.renderers import FastJSONRenderer
+
+
+def decode_npy(data):
+    """
+    Returns the array held by a `.npy` file, as a read-only view over `data`.
+    """
+    stream = io.BytesIO(data)
+    try:
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    except ValueError as exc:
+        raise ParseError(f"NPY parse error - {exc}")
+    if dtype.hasobject:
+        raise ParseError("NPY parse error - object arrays are not supported.")
+    count = int(np.prod(shape))
+    if len(data) - stream.tell() != count * dtype.itemsize:
+        raise ParseError("NPY parse error - the data does not match the header.")
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=stream.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def encode_npy(array):
+    """
+    Returns `array` as a `.npy` file.
+    """
+    stream = io.BytesIO()
+    np.save(stream, array, allow_pickle=False)
+    return stream.getvalue()
+
+
+def array_result(data, response=None):
+    """
+    Returns the `result` of a successful response as an integer array, or None
+    when the response is an error or its result is not an array of integers.
+    """
+    if response is not None and response.status_code >= 400:
+        return None
+    if not isinstance(data, dict) or set(data) != {"result"}:
+        return None
+    result = data["result"]
+    if isinstance(result, np.ndarray):
+        return result if result.dtype.kind in "iu" else None
+    if isinstance(result, (int, list)) and not isinstance(result, bool):
+        try:
+            return np.asarray(result, dtype=np.int64)
+        except (OverflowError, TypeError, ValueError):
+            return None
+    return None
+
+
+class ArrayParser(BaseParser):
+    """
+    Base class of the parsers whose body is the view's array argument.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        view = parser_context["view"]
+        request = parser_context["request"]
+        data = self.query_arguments(request.query_params, view.get_serializer_class()().fields)
+        data[view.array_field] = self.decode(stream.read(), _MediaType(media_type).params)
+        return data
+
+    def query_arguments(self, query_params, fields):
+        """
+        Returns the query parameters as serializer input; list fields take every value given.
+        """
+        return {
+            name: query_params.getlist(name) if isinstance(fields.get(name), serializers.ListField) else query_params[name]
+            for name in query_params
+        }
+
+    def decode(self, body, params):
+        """Returns the array in a request body."""
+        raise NotImplementedError
+
+
+class NpyParser(ArrayParser):
+    """
+    Parses a `.npy` file into the view's array argument.
+    """
+
+    media_type = "application/x-npy"
+
+    def decode(self, body, params):
+        return decode_npy(body)
+
+
+class Int64Parser(ArrayParser):
+    """
+    Parses raw little-endian int64 values into the view's array argument.
+    """
+
+    media_type = "application/x-int64"
+
+    def decode(self, body, params):
+        if len(body) % 8:
+            raise ParseError("Int64 parse error - the body length must be a multiple of 8.")
+        array = np.frombuffer(body, dtype="<i8")
+        if "columns" not in params:
+            return array
+        try:
+            columns = int(params["columns"])
+        except ValueError:
+            columns = 0
+        if columns <= 0 or len(array) % columns:
+            raise ParseError("Int64 parse error - `columns` must be a positive divisor of the number of values.")
+        return array.reshape(-1, columns)
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack-encoded data; `bin` values are decoded as `.npy` files.
+    """
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            data = msgpack.unpackb(stream.read(), raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
+        if not isinstance(data, dict):
+            raise ParseError("MessagePack parse error - expected a map.")
+        return {key: decode_npy(value) if isinstance(value, bytes) else value for key, value in data.items()}
+
+
+class ArrayRenderer(BaseRenderer):
+    """
+    Base class of the renderers that return an array result; other responses are rendered as JSON.
+    """
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        array = array_result(data, response)
+        if array is None:
+            if response is not None:
+                response["Content-Type"] = FastJSONRenderer.media_type
+            return FastJSONRenderer().render(data, accepted_media_type, renderer_context)
+        return self.encode(array, response)
+
+    def encode(self, array, response):
+        """Returns the response body for an array result; `response` may be None."""
+        raise NotImplementedError
+
+
+class NpyRenderer(ArrayRenderer):
+    """
+    Renders an array result as a `.npy` file.
+    """
+
+    media_type = "application/x-npy"
+    format = "npy"
+
+    def encode(self, array, response):
+        return encode_npy(array)
+
+
+class Int64Renderer(ArrayRenderer):
+    """
+    Renders an array result as raw little-endian int64 values, with a `columns` parameter for matrices.
+    """
+
+    media_type = "application/x-int64"
+    format = "int64"
+
+    def encode(self, array, response):
+        if array.ndim == 2 and response is not None:
+            response["Content-Type"] = f"{self.media_type}; columns={array.shape[1]}"
+        return array.astype("<i8", copy=False).tobytes()
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders data as MessagePack; NumPy arrays are rendered as `bin` values holding `.npy` files.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.default)
+
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            return encode_npy(obj)
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, Promise):
+            return str(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+class ArrayFormatsMixin:
+    """
+    Accepts and returns the binary formats above next to the default ones.
+
+    Views set `array_field` to the name of their array argument.
+    """
+
+    array_field: str | None = None
+    # `api_settings` returns the imported classes; the stubs type them as dotted paths.
+    parser_classes: Sequence[type[BaseParser]] = [
+        *api_settings.DEFAULT_PARSER_CLASSES,  # type: ignore[list-item]
+        NpyParser,
+        Int64Parser,
+        MessagePackParser,
+    ]
+    renderer_classes: Sequence[type[BaseRenderer]] = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,  # type: ignore[list-item]
+        NpyRenderer,
+        Int64Renderer,
+        MessagePackRenderer,
+    ]
@@ -0,0 +1,178 @@
+"""
+Longest increasing path in a matrix, without recursion.
+
+Every cell gets the length of the longest strictly increasing path starting
+at it: 1 plus the largest length among its greater neighbours. Cells are
+resolved in topological order, from the local maxima down:
+- NumPy arrays are peeled layer by layer (Kahn's algorithm): the cells whose
+  greater neighbours are all resolved form the next layer, found with a few
+  vectorized operations per layer, over the whole matrix while layers are
+  wide and over the layer's cell indexes once they are not;
+- when layers get narrow (long chains, e.g. a snake-shaped matrix) and for
+  lists of ints outside int64, the remaining cells are resolved one by one in
+  decreasing value order, so every greater neighbour is resolved first.
+"""
+import numpy as np
+
+# Matrices with at least this many cells are peeled with NumPy.
+NUMPY_THRESHOLD = 1024
+
+# Layers holding at least 1/DENSE_LAYER of the cells are peeled as whole-matrix masks.
+DENSE_LAYER = 64
+
+# Peeling stops once a layer has fewer cells than this; the rest is resolved cell by cell.
+NARROW_LAYER = 64
+
+
+def longest_increasing_path(matrix):
+    """
+    Returns the length of the longest strictly increasing path in a non-empty matrix.
+    """
+    return int(np.max(path_lengths(matrix)))
+
+
+def path_lengths(matrix):
+    """
+    Returns the length of the longest increasing path starting at each cell.
+
+    Returns an int64 array for NumPy input, and a list of lists otherwise.
+    """
+    if isinstance(matrix, np.ndarray):
+        if matrix.size >= NUMPY_THRESHOLD:
+            return path_lengths_numpy(matrix)
+        return np.array(path_lengths_python(matrix.tolist()), dtype=np.int64)
+    return path_lengths_python(matrix)
+
+
+def trace_path(matrix, lengths):
+    """
+    Returns the (row, column) coordinates of one longest increasing path, from
+    its smallest value to its largest, as an (n, 2) int64 array.
+
+    The path is read back from `lengths` (as returned by `path_lengths`): from
+    a cell of maximal length, step to a greater neighbour one shorter, until
+    a local maximum is reached.
+    """
+    lengths = np.asarray(lengths)
+    cell = int(np.argmax(lengths))
+    cols = lengths.shape[1]
+    if isinstance(matrix, np.ndarray):
+        values = matrix.ravel().tolist()
+    else:
+        values = [value for row in matrix for value in row]
+    lengths = lengths.ravel().tolist()
+    size = len(values)
+
+    cells = [cell]
+    while lengths[cell] > 1:
+        column = cell % cols
+        for neighbour in (
+            cell - 1 if column else -1,
+            cell + 1 if column + 1 < cols else -1,
+            cell - cols,
+            cell + cols if cell + cols < size else -1,
+        ):
+            if neighbour >= 0 and lengths[neighbour] == lengths[cell] - 1 and values[neighbour] > values[cell]:
+                cell = neighbour
+                break
+        cells.append(cell)
+    return np.column_stack(np.divmod(np.array(cells, dtype=np.int64), cols))
+
+
+def path_lengths_python(matrix):
+    """
+    Resolves every cell in decreasing value order; see the module docstring.
+    """
+    rows, cols = len(matrix), len(matrix[0])
+    values = [value for row in matrix for value in row]
+    lengths = [0] * len(values)
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=True)
+    resolve_in_order(values, lengths, order, cols)
+    return [lengths[row * cols:(row + 1) * cols] for row in range(rows)]
+
+
+def path_lengths_numpy(matrix):
+    """
+    Peels layers of cells with NumPy, then resolves what is left cell by cell.
+    """
+    rows, cols = matrix.shape
+    values = matrix.ravel()
+    size = values.size
+
+    # For each direction, whether the neighbour that way is greater.
+    right, left, down, up = (np.zeros((rows, cols), dtype=bool) for _ in range(4))
+    np.greater(matrix[:, 1:], matrix[:, :-1], out=right[:, :-1])
+    np.greater(matrix[:, :-1], matrix[:, 1:], out=left[:, 1:])
+    np.greater(matrix[1:, :], matrix[:-1, :], out=down[:-1, :])
+    np.greater(matrix[:-1, :], matrix[1:, :], out=up[1:, :])
+    right, left, down, up = right.ravel(), left.ravel(), down.ravel(), up.ravel()
+
+    # Number of unresolved greater neighbours; a cell is ready when it reaches 0.
+    pending = right.view(np.int8) + left.view(np.int8) + down.view(np.int8) + up.view(np.int8)
+    lengths = np.zeros(size, dtype=np.int64)
+    length = 1
+
+    # Wide layers are peeled as boolean masks over the whole matrix...
+    ready = pending == 0
+    released = np.empty(size, dtype=np.int8)
+    while np.count_nonzero(ready) * DENSE_LAYER >= size:
+        lengths[ready] = length
+        released[:] = 0
+        released[:-1] += right[:-1] & ready[1:]
+        released[1:] += left[1:] & ready[:-1]
+        released[:-cols] += down[:-cols] & ready[cols:]
+        released[cols:] += up[cols:] & ready[:-cols]
+        pending -= released
+        ready = (released > 0) & (pending == 0)
+        length += 1
+
+    # ... narrower ones as arrays of cell indexes.
+    layer = np.flatnonzero(ready)
+    greater = [(1, right), (-1, left), (cols, down), (-cols, up)]
+    while len(layer) >= NARROW_LAYER:
+        lengths[layer] = length
+        candidates = []
+        for offset, mask in greater:
+            # Cells `offset` away from the layer whose neighbour in the layer is greater.
+            smaller = layer - offset
+            smaller = smaller[(smaller >= 0) & (smaller < size)]
+            smaller = smaller[mask[smaller]]
+            pending[smaller] -= 1
+            candidates.append(smaller)
+        candidates = np.concatenate(candidates)
+        layer = np.sort(candidates[pending[candidates] == 0])
+        # A cell reaching 0 is listed once per direction it was reached from.
+        layer = layer[np.concatenate(([True], layer[1:] != layer[:-1]))]
+        length += 1
+
+    remaining = np.flatnonzero(lengths == 0)
+    order = remaining[np.argsort(values[remaining], kind="stable")[::-1]].tolist()
+    if len(remaining) * 8 < size:
+        # Few cells left: index the arrays directly rather than copying them to lists.
+        resolve_in_order(values, lengths, order, cols)
+    else:
+        lengths_list = lengths.tolist()
+        resolve_in_order(values.tolist(), lengths_list, order, cols)
+        lengths = np.array(lengths_list, dtype=np.int64)
+    return lengths.reshape(rows, cols)
+
+
+def resolve_in_order(values, lengths, order, cols):
+    """
+    Sets `lengths[cell]` for each flat cell index in `order`, which must list
+    cells in decreasing value order after any already resolved greater cell.
+    """
+    size = len(values)
+    for cell in order:
+        value = values[cell]
+        best = 0
+        column = cell % cols
+        if column and values[cell - 1] > value:
+            best = lengths[cell - 1]
+        if column + 1 < cols and values[cell + 1] > value and lengths[cell + 1] > best:
+            best = lengths[cell + 1]
+        if cell >= cols and values[cell - cols] > value and lengths[cell - cols] > best:
+            best = lengths[cell - cols]
+        if cell + cols < size and values[cell + cols] > value and lengths[cell + cols] > best:
+            best = lengths[cell + cols]
+        lengths[cell] = best + 1
@@ -0,0 +1,159 @@
+"""
+Selection of order statistics (k-th smallest / largest values).
+
+Two backends are used:
+- NumPy's `partition` (introselect in C) for large inputs that fit in int64;
+- an iterative pure-Python introselect otherwise: random pivots with
+  three-way partitioning, so duplicates never skew a partition, falling back
+  to median-of-medians pivots when partitions keep coming out unbalanced,
+  which bounds the worst case to O(n).
+
+Several order statistics of the same values are selected together in one
+pass (`select_many`), partitioning only the parts that hold a requested index.
+"""
+import random
+from bisect import bisect_left
+
+import numpy as np
+
+# Inputs with at least this many values are selected with NumPy.
+NUMPY_THRESHOLD = 512
+
+# Partitions are done with `sorted` below this size.
+SMALL_SIZE = 16
+
+_random = random.Random()
+
+
+def kth_largest(values, k):
+    """
+    Returns the k-th largest value (1-based) of a non-empty sequence.
+    """
+    return select(values, len(values) - k)
+
+
+def kth_largest_many(values, ks):
+    """
+    Returns a dict mapping each k in `ks` (1-based) to the k-th largest value.
+    """
+    found = select_many(values, [len(values) - k for k in ks])
+    return dict(zip(ks, found))
+
+
+def select(values, index):
+    """
+    Returns the value that would be at `index` (0-based) if `values` were sorted ascending.
+
+    `values` may be a list of ints or a NumPy integer array; it is not modified.
+    """
+    if not 0 <= index < len(values):
+        raise IndexError("index out of range")
+
+    if isinstance(values, np.ndarray):
+        return int(np.partition(values, index)[index])
+    if len(values) >= NUMPY_THRESHOLD:
+        array = to_int64_array(values)
+        if array is not None:
+            array.partition(index)
+            return int(array[index])
+    return select_python(values, index)
+
+
+def select_many(values, indexes):
+    """
+    Returns the values that would be at each of `indexes` (0-based) if `values` were sorted ascending.
+
+    Like `select`, but all indexes are found in a single multi-select pass.
+    """
+    if not all(0 <= index < len(values) for index in indexes):
+        raise IndexError("index out of range")
+
+    wanted = sorted(set(indexes))
+    if isinstance(values, np.ndarray):
+        array = np.partition(values, wanted)
+    elif len(values) >= NUMPY_THRESHOLD and (array := to_int64_array(values)) is not None:
+        array.partition(wanted)
+    else:
+        found = select_many_python(values, wanted)
+        return [found[index] for index in indexes]
+    return [int(array[index]) for index in indexes]
+
+
+def to_int64_array(values):
+    """
+    Returns `values` as an int64 NumPy array, or None if some value does not fit.
+    """
+    try:
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+
+def select_python(values, index):
+    """
+    Iterative introselect over Python objects; see the module docstring.
+    """
+    values = list(values)
+    # Allowed number of partitions that keep more than 3/4 of the values
+    # before switching to median-of-medians pivots.
+    budget = 2 * len(values).bit_length()
+    while len(values) > SMALL_SIZE:
+        pivot = median_of_medians(values) if budget <= 0 else _random.choice(values)
+        lower = [value for value in values if value < pivot]
+        if index < len(lower):
+            kept = lower
+        else:
+            upper = [value for value in values if value > pivot]
+            equal = len(values) - len(lower) - len(upper)
+            if index < len(lower) + equal:
+                return pivot
+            index -= len(lower) + equal
+            kept = upper
+        if len(kept) * 4 > len(values) * 3:
+            budget -= 1
+        values = kept
+    return sorted(values)[index]
+
+
+def select_many_python(values, indexes):
+    """
+    Multi-select counterpart of `select_python`; returns a dict mapping each of
+    the sorted, distinct `indexes` to its value.
+
+    Each partition is only refined on the sides that still hold a requested
+    index, and parts holding a single index are handed to `select_python`.
+    """
+    found = {}
+    stack = [(list(values), indexes, 0, 2 * len(values).bit_length())]
+    while stack:
+        values, indexes, offset, budget = stack.pop()
+        if len(indexes) == 1:
+            found[indexes[0]] = select_python(values, indexes[0] - offset)
+            continue
+        if len(values) <= SMALL_SIZE:
+            ordered = sorted(values)
+            found.update((index, ordered[index - offset]) for index in indexes)
+            continue
+
+        pivot = median_of_medians(values) if budget <= 0 else _random.choice(values)
+        lower = [value for value in values if value < pivot]
+        upper = [value for value in values if value > pivot]
+        lower_end = offset + len(lower)
+        upper_start = offset + len(values) - len(upper)
+        split_lower = bisect_left(indexes, lower_end)
+        split_upper = bisect_left(indexes, upper_start)
+        found.update((index, pivot) for index in indexes[split_lower:split_upper])
+        for kept, kept_indexes, kept_offset in ((lower, indexes[:split_lower], offset),
+                                                (upper, indexes[split_upper:], upper_start)):
+            if kept_indexes:
+                unbalanced = len(kept) * 4 > len(values) * 3
+                stack.append((kept, kept_indexes, kept_offset, budget - unbalanced))
+    return found
+
+
+def median_of_medians(values):
+    """
+    Returns a pivot guaranteed to have at least ~30% of `values` on either side.
+    """
+    medians = [sorted(values[i:i + 5])[(min(5, len(values) - i) - 1) // 2] for i in range(0, len(values), 5)]
+    return select_python(medians, (len(medians) - 1) // 2)
@@ -1,28 +1,35 @@
+import numpy as np
 from rest_framework import serializers
-import random
+from .fields import IntegerArrayField, IntegerMatrixField
+from .paths import longest_increasing_path, path_lengths, trace_path
+from .selection import kth_largest, kth_largest_many
 
 class RotateArraySerializer(serializers.Serializer):
-    nums = serializers.ListField(
-        child=serializers.IntegerField(), 
-        allow_empty=True  
-    )
+    nums = IntegerArrayField(allow_empty=True)
     k = serializers.IntegerField(min_value=0)
 
     def validate(self, data):
         """Ensure k is within valid range."""
         nums, k = data["nums"], data["k"]
 
-        if not nums:  
+        if len(nums) == 0:
             return data
 
         data["k"] = k % len(nums)  
         return data
 
     def rotate(self):
-        """Rotate array to the right by k places with O(1) space complexity."""
+        """
+        Rotate array to the right by k places.
+
+        NumPy arrays are rotated with `np.roll`; lists (values outside int64)
+        in place, with O(1) extra space.
+        """
         nums, k = self.validated_data["nums"], self.validated_data["k"]
 
-        if not nums or k == 0: 
+        if isinstance(nums, np.ndarray):
+            return np.roll(nums, k).tolist()
+        if not nums or k == 0:
             return nums
 
         self.reverse(nums, 0, len(nums) - 1)
@@ -40,96 +47,72 @@ class RotateArraySerializer(serializers.Serializer):
 
 
 class KthLargestSerializer(serializers.Serializer):
-    nums = serializers.ListField(
-        child=serializers.IntegerField(),
+    nums = IntegerArrayField(
         allow_empty=False,
         help_text="List of integers."
     )
-    k = serializers.IntegerField(min_value=1, help_text="The k-th largest element to find.")
+    k = serializers.IntegerField(min_value=1, required=False, help_text="The k-th largest element to find.")
+    ks = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        required=False,
+        help_text="Several k values to find in one pass, instead of `k`."
+    )
+
+    def validate(self, data):
+        """Ensure exactly one of k and ks is given."""
+        if ("k" in data) == ("ks" in data):
+            raise serializers.ValidationError("Provide exactly one of k and ks.")
+        return data
 
     def find_kth_largest(self):
         """
-        Finds the k-th largest element in O(n) average time using QuickSelect.
+        Finds the k-th largest element in O(n) time with `leetcode.selection`.
+
+        Large inputs are selected with NumPy; others with an iterative
+        introselect that stays O(n) even on adversarial inputs. With `ks`, all
+        of them are selected in a single pass and a mapping of k to value is
+        returned.
         """
         nums = self.validated_data["nums"]
-        k = self.validated_data["k"]
+        ks = self.validated_data.get("ks") or [self.validated_data["k"]]
 
-        if k > len(nums):
+        if max(ks) > len(nums):
             raise serializers.ValidationError("k cannot be greater than the length of nums.")
 
-        def quickselect(left, right, index):
-            """
-            In-place QuickSelect algorithm.
-            """
-            pivot_index = random.randint(left, right)
-            pivot = nums[pivot_index]
-
-            nums[right], nums[pivot_index] = nums[pivot_index], nums[right]  
-            store_index = left
-
-            for i in range(left, right):
-                if nums[i] > pivot:  
-                    nums[i], nums[store_index] = nums[store_index], nums[i]
-                    store_index += 1
-
-            nums[right], nums[store_index] = nums[store_index], nums[right]  
-
-            if store_index == index:
-                return nums[store_index]
-            elif store_index > index:
-                return quickselect(left, store_index - 1, index)
-            else:
-                return quickselect(store_index + 1, right, index)
-
-        return quickselect(0, len(nums) - 1, k - 1)
+        if "ks" in self.validated_data:
+            return kth_largest_many(nums, ks)
+        return kth_largest(nums, ks[0])
 
 
 class LongestIncreasingPathSerializer(serializers.Serializer):
-    matrix = serializers.ListField(
-        child=serializers.ListField(
-            child=serializers.IntegerField(),
-            allow_empty=False
-        ),
-        allow_empty=False
+    matrix = IntegerMatrixField(allow_empty=False)
+    return_path = serializers.BooleanField(
+        default=False,
+        help_text="Also return the (row, column) coordinates of one longest path."
+    )
+    return_lengths = serializers.BooleanField(
+        default=False,
+        help_text="Also return the length of the longest path starting at each cell."
     )
-
-    def validate_matrix(self, value):
-        """
-        Validates that the matrix is non-empty and rectangular.
-        """
-        if not value or not all(isinstance(row, list) for row in value):
-            raise serializers.ValidationError("Matrix must be a non-empty 2D list.")
-
-        row_length = len(value[0])
-        if any(len(row) != row_length for row in value):
-            raise serializers.ValidationError("All rows must have the same number of columns.")
-
-        return value
 
     def find_longest_path(self):
         """
-        Computes the longest increasing path in a matrix using DFS + memoization.
+        Computes the longest increasing path in a matrix with `leetcode.paths`.
+
+        Cells are resolved iteratively in topological order (no recursion), with
+        NumPy layer peeling for large matrices. With `return_path` or
+        `return_lengths`, returns a mapping holding the length and the requested
+        path and per-cell lengths, both read from the same length table.
         """
         matrix = self.validated_data["matrix"]
-        if not matrix:
-            return 0
-
-        rows, cols = len(matrix), len(matrix[0])
-        memo = [[-1] * cols for _ in range(rows)]
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-        def dfs(r, c):
-            if memo[r][c] != -1:
-                return memo[r][c]
-
-            max_length = 1
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols and matrix[nr][nc] > matrix[r][c]:
-                    max_length = max(max_length, 1 + dfs(nr, nc))
-
-            memo[r][c] = max_length
-            return max_length
-
-        return max(dfs(r, c) for r in range(rows) for c in range(cols))
-    
\ No newline at end of file
+        if not (self.validated_data["return_path"] or self.validated_data["return_lengths"]):
+            return longest_increasing_path(matrix)
+
+        lengths = np.asarray(path_lengths(matrix), dtype=np.int64)
+        result = {"length": int(lengths.max())}
+        if self.validated_data["return_path"]:
+            result["path"] = trace_path(matrix, lengths)
+        if self.validated_data["return_lengths"]:
+            result["lengths"] = lengths
+        return result
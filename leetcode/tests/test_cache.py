@@ -0,0 +1,112 @@
+import numpy as np
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from leetcode.cache import ResultCache, fingerprint, get_result_cache
+
+
+class ResultCacheTestCase(SimpleTestCase):
+    """Test cases for the LRU result cache."""
+
+    def test_hit_and_miss(self):
+        """Test that identical inputs are computed once and counted."""
+        cache = ResultCache()
+        calls = []
+        compute = lambda: calls.append(1) or 42
+        self.assertEqual(cache.get_or_compute("kth", {"nums": [1, 2], "k": 1}, compute), (42, False))
+        self.assertEqual(cache.get_or_compute("kth", {"k": 1, "nums": [1, 2]}, compute), (42, True))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats(), {
+            "hits": 1, "misses": 1, "entries": 1, "max_entries": 1024, "total_size": 1, "max_total_size": 1_000_000,
+        })
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        for value in (1, 2):
+            cache.get_or_compute("ns", value, lambda value=value: value)
+        cache.get_or_compute("ns", 1, lambda: None)
+        cache.get_or_compute("ns", 3, lambda: 3)
+        self.assertTrue(cache.get_or_compute("ns", 1, lambda: None)[1])
+        self.assertFalse(cache.get_or_compute("ns", 2, lambda: 2)[1])
+
+    def test_eviction_by_total_size(self):
+        """Test that least recently used entries are evicted once the items they hold exceed the bound."""
+        cache = ResultCache(max_total_size=10)
+        cache.get_or_compute("ns", 1, lambda: [0] * 4)
+        cache.get_or_compute("ns", 2, lambda: [0] * 4)
+        cache.get_or_compute("ns", 1, lambda: None)
+        cache.get_or_compute("ns", 3, lambda: np.zeros(4))
+        self.assertEqual(cache.stats()["total_size"], 8)
+        self.assertTrue(cache.get_or_compute("ns", 1, lambda: None)[1])
+        self.assertFalse(cache.get_or_compute("ns", 2, lambda: [0] * 4)[1])
+
+    def test_large_results_not_cached(self):
+        """Test that results above the size bound are not stored."""
+        cache = ResultCache(max_result_size=3)
+        cache.get_or_compute("ns", [1, 2, 3, 4], lambda: [4, 3, 2, 1])
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_errors_not_cached(self):
+        """Test that a failing computation stores nothing."""
+        cache = ResultCache()
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("ns", 1, lambda: int("x"))
+        self.assertEqual(cache.get_or_compute("ns", 1, lambda: 5), (5, False))
+
+    def test_shared_backend(self):
+        """Test that results are shared through the configured Django cache."""
+        first, second = ResultCache(cache_alias="default"), ResultCache(cache_alias="default")
+        first.get_or_compute("ns", [7, 8], lambda: 15)
+        self.assertEqual(second.get_or_compute("ns", [7, 8], lambda: None), (15, True))
+        caches["default"].clear()
+
+    def test_fingerprint(self):
+        """Test that fingerprints depend on the endpoint, values, order and types."""
+        self.assertEqual(fingerprint("a", {"nums": [1, 2]}), fingerprint("a", {"nums": [1, 2]}))
+        self.assertNotEqual(fingerprint("a", [1, 2]), fingerprint("b", [1, 2]))
+        self.assertNotEqual(fingerprint("a", [1, 2]), fingerprint("a", [2, 1]))
+        self.assertNotEqual(fingerprint("a", [[1, 2], [3]]), fingerprint("a", [[1], [2, 3]]))
+        self.assertNotEqual(fingerprint("a", np.array([1, 2])), fingerprint("a", np.array([[1, 2]])))
+        self.assertNotEqual(fingerprint("a", [2 ** 70]), fingerprint("a", [2 ** 70 + 1]))
+
+
+@override_settings(LEETCODE_RESULT_CACHE={"MAX_ENTRIES": 8, "MAX_RESULT_SIZE": 100, "MAX_TOTAL_SIZE": 1000, "CACHE_ALIAS": None, "TIMEOUT": 60})
+class ResultCacheViewTestCase(APITestCase):
+    """Test cases for the result cache on the leetcode endpoints."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        get_result_cache().clear()
+
+    def test_repeated_requests_hit(self):
+        """Test that resubmitting an identical input is served from the cache."""
+        cases = [
+            ("rotate-array", {"nums": [1, 2, 3], "k": 1}, [3, 1, 2]),
+            ("kth-largest", {"nums": [3, 2, 1, 5], "k": 2}, 3),
+            ("longest-increasing-path", {"matrix": [[1, 2], [4, 3]]}, 4),
+        ]
+        for name, data, expected in cases:
+            for cache_status in ("miss", "hit"):
+                response = self.client.post(reverse(name), data, format="json")
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data["result"], expected)
+                self.assertEqual(response["X-Result-Cache"], cache_status)
+        self.assertEqual(get_result_cache().stats()["hits"], 3)
+
+    def test_equivalent_rotation_hits(self):
+        """Test that inputs that validate to the same data share a cache entry."""
+        self.client.post(reverse("rotate-array"), {"nums": [1, 2, 3], "k": 1}, format="json")
+        response = self.client.post(reverse("rotate-array"), {"nums": [1, 2, 3], "k": 4}, format="json")
+        self.assertEqual(response["X-Result-Cache"], "hit")
+        self.assertEqual(response.data["result"], [3, 1, 2])
+
+    def test_errors_are_recomputed(self):
+        """Test that invalid requests are not cached."""
+        for _ in range(2):
+            response = self.client.post(reverse("kth-largest"), {"nums": [1], "k": 2}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_result_cache().stats()["hits"], 0)
@@ -0,0 +1,87 @@
+import json
+
+import numpy as np
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from leetcode.fields import IntegerArrayField, IntegerMatrixField
+
+
+class ArraySerializer(serializers.Serializer):
+    nums = IntegerArrayField(child=serializers.IntegerField(min_value=-5), allow_empty=False)
+
+
+class ListSerializer(serializers.Serializer):
+    nums = serializers.ListField(child=serializers.IntegerField(min_value=-5), allow_empty=False)
+
+
+class MatrixSerializer(serializers.Serializer):
+    matrix = IntegerMatrixField(allow_empty=False)
+
+
+class NestedListSerializer(serializers.Serializer):
+    matrix = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField(), allow_empty=False),
+        allow_empty=False,
+    )
+
+    def validate_matrix(self, value):
+        if len(set(map(len, value))) > 1:
+            raise serializers.ValidationError("All rows must have the same number of columns.")
+        return value
+
+
+class IntegerArrayFieldTestCase(SimpleTestCase):
+    """Test cases for the vectorized integer array fields."""
+
+    def test_array_result(self):
+        """Test that plain ints are returned as an int64 array."""
+        serializer = ArraySerializer(data={"nums": [3, -5, 2 ** 62]})
+        self.assertTrue(serializer.is_valid())
+        nums = serializer.validated_data["nums"]
+        self.assertEqual(nums.dtype, np.int64)
+        self.assertEqual(nums.tolist(), [3, -5, 2 ** 62])
+
+    def test_coerced_values(self):
+        """Test that values IntegerField coerces (strings, integral floats) are accepted."""
+        serializer = ArraySerializer(data={"nums": ["3", 4.0, 5]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["nums"].tolist(), [3, 4, 5])
+
+    def test_values_outside_int64(self):
+        """Test that values outside int64 are kept as a list of ints."""
+        serializer = ArraySerializer(data={"nums": [1, 2 ** 70]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["nums"], [1, 2 ** 70])
+
+    def test_errors_match_list_field(self):
+        """Test that invalid inputs give the same errors as ListField(child=IntegerField())."""
+        for nums in ([], "1,2", {"a": 1}, 5, [1, "x"], [1, True], [1, 2.5], [None], [-6, 1], [[1]], ["9" * 1001]):
+            serializer, expected = ArraySerializer(data={"nums": nums}), ListSerializer(data={"nums": nums})
+            self.assertFalse(serializer.is_valid(), nums)
+            self.assertFalse(expected.is_valid())
+            self.assertEqual(serializer.errors, expected.errors, nums)
+
+    def test_matrix_result(self):
+        """Test that rectangular matrices are returned as a 2D int64 array."""
+        serializer = MatrixSerializer(data={"matrix": [[1, 2], [3, "4"]]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["matrix"].shape, (2, 2))
+        self.assertEqual(serializer.validated_data["matrix"].tolist(), [[1, 2], [3, 4]])
+
+        serializer = MatrixSerializer(data={"matrix": [[1, 2 ** 70]]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["matrix"], [[1, 2 ** 70]])
+
+    def test_matrix_errors_match_list_field(self):
+        """Test that invalid matrices give the same error bodies as nested ListFields."""
+        for matrix in ([], [[]], [1, 2], [[1], []], [[1, 2], [3]], [[1, "x"], [2]], [[1], "12"], [[1, None]]):
+            serializer, expected = MatrixSerializer(data={"matrix": matrix}), NestedListSerializer(data={"matrix": matrix})
+            self.assertFalse(serializer.is_valid(), matrix)
+            self.assertFalse(expected.is_valid())
+            self.assertEqual(json.loads(json.dumps(serializer.errors)), json.loads(json.dumps(expected.errors)), matrix)
+
+    def test_representation(self):
+        """Test that arrays are represented as lists."""
+        self.assertEqual(IntegerArrayField().to_representation(np.array([1, 2])), [1, 2])
+        self.assertEqual(IntegerMatrixField().to_representation(np.array([[1], [2]])), [[1], [2]])
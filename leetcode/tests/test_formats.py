@@ -0,0 +1,90 @@
+import msgpack
+import numpy as np
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from leetcode.cache import get_result_cache
+from leetcode.formats import decode_npy, encode_npy
+
+
+class BinaryFormatsTestCase(APITestCase):
+    """Test cases for the binary request and response formats of the leetcode endpoints."""
+
+    def setUp(self):
+        """Start every test with an empty result cache."""
+        get_result_cache().clear()
+
+    def post(self, name, body, content_type, query="", **headers):
+        """Helper method posting a raw body."""
+        return self.client.generic("POST", f"{reverse(name)}{query}", body, content_type=content_type, **headers)
+
+    def test_npy_round_trip(self):
+        """Test sending and receiving `.npy` arrays."""
+        nums = np.array([1, 2, 3, 4, 5, 6, 7], dtype=np.int32)
+        response = self.post("rotate-array", encode_npy(nums), "application/x-npy", "?k=3", HTTP_ACCEPT="application/x-npy")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-npy")
+        self.assertEqual(decode_npy(response.content).tolist(), [5, 6, 7, 1, 2, 3, 4])
+
+        matrix = np.array([[9, 9, 4], [6, 6, 8], [2, 1, 1]])
+        response = self.post("longest-increasing-path", encode_npy(matrix), "application/x-npy", HTTP_ACCEPT="application/x-npy")
+        self.assertEqual(decode_npy(response.content).item(), 4)
+
+    def test_int64_round_trip(self):
+        """Test raw int64 bodies, with query arguments and a `columns` parameter for matrices."""
+        nums = np.array([3, 2, 1, 5, 6, 4], dtype="<i8").tobytes()
+        response = self.post("kth-largest", nums, "application/x-int64", "?k=2")
+        self.assertEqual(response.data["result"], 5)
+        response = self.post("kth-largest", nums, "application/x-int64", "?ks=1&ks=6")
+        self.assertEqual(response.json()["result"], {"1": 6, "6": 1})
+
+        matrix = np.array([[9, 9, 4], [6, 6, 8], [2, 1, 1]], dtype="<i8").tobytes()
+        response = self.post(
+            "longest-increasing-path", matrix, "application/x-int64; columns=3", "?return_lengths=true",
+            HTTP_ACCEPT="application/x-int64",
+        )
+        # Mappings are not arrays, so they are returned as JSON.
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["result"]["lengths"], [[1, 1, 2], [2, 2, 1], [3, 4, 2]])
+
+        response = self.post("rotate-array", nums, "application/x-int64", "?k=1", HTTP_ACCEPT="application/x-int64")
+        self.assertEqual(np.frombuffer(response.content, dtype="<i8").tolist(), [4, 3, 2, 1, 5, 6])
+
+    def test_msgpack_round_trip(self):
+        """Test MessagePack bodies, with arrays as lists or as `.npy` bin values."""
+        for nums in ([3, 2, 1, 5, 6, 4], encode_npy(np.array([3, 2, 1, 5, 6, 4]))):
+            body = msgpack.packb({"nums": nums, "k": 2})
+            response = self.post("kth-largest", body, "application/msgpack", HTTP_ACCEPT="application/msgpack")
+            self.assertEqual(response["Content-Type"], "application/msgpack")
+            self.assertEqual(msgpack.unpackb(response.content), {"result": 5})
+
+        body = msgpack.packb({"matrix": [[1, 2]], "return_path": True})
+        response = self.post("longest-increasing-path", body, "application/msgpack", HTTP_ACCEPT="application/msgpack")
+        result = msgpack.unpackb(response.content)["result"]
+        self.assertEqual(decode_npy(result["path"]).tolist(), [[0, 0], [0, 1]])
+
+    def test_validation_errors(self):
+        """Test that invalid arrays get the same errors as JSON input, rendered as JSON."""
+        response = self.post("kth-largest", encode_npy(np.array([1.5, 2.0])), "application/x-npy", "?k=1", HTTP_ACCEPT="application/x-npy")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response["Content-Type"], "application/json")
+        expected = self.client.post(reverse("kth-largest"), {"nums": [1.5, 2.0], "k": 1}, format="json")
+        self.assertEqual(response.json(), expected.json())
+
+        response = self.post("kth-largest", encode_npy(np.array([1, 2])), "application/x-npy", "?k=3")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_malformed_bodies(self):
+        """Test that malformed binary bodies are rejected with 400."""
+        cases = [
+            ("application/x-npy", b"not an npy file"),
+            ("application/x-npy", encode_npy(np.arange(4))[:-1]),
+            ("application/x-int64", b"\x00" * 7),
+            ("application/x-int64; columns=4", b"\x00" * 24),
+            ("application/msgpack", b"\xc1"),
+            ("application/msgpack", msgpack.packb([1, 2])),
+        ]
+        for content_type, body in cases:
+            response = self.post("rotate-array", body, content_type, "?k=1")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, content_type)
@@ -0,0 +1,85 @@
+import random
+from functools import cache
+from itertools import pairwise
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from leetcode import paths
+from leetcode.paths import (
+    longest_increasing_path,
+    path_lengths,
+    path_lengths_numpy,
+    path_lengths_python,
+    trace_path,
+)
+
+
+def reference_lengths(matrix):
+    """Helper returning the path lengths computed with the recursive DFS the engine replaces."""
+    rows, cols = len(matrix), len(matrix[0])
+
+    @cache
+    def dfs(r, c):
+        best = 1
+        for nr, nc in ((r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)):
+            if 0 <= nr < rows and 0 <= nc < cols and matrix[nr][nc] > matrix[r][c]:
+                best = max(best, 1 + dfs(nr, nc))
+        return best
+
+    return [[dfs(r, c) for c in range(cols)] for r in range(rows)]
+
+
+def snake(rows, cols):
+    """Helper returning a matrix whose values increase along a single snake-shaped path."""
+    matrix = np.arange(rows * cols).reshape(rows, cols)
+    matrix[1::2] = matrix[1::2, ::-1]
+    return matrix
+
+
+class LongestIncreasingPathEngineTestCase(SimpleTestCase):
+    """Test cases for the iterative longest increasing path engine."""
+
+    def random_matrices(self, count):
+        rng = random.Random(0)
+        for _ in range(count):
+            rows, cols = rng.randint(1, 40), rng.randint(1, 40)
+            high = rng.choice([1, 3, 1000])
+            yield [[rng.randint(0, high) for _ in range(cols)] for _ in range(rows)]
+
+    def test_engines_match_reference(self):
+        """Test the Python and NumPy engines against the recursive DFS."""
+        for matrix in self.random_matrices(100):
+            expected = reference_lengths(matrix)
+            self.assertEqual(path_lengths_python(matrix), expected)
+            self.assertEqual(path_lengths_numpy(np.array(matrix)).tolist(), expected)
+
+    def test_sparse_layers_match_reference(self):
+        """Test peeling every layer as cell indexes rather than whole-matrix masks."""
+        with mock.patch.object(paths, "DENSE_LAYER", 10 ** 9), mock.patch.object(paths, "NARROW_LAYER", 1):
+            for matrix in self.random_matrices(50):
+                self.assertEqual(path_lengths_numpy(np.array(matrix)).tolist(), reference_lengths(matrix))
+
+    def test_long_chains_without_recursion(self):
+        """Test a snake-shaped matrix whose path is far longer than the recursion limit."""
+        matrix = snake(300, 300)
+        self.assertEqual(longest_increasing_path(matrix), 90_000)
+        self.assertEqual(longest_increasing_path(matrix.tolist()), 90_000)
+        self.assertEqual(int(path_lengths(matrix)[-1, 0]), 1)
+
+    def test_values_outside_int64(self):
+        """Test lists of ints that NumPy cannot hold."""
+        self.assertEqual(longest_increasing_path([[2 ** 70, 2 ** 70 + 1], [0, 2 ** 71]]), 4)
+
+    def test_trace_path(self):
+        """Test that the traced path is strictly increasing, adjacent and of maximal length."""
+        matrices = list(self.random_matrices(50)) + [snake(30, 40), [[2 ** 70, 2 ** 70 + 1], [0, 2 ** 71]]]
+        for matrix in matrices:
+            lengths = path_lengths(matrix)
+            path = trace_path(matrix, lengths).tolist()
+            self.assertEqual(len(path), int(np.max(lengths)))
+            for (r1, c1), (r2, c2) in pairwise(path):
+                self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+                self.assertLess(matrix[r1][c1], matrix[r2][c2])
+
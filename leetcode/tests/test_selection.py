@@ -0,0 +1,77 @@
+import random
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from leetcode import selection
+from leetcode.selection import (
+    kth_largest,
+    kth_largest_many,
+    select,
+    select_many,
+    select_many_python,
+    select_python,
+)
+
+
+class SelectionTestCase(SimpleTestCase):
+    """Test cases for the selection engine behind kth-largest."""
+
+    def test_matches_sorting(self):
+        """Test every backend against sorting on random inputs with many duplicates."""
+        rng = random.Random(0)
+        for size in (1, 2, 5, 17, 100, 600, 3000):
+            values = [rng.randint(-20, 20) for _ in range(size)]
+            ordered = sorted(values)
+            for index in {0, size // 2, size - 1, rng.randrange(size)}:
+                self.assertEqual(select(values, index), ordered[index])
+                self.assertEqual(select_python(values, index), ordered[index])
+                self.assertEqual(select(np.array(values), index), ordered[index])
+
+    def test_select_many_matches_sorting(self):
+        """Test multi-select against sorting, with unsorted and repeated indexes."""
+        rng = random.Random(1)
+        for size in (1, 10, 100, 600, 3000):
+            values = [rng.randint(-50, 50) for _ in range(size)]
+            ordered = sorted(values)
+            indexes = [rng.randrange(size) for _ in range(6)] + [0, size - 1, 0]
+            expected = [ordered[index] for index in indexes]
+            self.assertEqual(select_many(values, indexes), expected)
+            self.assertEqual(select_many(np.array(values), indexes), expected)
+            found = select_many_python(values, sorted(set(indexes)))
+            self.assertEqual([found[index] for index in indexes], expected)
+
+    def test_kth_largest_many(self):
+        """Test the mapping of k to the k-th largest value."""
+        self.assertEqual(kth_largest_many([3, 2, 1, 5, 6, 4], [2, 1, 6]), {2: 5, 1: 6, 6: 1})
+        self.assertEqual(kth_largest_many([2 ** 80 + i for i in range(1000)], [1, 1000]), {1: 2 ** 80 + 999, 1000: 2 ** 80})
+
+    def test_input_not_modified(self):
+        """Test that selection leaves the input untouched."""
+        values = [5, 3, 9, 1] * 200
+        kth_largest(values, 3)
+        self.assertEqual(values, [5, 3, 9, 1] * 200)
+
+    def test_all_duplicates(self):
+        """Test a large input of equal values, which used to exhaust the recursion limit."""
+        self.assertEqual(select_python([7] * 200_000, 123_456), 7)
+
+    def test_big_integers_fall_back_to_python(self):
+        """Test values outside int64, which NumPy cannot hold."""
+        values = [2 ** 80 + i for i in range(1000)]
+        self.assertEqual(kth_largest(values, 1), 2 ** 80 + 999)
+
+    def test_median_of_medians_fallback(self):
+        """Test that the worst-case pivots switch to median-of-medians and stay correct."""
+        with mock.patch.object(selection._random, "choice", max), \
+                mock.patch.object(selection, "median_of_medians", wraps=selection.median_of_medians) as mom:
+            self.assertEqual(select_python(list(range(10_000)), 4_321), 4_321)
+        self.assertTrue(mom.called)
+
+    def test_index_out_of_range(self):
+        """Test that an invalid index raises IndexError."""
+        with self.assertRaises(IndexError):
+            select([1, 2, 3], 3)
+        with self.assertRaises(IndexError):
+            select_many([1, 2, 3], [0, -1])
@@ -112,6 +112,27 @@ class KthLargestViewTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_multiple_ks(self):
+        """Test finding several order statistics in one request."""
+        data = {"nums": [3, 2, 1, 5, 6, 4], "ks": [1, 2, 6, 2]}
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"], {"1": 6, "2": 5, "6": 1})
+
+    def test_ks_greater_than_length(self):
+        """Test when one of the ks is larger than the array length."""
+        data = {"nums": [3, 1, 2], "ks": [1, 4]}
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_k_and_ks_exclusive(self):
+        """Test that exactly one of k and ks must be given."""
+        for data in ({"nums": [3, 1, 2]}, {"nums": [3, 1, 2], "k": 1, "ks": [1]}):
+            response = self.client.post(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class LongestIncreasingPathViewTestCase(APITestCase):
     def setUp(self):
@@ -178,3 +199,23 @@ class LongestIncreasingPathViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["result"], 4)
 
+    def test_long_path(self):
+        """Test a snake-shaped matrix whose path is longer than the recursion limit."""
+        matrix = [list(range(row * 100, (row + 1) * 100))[::1 if row % 2 == 0 else -1] for row in range(100)]
+        response = self.client.post(self.url, {"matrix": matrix}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["result"], 10_000)
+
+    def test_return_path_and_lengths(self):
+        """Test returning one longest path and the per-cell lengths with the length."""
+        data = {"matrix": [[9, 9, 4], [6, 6, 8], [2, 1, 1]], "return_path": True, "return_lengths": True}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"], {
+            "length": 4,
+            "path": [[2, 1], [2, 0], [1, 0], [0, 0]],
+            "lengths": [[1, 1, 2], [2, 2, 1], [3, 4, 2]],
+        })
+
+        response = self.client.post(self.url, {"matrix": [[3, 1]], "return_path": True}, format="json")
+        self.assertEqual(response.json()["result"], {"length": 2, "path": [[0, 1], [0, 0]]})
@@ -1,14 +1,18 @@
 from rest_framework import generics
 from rest_framework.response import Response
+from .cache import get_result_cache
+from .formats import ArrayFormatsMixin
 from .serializers import RotateArraySerializer, KthLargestSerializer, LongestIncreasingPathSerializer
 
 
-class RotateArrayView(generics.CreateAPIView):
+class RotateArrayView(ArrayFormatsMixin, generics.CreateAPIView):
     """
     API endpoint that rotates an array to the right by `k` positions.
 
     - **Input**: JSON with `nums` (list of integers) and `k` (integer).
     - **Output**: JSON with rotated array.
+    - Identical requests are answered from the result cache (`X-Result-Cache: hit`).
+    - Also accepts and returns `.npy`, raw int64 and MessagePack bodies (see `leetcode.formats`).
     - **Example**:
       ```json
       {
@@ -25,21 +29,28 @@ class RotateArrayView(generics.CreateAPIView):
     """
 
     serializer_class = RotateArraySerializer
+    array_field = "nums"
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            result = serializer.rotate()
-            return Response({"result": result})
+            result, cached = get_result_cache().get_or_compute(
+                "rotate-array", serializer.validated_data, serializer.rotate
+            )
+            return Response({"result": result}, headers={"X-Result-Cache": "hit" if cached else "miss"})
         return Response(serializer.errors, status=400)
 
 
-class KthLargestView(generics.CreateAPIView):
+class KthLargestView(ArrayFormatsMixin, generics.CreateAPIView):
     """
     API endpoint that finds the k-th largest element in an unsorted array.
 
-    - **Input**: JSON with `nums` (list of integers) and `k` (integer).
-    - **Output**: JSON with the k-th largest element.
+    - **Input**: JSON with `nums` (list of integers) and `k` (integer), or `ks`
+      (list of integers) to find several order statistics in one pass.
+    - **Output**: JSON with the k-th largest element, or a mapping of each k to
+      its element when `ks` is given.
+    - Identical requests are answered from the result cache (`X-Result-Cache: hit`).
+    - Also accepts and returns `.npy`, raw int64 and MessagePack bodies (see `leetcode.formats`).
     - **Example**:
       ```json
       {
@@ -53,24 +64,46 @@ class KthLargestView(generics.CreateAPIView):
         "result": 5
       }
       ```
+    - **Example** with `ks`:
+      ```json
+      {
+        "nums": [3, 2, 1, 5, 6, 4],
+        "ks": [1, 2, 6]
+      }
+      ```
+      **Response**:
+      ```json
+      {
+        "result": {"1": 6, "2": 5, "6": 1}
+      }
+      ```
     """
 
     serializer_class = KthLargestSerializer
+    array_field = "nums"
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            result = serializer.find_kth_largest()
-            return Response({"result": result})
+            result, cached = get_result_cache().get_or_compute(
+                "kth-largest", serializer.validated_data, serializer.find_kth_largest
+            )
+            return Response({"result": result}, headers={"X-Result-Cache": "hit" if cached else "miss"})
         return Response(serializer.errors, status=400)
 
 
-class LongestIncreasingPathView(generics.CreateAPIView):
+class LongestIncreasingPathView(ArrayFormatsMixin, generics.CreateAPIView):
     """
     API endpoint that finds the longest increasing path in a 2D matrix.
 
-    - **Input**: JSON with a 2D matrix of integers.
-    - **Output**: JSON with the length of the longest increasing path.
+    - **Input**: JSON with a 2D matrix of integers, and optionally `return_path`
+      and `return_lengths` (booleans).
+    - **Output**: JSON with the length of the longest increasing path. With
+      `return_path` or `return_lengths`, `result` is an object holding the
+      `length`, the `path` as (row, column) pairs from its smallest value to
+      its largest, and/or the per-cell `lengths`.
+    - Identical requests are answered from the result cache (`X-Result-Cache: hit`).
+    - Also accepts and returns `.npy`, raw int64 and MessagePack bodies (see `leetcode.formats`).
     - **Example**:
       ```json
       {
@@ -87,14 +120,23 @@ class LongestIncreasingPathView(generics.CreateAPIView):
         "result": 4
       }
       ```
+      With `"return_path": true`:
+      ```json
+      {
+        "result": {"length": 4, "path": [[2, 1], [2, 0], [1, 0], [0, 0]]}
+      }
+      ```
     """
 
     serializer_class = LongestIncreasingPathSerializer
+    array_field = "matrix"
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            result = serializer.find_longest_path()
-            return Response({"result": result})
+            result, cached = get_result_cache().get_or_compute(
+                "longest-increasing-path", serializer.validated_data, serializer.find_longest_path
+            )
+            return Response({"result": result}, headers={"X-Result-Cache": "hit" if cached else "miss"})
         return Response(serializer.errors, status=400)
     
\ No newline at end of file
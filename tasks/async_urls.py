@@ -0,0 +1,15 @@
+from django.urls import path
+
+from .async_views import (
+    AsyncNearestDeadlineTaskView,
+    AsyncTaskDetailView,
+    AsyncTaskListCreateView,
+)
+
+# Async replacements of routes in `tasks.urls`, served under ASGI; routes not
+# listed here fall through to the synchronous views.
+urlpatterns = [
+    path("tasks", AsyncTaskListCreateView.as_view(), name="task-list"),
+    path("tasks/<int:pk>", AsyncTaskDetailView.as_view(), name="task-detail"),
+    path("tasks/nearest-deadline", AsyncNearestDeadlineTaskView.as_view(), name="nearest-deadline"),
+]
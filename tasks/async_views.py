@@ -0,0 +1,214 @@
+"""
+Native async versions of the task list, detail and nearest-deadline endpoints.
+
+Under ASGI, `todolist.asgi_urls` serves these views in place of the DRF
+generics in `tasks.views`, so a single worker can wait on many slow clients
+without holding a thread per connection:
+- reads go through Django's async ORM;
+- writes, including the image processing they trigger, run in worker
+  threads (`run_in_worker`), off the event loop.
+
+Validation, serialization and responses are shared with the synchronous views,
+so both return the same bodies and status codes.
+"""
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.request import Request
+
+from todolist.parsers import FastJSONParser
+from todolist.renderers import FastJSONRenderer
+
+from .cache import aget_nearest_deadline_task, aget_task_version
+from .conditional import (
+    needs_last_modified,
+    not_modified_response,
+    set_conditional_headers,
+    task_etag,
+)
+from .filters import TaskDeadlineFilter
+from .models import Task
+from .pagination import TaskCursorPagination
+from .serializers import TaskRowSerializer, TaskSerializer
+from .views import JSONArrayChunks, TaskListCreateView
+
+
+async def run_in_worker(func, *args, **kwargs):
+    """
+    Runs blocking request work (database writes, image processing) in a thread from async code.
+
+    The work runs on the event loop's thread pool, not on the photo worker
+    pool, so it never queues behind background photo jobs. The event loop
+    keeps serving other requests meanwhile. Returns the result of `func`, or
+    raises its exception.
+    """
+    return await sync_to_async(_run_request, thread_sensitive=False)(func, *args, **kwargs)
+
+
+def _run_request(func, *args, **kwargs):
+    """
+    Request thread entry point; like a request, only closes database
+    connections past `CONN_MAX_AGE` or unusable, so the others are reused.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncTaskView(View):
+    """
+    Base class of the async task views.
+
+    Wraps the request for DRF parsing, renders JSON like DRF does, turns DRF
+    and 404 exceptions into the same error responses, and answers conditional
+    GET requests (`ETag` / `Last-Modified`) before any query runs.
+    """
+
+    parser_classes = (FastJSONParser, FormParser, MultiPartParser)
+    renderer = FastJSONRenderer()
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.drf_request = Request(request, parsers=[parser() for parser in self.parser_classes])
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except Http404 as exc:
+            return self.render({"detail": str(exc)}, status.HTTP_404_NOT_FOUND)
+        except ValidationError as exc:
+            return self.render(exc.detail, exc.status_code)
+        except APIException as exc:
+            return self.render({"detail": exc.detail}, exc.status_code)
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        """Returns `data` rendered as a JSON response."""
+        return HttpResponse(self.renderer.render(data), status=status_code, content_type="application/json")
+
+    async def get(self, request, *args, **kwargs):
+        """Answer conditional requests from the change version before doing any work."""
+        self.task_version = await aget_task_version()
+        etag = task_etag(request, self.task_version[0])
+        last_modified = await self.get_last_modified() if needs_last_modified(request) else None
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = await self.read(*args, **kwargs)
+        if response.status_code == 200:
+            set_conditional_headers(response, etag, await self.get_last_modified())
+        return response
+
+    async def get_last_modified(self):
+        """Returns when the requested resource last changed; defaults to the last write to any task."""
+        return self.task_version[1]
+
+    async def read(self, *args, **kwargs):
+        """Returns the response to a GET request."""
+        raise NotImplementedError
+
+
+class AsyncTaskListCreateView(AsyncTaskView):
+    """
+    Async version of `TaskListCreateView`, with the same parameters and responses.
+    """
+
+    stream_chunk_size = TaskListCreateView.stream_chunk_size
+
+    async def read(self):
+        """List tasks: plain, paginated or streamed, restricted to `fields` when given."""
+        serializer = TaskRowSerializer.from_request(self.drf_request)
+        filter_backend = TaskDeadlineFilter()
+        queryset = filter_backend.filter_queryset(self.drf_request, Task.objects.all(), self)
+        queryset = serializer.select(queryset, *TaskListCreateView.row_key_fields)
+
+        limit = filter_backend.get_limit(self.drf_request)
+        if self.drf_request.query_params.get("stream") in ("true", "1"):
+            return StreamingHttpResponse(self.stream(queryset[:limit], serializer), content_type="application/json")
+
+        paginator = TaskCursorPagination()
+        page = await sync_to_async(paginator.paginate_queryset)(queryset, self.drf_request, view=self)
+        if page is not None:
+            results = [serializer.to_representation(row) for row in page]
+            return self.render(paginator.get_paginated_response(results).data)
+        return self.render([serializer.to_representation(row) async for row in queryset[:limit]])
+
+    async def stream(self, queryset, serializer):
+        """Yields the JSON array chunk by chunk, like `TaskListCreateView.stream_list`."""
+        chunks = JSONArrayChunks(serializer, self.stream_chunk_size)
+        async for row in queryset.aiterator(chunk_size=self.stream_chunk_size):
+            chunk = chunks.add(row)
+            if chunk is not None:
+                yield chunk
+        yield chunks.close()
+
+    async def post(self, request):
+        """Create a task; validation, saving and photo processing run in a worker thread."""
+        return self.render(await run_in_worker(self.create), status.HTTP_201_CREATED)
+
+    def create(self):
+        serializer = TaskSerializer(data=self.drf_request.data, context={"request": self.drf_request})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return serializer.data
+
+
+class AsyncTaskDetailView(AsyncTaskView):
+    """
+    Async version of `TaskDetailUpdateDeleteView`, with the same responses.
+    """
+
+    async def read(self, pk):
+        """Retrieve a task."""
+        serializer = TaskRowSerializer(request=self.drf_request)
+        row = await serializer.select(Task.objects.filter(pk=pk)).afirst()
+        if row is None:
+            raise NotFound(f"No {Task._meta.object_name} matches the given query.")
+        return self.render(serializer.to_representation(row))
+
+    async def get_last_modified(self):
+        """Returns when the requested task was last updated."""
+        return await Task.objects.filter(pk=self.kwargs["pk"]).values_list("updated_at", flat=True).afirst()
+
+    async def put(self, request, pk):
+        """Fully update a task in a worker thread."""
+        return self.render(await run_in_worker(self.update, pk, partial=False))
+
+    async def patch(self, request, pk):
+        """Partially update a task in a worker thread."""
+        return self.render(await run_in_worker(self.update, pk, partial=True))
+
+    async def delete(self, request, pk):
+        """Delete a task in a worker thread."""
+        await run_in_worker(self.destroy, pk)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+    def update(self, pk, partial):
+        task = get_object_or_404(Task, pk=pk)
+        serializer = TaskSerializer(task, data=self.drf_request.data, partial=partial, context={"request": self.drf_request})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return serializer.data
+
+    def destroy(self, pk):
+        get_object_or_404(Task, pk=pk).delete()
+
+
+class AsyncNearestDeadlineTaskView(AsyncTaskView):
+    """
+    Async version of `NearestDeadlineTaskView`, with the same responses.
+    """
+
+    async def read(self):
+        """Return the cached nearest task, or 404 if no tasks are found."""
+        task = await aget_nearest_deadline_task()
+        if task is None:
+            return self.render({"detail": "No tasks with a due date found."}, status.HTTP_404_NOT_FOUND)
+        return self.render(TaskSerializer([task], many=True, context={"request": self.drf_request}).data)
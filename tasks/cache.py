@@ -0,0 +1,131 @@
+"""
+Caches for hot task reads.
+
+Every write to tasks calls `invalidate_task_caches`: model signals cover
+regular saves and deletes, and code paths that bypass signals (bulk queries,
+photo processing updates) call it directly.
+
+The nearest-deadline task is cached in-process. Entries also expire after
+`TASK_NEAREST_DEADLINE_CACHE_TTL` seconds, which bounds staleness caused by
+writes made in other processes.
+
+The task change version behind the ETag and Last-Modified headers of the task
+endpoints is not cached: it is read from the `TaskVersion` row, which database
+triggers bump on every write, so it is exact across processes and stays the
+same for as long as the tasks do.
+"""
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .models import Task, TaskVersion
+
+_lock = threading.Lock()
+_generation = 0
+_nearest_deadline = None
+
+
+def invalidate_task_caches():
+    """
+    Drops every cached task read.
+    """
+    global _generation, _nearest_deadline
+    with _lock:
+        _generation += 1
+        _nearest_deadline = None
+
+
+def get_task_version():
+    """
+    Returns the current change version of the tasks as (token, last write time).
+
+    On SQLite this is a primary-key lookup of the `TaskVersion` row. Until the
+    first write creates that row, and on other databases, which have no
+    triggers maintaining it, it falls back to an aggregate over tasks; there it
+    misses updates that bypass `updated_at`.
+    """
+    row = None
+    if connection.vendor == "sqlite":
+        row = TaskVersion.objects.values_list("version", "modified").filter(pk=1).first()
+    if row is None:
+        return _aggregate_task_version()
+    return f"{row[0]}:{row[1].isoformat()}", row[1]
+
+
+async def aget_task_version():
+    """
+    Async version of `get_task_version`, querying through the async ORM.
+    """
+    row = None
+    if connection.vendor == "sqlite":
+        row = await TaskVersion.objects.values_list("version", "modified").filter(pk=1).afirst()
+    if row is None:
+        return await sync_to_async(_aggregate_task_version)()
+    return f"{row[0]}:{row[1].isoformat()}", row[1]
+
+
+def _aggregate_task_version():
+    # Tokens carry three parts, so they never collide with those of the version row.
+    # Ids are not reused, so the number of tasks and the largest id change on every insert and delete.
+    stats = Task.objects.aggregate(count=Count("id"), last_id=Max("id"), modified=Max("updated_at"))
+    return f"{stats['count']}:{stats['last_id']}:{stats['modified']}", stats["modified"]
+
+
+def get_nearest_deadline_task():
+    """
+    Returns the task with the nearest upcoming due date, or None.
+
+    The lookup is a single query on the partial `due_date` index, and its
+    result is cached for the current day until the next write.
+    """
+    today = timezone.localdate()
+    hit, task, generation = _get_cached_nearest_deadline(today)
+    if hit:
+        return task
+    task = nearest_deadline_queryset(today).first()
+    _set_cached_nearest_deadline(today, task, generation)
+    return task
+
+
+async def aget_nearest_deadline_task():
+    """
+    Async version of `get_nearest_deadline_task`, querying through the async ORM.
+    """
+    today = timezone.localdate()
+    hit, task, generation = _get_cached_nearest_deadline(today)
+    if hit:
+        return task
+    task = await nearest_deadline_queryset(today).afirst()
+    _set_cached_nearest_deadline(today, task, generation)
+    return task
+
+
+def nearest_deadline_queryset(today):
+    """
+    Returns the tasks due on or after `today`, nearest due date first.
+    """
+    return Task.objects.filter(due_date__isnull=False, due_date__gte=today).order_by("due_date", "id")
+
+
+def _get_cached_nearest_deadline(today):
+    """
+    Returns whether a fresh entry for `today` is cached, the cached task and the current generation.
+    """
+    with _lock:
+        entry, generation = _nearest_deadline, _generation
+    if entry is not None and entry[0] == today and entry[2] > time.monotonic():
+        return True, entry[1], generation
+    return False, None, generation
+
+
+def _set_cached_nearest_deadline(today, task, generation):
+    global _nearest_deadline
+    with _lock:
+        # A write that raced with the query must not be hidden by its result.
+        if generation == _generation:
+            _nearest_deadline = (today, task, time.monotonic() + settings.TASK_NEAREST_DEADLINE_CACHE_TTL)
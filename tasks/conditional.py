@@ -0,0 +1,80 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_task_version
+
+
+def task_etag(request, token):
+    """
+    Returns the ETag of the current representation of the requested task resource.
+
+    It is derived from the task change version `token` and the exact request
+    (URL, host and accepted media type).
+    """
+    key = "\n".join([token, request.get_host(), request.get_full_path(), request.META.get("HTTP_ACCEPT", "")])
+    return quote_etag(hashlib.sha256(key.encode()).hexdigest())
+
+
+def needs_last_modified(request):
+    """
+    Returns whether answering the request's preconditions requires the last modification time.
+    """
+    return "HTTP_IF_MODIFIED_SINCE" in request.META and "HTTP_IF_NONE_MATCH" not in request.META
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """
+    Returns a `304 Not Modified` response if the request's preconditions hold, otherwise None.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified.timestamp()) if last_modified else None
+    )
+    if response is not None:
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+    return response
+
+
+def set_conditional_headers(response, etag, last_modified):
+    """
+    Adds the `ETag`, `Last-Modified` and `Vary` headers to a successful response.
+    """
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_vary_headers(response, ["Accept"])
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Adds strong `ETag` and `Last-Modified` headers to GET responses of task views.
+
+    A request carrying a matching `If-None-Match` is answered with
+    `304 Not Modified` after reading the change version only, without
+    querying the tasks or running the serializer.
+    """
+
+    def get_etag(self, request):
+        """Returns the ETag of the current representation of the requested resource."""
+        return task_etag(request, self.task_version[0])
+
+    def get_last_modified(self):
+        """Returns when the requested resource last changed; defaults to the last write to any task."""
+        return self.task_version[1]
+
+    def get(self, request, *args, **kwargs):
+        """Answer conditional requests from the change version before doing any work."""
+        self.task_version = get_task_version()
+        etag = self.get_etag(request)
+        last_modified = self.get_last_modified() if needs_last_modified(request) else None
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_conditional_headers(response, etag, self.get_last_modified())
+        return response
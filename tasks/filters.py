@@ -0,0 +1,121 @@
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .pagination import TaskCursorPagination
+
+
+class TaskDeadlineFilter(BaseFilterBackend):
+    """
+    Filters and orders the task list by due date.
+
+    - `due_after` / `due_before` (`YYYY-MM-DD`, inclusive): tasks due in a window.
+    - `overdue=true`: tasks due before today; `upcoming=true`: tasks due today or later.
+    - `ordering`: `id` or `due_date` (tasks with a due date by (due_date, id),
+      then tasks without one, by id), as in `TaskCursorPagination`.
+    - `limit`: return at most this many tasks (ignored when paginating).
+
+    Date filters only match tasks with a due date, so they are answered from
+    the partial `task_due_date_idx` index, which also yields rows in
+    (due_date, id) order without a separate sort.
+    """
+
+    ordering_param = TaskCursorPagination.ordering_query_param
+    orderings = TaskCursorPagination.orderings
+    limit_param = "limit"
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        bounds = {}
+        if "due_after" in params:
+            bounds["due_date__gte"] = self.get_date(params, "due_after")
+        if "due_before" in params:
+            bounds["due_date__lte"] = self.get_date(params, "due_before")
+        today = timezone.localdate()
+        if self.get_flag(params, "overdue"):
+            bounds["due_date__lt"] = today
+        if self.get_flag(params, "upcoming"):
+            bounds["due_date__gte"] = max(bounds.get("due_date__gte", today), today)
+        if bounds:
+            queryset = queryset.filter(due_date__isnull=False, **bounds)
+
+        ordering = params.get(self.ordering_param)
+        if ordering == "due_date" and bounds:
+            queryset = queryset.order_by("due_date", "id")
+        elif ordering == "due_date":
+            queryset = queryset.order_by(F("due_date").asc(nulls_last=True), "id")
+        elif ordering == "id":
+            queryset = queryset.order_by("id")
+        elif ordering is not None:
+            raise ValidationError({self.ordering_param: [f"Must be one of: {', '.join(self.orderings)}."]})
+        return queryset
+
+    def get_date(self, params, name):
+        """
+        Returns the date in a query parameter, raising a validation error for malformed dates.
+        """
+        try:
+            return serializers.DateField().run_validation(params[name])
+        except ValidationError as exc:
+            raise ValidationError({name: exc.detail})
+
+    def get_flag(self, params, name):
+        """
+        Returns whether a boolean query parameter is set.
+        """
+        return params.get(name) in ("true", "1")
+
+    def get_limit(self, request):
+        """
+        Returns the positive `limit` requested by the client, or None.
+        """
+        if self.limit_param not in request.query_params:
+            return None
+        try:
+            limit = int(request.query_params[self.limit_param])
+        except ValueError:
+            limit = 0
+        if limit <= 0:
+            raise ValidationError({self.limit_param: ["Must be a positive integer."]})
+        return limit
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": "due_after",
+                "required": False,
+                "in": "query",
+                "description": "Only tasks due on or after this date.",
+                "schema": {"type": "string", "format": "date"},
+            },
+            {
+                "name": "due_before",
+                "required": False,
+                "in": "query",
+                "description": "Only tasks due on or before this date.",
+                "schema": {"type": "string", "format": "date"},
+            },
+            {
+                "name": "overdue",
+                "required": False,
+                "in": "query",
+                "description": "Only tasks due before today.",
+                "schema": {"type": "boolean"},
+            },
+            {
+                "name": "upcoming",
+                "required": False,
+                "in": "query",
+                "description": "Only tasks due today or later.",
+                "schema": {"type": "boolean"},
+            },
+            {
+                "name": self.limit_param,
+                "required": False,
+                "in": "query",
+                "description": "Maximum number of tasks to return (ignored when paginating).",
+                "schema": {"type": "integer"},
+            },
+        ]
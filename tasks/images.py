@@ -0,0 +1,122 @@
+"""
+OpenCV pipeline for task photos.
+
+Photos are decoded straight from their encoded bytes, to grayscale, and at a
+reduced scale when the source is far larger than the target size. Large phone
+photos therefore never materialize as a full-resolution color image. The same
+decode also yields the smaller derivatives (thumbnails), and the caller decides
+where each encoded result is written.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+
+REDUCED_GRAYSCALE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+
+@contextmanager
+def open_buffer(source):
+    """
+    Yields the encoded bytes of an uploaded file or a path on disk.
+
+    Files that live on disk (stored photos and large uploads spooled to a
+    temporary file) are memory-mapped instead of being read into memory.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = source
+    elif hasattr(source, "temporary_file_path"):
+        path = source.temporary_file_path()
+    else:
+        source.seek(0)
+        yield source.read()
+        source.seek(0)
+        return
+
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+def decode_grayscale(buffer, max_size, source_size=None):
+    """
+    Decodes an encoded image to grayscale.
+
+    When `source_size` (width, height) is known, the largest power-of-two
+    reduction that still leaves the image at least `max_size` on its long side
+    is applied during decoding. Returns None if the data cannot be decoded.
+    """
+    flag = cv2.IMREAD_GRAYSCALE
+    if source_size:
+        longest = max(source_size)
+        for factor, reduced_flag in REDUCED_GRAYSCALE_FLAGS:
+            if longest // factor >= max_size:
+                flag = reduced_flag
+                break
+
+    return cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), flag)
+
+
+def fit_within(gray, max_size):
+    """
+    Resizes an image while maintaining aspect ratio so it fits in `max_size` x `max_size`.
+    """
+    height, width = gray.shape[:2]
+    scale = min(max_size / width, max_size / height)
+    new_size = (int(width * scale), int(height * scale))
+    return cv2.resize(gray, new_size, interpolation=cv2.INTER_AREA)
+
+
+def encode(image, extension):
+    """
+    Encodes an image in the format implied by `extension`, or returns None if unsupported.
+    """
+    try:
+        ok, encoded = cv2.imencode(extension, image)
+    except cv2.error:
+        return None
+    return encoded.tobytes() if ok else None
+
+
+def render_photo(buffer, extension, sizes, source_size=None):
+    """
+    Renders grayscale versions of an encoded image for each of `sizes` from a single decode.
+
+    The image is decoded once for the largest size and each smaller version is
+    resized from the previous one. Returns the encoded results in the order of
+    `sizes`, or None if the image cannot be decoded or encoded.
+    """
+    gray = decode_grayscale(buffer, max(sizes), source_size)
+    if gray is None:
+        return None
+
+    rendered = {}
+    for size in sorted(set(sizes), reverse=True):
+        gray = fit_within(gray, size)
+        rendered[size] = encode(gray, extension)
+        if rendered[size] is None:
+            return None
+    return [rendered[size] for size in sizes]
+
+
+def process_photo(buffer, extension, max_size, source_size=None):
+    """
+    Converts encoded image bytes to a grayscale image no larger than `max_size`.
+
+    Returns the encoded result, or None if the image cannot be decoded or encoded.
+    """
+    rendered = render_photo(buffer, extension, [max_size], source_size)
+    return rendered[0] if rendered else None
+
+
+def variant_name(name, size):
+    """
+    Returns the storage name of the `size` px derivative of a stored photo.
+    """
+    root, extension = os.path.splitext(name)
+    return f"{root}_{size}{extension}"
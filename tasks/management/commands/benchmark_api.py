@@ -0,0 +1,217 @@
+"""
+Replays a mix of task API requests against the WSGI application and reports latency per endpoint.
+"""
+import io
+import json
+import random
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Task
+
+BENCHMARK_TITLE = "benchmark_api create"
+
+ENDPOINTS = ("list", "detail", "create", "nearest")
+
+
+def percentile(ordered, fraction):
+    """
+    Returns the value below which `fraction` of the sorted values fall.
+    """
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class Command(BaseCommand):
+    """
+    Sends requests from `--concurrency` threads straight to the WSGI
+    application, as a WSGI server would, for `--seconds` seconds.
+
+    Each request picks an endpoint at random, weighted by `--mix`:
+    - `list`: one page of `GET /api/tasks` (`--page-size`, 0 for the full list);
+    - `detail`: `GET /api/tasks/<id>` for a random existing task;
+    - `create`: `POST /api/tasks` with a JSON body;
+    - `nearest`: `GET /api/tasks/nearest-deadline`.
+
+    Throughput and p50/p95/p99 latency are reported per endpoint, and written
+    as JSON to `--output` if given. Requests answered with a 4xx or 5xx status
+    are counted as errors. The tasks created by the run are deleted afterwards.
+    Seed the database with `seed_tasks` first.
+    """
+
+    help = "Measure throughput and latency of the task API under a concurrent request mix."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=10.0, help="How long to run.")
+        parser.add_argument("--concurrency", type=int, default=4, help="Number of client threads.")
+        parser.add_argument(
+            "--mix", default="list=1,detail=6,create=1,nearest=2",
+            help=f"Relative weight of each endpoint, as name=weight pairs ({', '.join(ENDPOINTS)}).",
+        )
+        parser.add_argument("--page-size", type=int, default=100, help="Page size of list requests; 0 for the full list.")
+        parser.add_argument("--host", default="localhost", help="Host header sent with every request.")
+        parser.add_argument("--seed", type=int, help="Random seed for the request sequence.")
+        parser.add_argument("--output", help="File to write the results to, as JSON.")
+
+    def handle(self, *args, **options):
+        mix = self.parse_mix(options["mix"])
+        task_ids = list(Task.objects.values_list("id", flat=True))
+        if mix.get("detail") and not task_ids:
+            raise CommandError("There are no tasks to request; run seed_tasks first.")
+
+        application = get_wsgi_application()
+        endpoints, weights = list(mix), list(mix.values())
+        stop = threading.Event()
+        latencies, errors = defaultdict(list), []
+
+        def run(worker):
+            rng = random.Random(None if options["seed"] is None else options["seed"] + worker)
+            try:
+                while not stop.is_set():
+                    endpoint = rng.choices(endpoints, weights)[0]
+                    environ = self.build_environ(endpoint, rng, task_ids, options)
+                    started = time.perf_counter()
+                    status_code = self.call(application, environ)
+                    latencies[endpoint].append(time.perf_counter() - started)
+                    if status_code >= 400:
+                        errors.append(f"{endpoint}: HTTP {status_code}")
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=run, args=(worker,)) for worker in range(options["concurrency"])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(options["seconds"])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        Task.objects.filter(title=BENCHMARK_TITLE).delete()
+
+        results = self.summarize(latencies, errors, elapsed)
+        self.report(results, elapsed, options["concurrency"])
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                json.dump({"seconds": elapsed, "concurrency": options["concurrency"], "endpoints": results}, fh, indent=2)
+        for error, count in Counter(errors).most_common():
+            self.stdout.write(self.style.ERROR(f"{count} x {error}"))
+        if not errors:
+            self.stdout.write(self.style.SUCCESS("No errors."))
+
+    def parse_mix(self, value):
+        """
+        Returns the endpoint weights given as `name=weight` pairs.
+        """
+        mix = {}
+        for pair in value.split(","):
+            name, _, weight = pair.partition("=")
+            name = name.strip()
+            if name not in ENDPOINTS:
+                raise CommandError(f"Unknown endpoint '{name}' in --mix; choose from {', '.join(ENDPOINTS)}.")
+            try:
+                mix[name] = float(weight)
+            except ValueError:
+                raise CommandError(f"Invalid weight '{weight}' for '{name}' in --mix.")
+        if not any(weight > 0 for weight in mix.values()):
+            raise CommandError("--mix needs at least one endpoint with a positive weight.")
+        return {name: weight for name, weight in mix.items() if weight > 0}
+
+    def build_environ(self, endpoint, rng, task_ids, options):
+        """
+        Returns the WSGI environ of a request to `endpoint`.
+        """
+        method, query, body = "GET", "", b""
+        if endpoint == "list":
+            path = reverse("task-list")
+            if options["page_size"]:
+                query = urlencode({"page_size": options["page_size"]})
+        elif endpoint == "detail":
+            path = reverse("task-detail", args=[rng.choice(task_ids)])
+        elif endpoint == "create":
+            method, path = "POST", reverse("task-list")
+            due_date = timezone.localdate() + timedelta(days=rng.randint(-30, 365))
+            body = json.dumps({
+                "title": BENCHMARK_TITLE,
+                "description": "Created by the benchmark_api command.",
+                "due_date": due_date.isoformat(),
+            }).encode()
+        else:
+            path = reverse("nearest-deadline")
+
+        environ = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "HTTP_HOST": options["host"],
+            "HTTP_ACCEPT": "application/json",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+        }
+        setup_testing_defaults(environ)
+        return environ
+
+    def call(self, application, environ):
+        """
+        Calls the WSGI application, consumes the response body and returns the status code.
+        """
+        status = []
+        response = application(environ, lambda status_line, headers, exc_info=None: status.append(status_line))
+        try:
+            for _ in response:
+                pass
+        finally:
+            if hasattr(response, "close"):
+                response.close()
+        return int(status[0].split()[0])
+
+    def summarize(self, latencies, errors, elapsed):
+        """
+        Returns the request count, throughput, latency percentiles (in ms) and error count of each endpoint.
+        """
+        failed = Counter(error.split(":")[0] for error in errors)
+        results = {}
+        for endpoint in ENDPOINTS:
+            ordered = sorted(latencies.get(endpoint, []))
+            if not ordered:
+                continue
+            results[endpoint] = {
+                "requests": len(ordered),
+                "throughput": len(ordered) / elapsed,
+                "p50": statistics.median(ordered) * 1000,
+                "p95": percentile(ordered, 0.95) * 1000,
+                "p99": percentile(ordered, 0.99) * 1000,
+                "max": ordered[-1] * 1000,
+                "errors": failed[endpoint],
+            }
+        return results
+
+    def report(self, results, elapsed, concurrency):
+        """
+        Writes the per-endpoint results as a table.
+        """
+        total = sum(result["requests"] for result in results.values())
+        self.stdout.write(
+            f"{total} requests in {elapsed:.1f}s from {concurrency} threads ({total / elapsed:.1f} requests/s)."
+        )
+        self.stdout.write(
+            f"{'endpoint':<10}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}"
+        )
+        for endpoint, result in results.items():
+            self.stdout.write(
+                f"{endpoint:<10}{result['requests']:>10}{result['throughput']:>10.1f}"
+                f"{result['p50']:>10.2f}{result['p95']:>10.2f}{result['p99']:>10.2f}{result['max']:>10.2f}"
+                f"{result['errors']:>8}"
+            )
@@ -0,0 +1,93 @@
+"""
+Measures task read latency while other threads keep writing to the database.
+"""
+import statistics
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connections, router, transaction
+
+from tasks.models import Task
+
+BENCHMARK_TITLE = "benchmark_db write"
+
+
+class Command(BaseCommand):
+    """
+    Runs reader and writer threads against the configured database.
+
+    Every writer repeatedly opens a transaction, inserts a task and holds the
+    write lock for `--hold` milliseconds before committing. Readers meanwhile
+    fetch the latest tasks through the database router. With WAL journaling
+    read latency stays flat instead of tracking the writers' lock time, and no
+    "database is locked" errors occur. The inserted tasks are deleted afterwards.
+    """
+
+    help = "Measure read latency and lock errors while concurrent writers hold the write lock."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=5.0, help="How long to run.")
+        parser.add_argument("--readers", type=int, default=4, help="Number of reader threads.")
+        parser.add_argument("--writers", type=int, default=2, help="Number of writer threads.")
+        parser.add_argument("--hold", type=float, default=50.0, help="Milliseconds each write transaction stays open.")
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        latencies, writes, errors = [], [], []
+
+        def read():
+            try:
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    try:
+                        list(Task.objects.order_by("-id").values_list("id", "title")[:100])
+                    except DatabaseError as exc:
+                        errors.append(f"read: {exc}")
+                        continue
+                    latencies.append(time.perf_counter() - started)
+            finally:
+                connections.close_all()
+
+        def write():
+            try:
+                while not stop.is_set():
+                    try:
+                        with transaction.atomic():
+                            Task.objects.create(title=BENCHMARK_TITLE)
+                            time.sleep(options["hold"] / 1000)
+                    except DatabaseError as exc:
+                        errors.append(f"write: {exc}")
+                        continue
+                    writes.append(1)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=read) for _ in range(options["readers"])]
+        threads += [threading.Thread(target=write) for _ in range(options["writers"])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options["seconds"])
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        Task.objects.filter(title=BENCHMARK_TITLE).delete()
+
+        read_alias = router.db_for_read(Task)
+        journal_mode = connections[read_alias].cursor().execute("PRAGMA journal_mode").fetchone()[0]
+        self.stdout.write(f"Reads on '{read_alias}' (journal_mode={journal_mode}), writes on '{router.db_for_write(Task)}'.")
+        self.stdout.write(f"{len(writes)} write transactions, each holding the write lock for {options['hold']:.0f} ms.")
+        if latencies:
+            latencies.sort()
+            self.stdout.write(
+                f"{len(latencies)} reads: "
+                f"p50 {statistics.median(latencies) * 1000:.2f} ms, "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms, "
+                f"max {latencies[-1] * 1000:.2f} ms."
+            )
+        for error, count in Counter(errors).most_common():
+            self.stdout.write(self.style.ERROR(f"{count} x {error}"))
+        if not errors:
+            self.stdout.write(self.style.SUCCESS("No database errors."))
@@ -0,0 +1,154 @@
+"""
+Reprocesses the stored photos of all tasks with the current photo settings.
+"""
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.utils import timezone
+
+from tasks.cache import invalidate_task_caches
+from tasks.models import StoredPhoto, Task
+from tasks.serializers import TaskSerializer
+
+
+def reprocess(task):
+    """
+    Reprocesses the photo of a task in a worker process.
+
+    Only the filesystem is touched here; the caller records the outcome.
+    Returns the photo name, whether it was processed and its new derivatives.
+    """
+    processed = TaskSerializer().process_image(task)
+    return task.photo.name, processed, task.photo_variants
+
+
+class Command(BaseCommand):
+    """
+    Walks all tasks with photos in id order and reprocesses every distinct photo.
+
+    Photos are reprocessed with `TaskSerializer.process_image`, exactly as the
+    background workers do, spread over a pool of processes. Progress is
+    checkpointed by the last processed task id and the photos processed so far,
+    so an interrupted run can resume without processing a shared photo twice.
+
+    Only the processed photo is stored, not the original upload, so photos are
+    re-rendered from their current file and overwritten: derivative sizes can
+    be changed and photos can be shrunk, but a larger `TASK_PHOTO_MAX_SIZE`
+    cannot recover resolution, the file format stays the same and every run
+    re-encodes the image once more.
+    """
+
+    help = (
+        "Reprocess all task photos with the current TASK_PHOTO_* settings. Photos are re-rendered "
+        "from their processed file: resolution lost to an earlier, smaller TASK_PHOTO_MAX_SIZE is "
+        "not recovered and the file format is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Number of tasks fetched per query.")
+        parser.add_argument("--checkpoint", help="File recording the last processed task id, used to resume.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be reprocessed.")
+
+    def handle(self, *args, **options):
+        checkpoint = options["checkpoint"]
+        last_id, seen = self.read_checkpoint(checkpoint)
+        if last_id:
+            self.stdout.write(f"Resuming after task {last_id}.")
+
+        pool = None
+        if options["workers"] > 1 and not options["dry_run"]:
+            # Forked workers must not share the parent's database connections.
+            connections.close_all()
+            pool = ProcessPoolExecutor(options["workers"], mp_context=multiprocessing.get_context("fork"))
+
+        totals = {"tasks": 0, "photos": 0, "failed": 0}
+        started = time.monotonic()
+        try:
+            for chunk in self.iter_chunks(last_id, options["chunk_size"]):
+                pending = []
+                for task in chunk:
+                    if task.photo.name not in seen:
+                        seen.add(task.photo.name)
+                        pending.append(task)
+
+                totals["tasks"] += len(chunk)
+                totals["photos"] += len(pending)
+                if not options["dry_run"]:
+                    results = pool.map(reprocess, pending) if pool else map(reprocess, pending)
+                    totals["failed"] += self.record(results)
+                    self.write_checkpoint(checkpoint, chunk[-1].pk, seen)
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{totals['tasks']} tasks, {totals['photos']} photos "
+                    f"({totals['photos'] / elapsed if elapsed else 0:.1f} photos/s)"
+                )
+        finally:
+            if pool:
+                pool.shutdown()
+
+        if checkpoint and not options["dry_run"] and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        verb = "Would reprocess" if options["dry_run"] else "Reprocessed"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {totals['photos']} photos of {totals['tasks']} tasks "
+            f"in {time.monotonic() - started:.1f}s ({totals['failed']} failed)."
+        ))
+
+    def iter_chunks(self, last_id, chunk_size):
+        """
+        Yields lists of tasks with photos, seeking by id rather than by offset.
+        """
+        queryset = Task.objects.exclude(photo="").exclude(photo__isnull=True).only("id", "photo", "photo_variants")
+        while True:
+            chunk = list(queryset.filter(pk__gt=last_id).order_by("pk")[:chunk_size])
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1].pk
+
+    def record(self, results):
+        """
+        Stores the outcome of each reprocessed photo on every task sharing it.
+
+        Returns the number of photos that could not be processed.
+        """
+        failed = 0
+        for name, processed, variants in results:
+            photo_status = Task.PhotoStatus.DONE if processed else Task.PhotoStatus.FAILED
+            failed += not processed
+            with transaction.atomic():
+                StoredPhoto.objects.filter(name=name).update(status=photo_status, variants=variants)
+                Task.objects.filter(photo=name).update(
+                    photo_status=photo_status, photo_variants=variants, updated_at=timezone.now()
+                )
+        invalidate_task_caches()
+        return failed
+
+    def read_checkpoint(self, path):
+        """
+        Returns the last processed task id and the set of processed photo names
+        stored in the checkpoint file, or 0 and an empty set.
+        """
+        if not path or not os.path.exists(path):
+            return 0, set()
+        with open(path) as fh:
+            checkpoint = json.load(fh)
+        return checkpoint["last_id"], set(checkpoint.get("photos", []))
+
+    def write_checkpoint(self, path, last_id, photos):
+        """
+        Atomically records the last processed task id and the processed photo names.
+        """
+        if not path:
+            return
+        with open(f"{path}.tmp", "w") as fh:
+            json.dump({"last_id": last_id, "photos": sorted(photos)}, fh)
+        os.replace(f"{path}.tmp", path)
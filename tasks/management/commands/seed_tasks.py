@@ -0,0 +1,165 @@
+"""
+Seeds the database with synthetic tasks for benchmarking.
+"""
+import hashlib
+import random
+import time
+from datetime import timedelta
+
+import cv2
+import numpy as np
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tasks.cache import invalidate_task_caches
+from tasks.models import StoredPhoto, Task
+from tasks.photos import acquire_photo, register_photo
+from tasks.serializers import TaskSerializer
+
+DUE_DATE_DISTRIBUTIONS = ("uniform", "upcoming", "overdue", "none")
+
+WORDS = (
+    "review", "update", "prepare", "send", "plan", "fix", "call", "draft", "book", "clean",
+    "quarterly", "report", "invoice", "budget", "meeting", "release", "garden", "dentist",
+    "slides", "backup", "groceries", "contract", "roadmap", "newsletter", "tickets", "taxes",
+)
+
+
+class Command(BaseCommand):
+    """
+    Inserts `--count` tasks with random titles, descriptions and due dates.
+
+    Due dates follow one of `DUE_DATE_DISTRIBUTIONS`, within `--due-days` days
+    of today, and `--undated-fraction` of the tasks get none. `--photo-fraction`
+    of the tasks get one of `--distinct-photos` generated photos; each photo is
+    rendered once through the regular photo pipeline and shared by reference,
+    like identical uploads. Tasks are inserted with `bulk_create` in batches;
+    the same `--seed` produces the same tasks and photos.
+    """
+
+    help = "Seed the database with synthetic tasks (and photos) for benchmarking."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=1000, help="Number of tasks to create.")
+        parser.add_argument(
+            "--due-dates", choices=DUE_DATE_DISTRIBUTIONS, default="uniform",
+            help="Distribution of due dates: uniform around today, mostly upcoming soon, "
+                 "overdue, or none at all.",
+        )
+        parser.add_argument("--due-days", type=int, default=365, help="Spread of the due dates, in days.")
+        parser.add_argument("--undated-fraction", type=float, default=0.2, help="Fraction of tasks without a due date.")
+        parser.add_argument("--photo-fraction", type=float, default=0.0, help="Fraction of tasks with a photo.")
+        parser.add_argument("--distinct-photos", type=int, default=20, help="Number of distinct generated photos.")
+        parser.add_argument(
+            "--photo-size", type=int, nargs=2, default=[1600, 1200], metavar=("WIDTH", "HEIGHT"),
+            help="Size of the generated photos, before processing.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000, help="Number of tasks inserted per query.")
+        parser.add_argument("--seed", type=int, help="Random seed, for reproducible data.")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.np_rng = np.random.default_rng(options["seed"])
+        self.today = timezone.localdate()
+        photos = {}
+        created = 0
+        started = time.monotonic()
+
+        while created < options["count"]:
+            size = min(options["batch_size"], options["count"] - created)
+            tasks = [self.make_task(options) for _ in range(size)]
+            for task in tasks:
+                if self.rng.random() < options["photo_fraction"]:
+                    self.attach_photo(task, photos, options)
+            with transaction.atomic():
+                Task.objects.bulk_create(tasks)
+            created += size
+
+            elapsed = time.monotonic() - started
+            self.stdout.write(f"{created} tasks ({created / elapsed if elapsed else 0:.0f} tasks/s)")
+
+        # Every stored photo holds one reference already, taken when it was first attached.
+        for stored, references in photos.values():
+            StoredPhoto.objects.filter(pk=stored.pk).update(ref_count=F("ref_count") + references - 1)
+        invalidate_task_caches()
+
+        with_photos = sum(references for _, references in photos.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} tasks ({with_photos} with one of {len(photos)} photos) "
+            f"in {time.monotonic() - started:.1f}s."
+        ))
+
+    def make_task(self, options):
+        """
+        Returns an unsaved task with a random title, description and due date.
+        """
+        title = " ".join(self.rng.choices(WORDS, k=self.rng.randint(2, 5))).capitalize()
+        description = None
+        if self.rng.random() < 0.7:
+            description = " ".join(self.rng.choices(WORDS, k=self.rng.randint(5, 40))).capitalize() + "."
+        return Task(title=title, description=description, due_date=self.make_due_date(options))
+
+    def make_due_date(self, options):
+        """
+        Returns a due date drawn from the `--due-dates` distribution, or None.
+        """
+        distribution, days = options["due_dates"], max(options["due_days"], 1)
+        if distribution == "none" or self.rng.random() < options["undated_fraction"]:
+            return None
+        if distribution == "uniform":
+            offset = self.rng.randint(-days, days)
+        elif distribution == "upcoming":
+            # Most tasks are due within the next few days, a few much later.
+            offset = min(int(self.rng.expovariate(10 / days)), days)
+        else:
+            offset = -self.rng.randint(1, days)
+        return self.today + timedelta(days=offset)
+
+    def attach_photo(self, task, photos, options):
+        """
+        Gives the task one of the generated photos, storing it on first use.
+
+        `photos` maps each photo index to its `StoredPhoto` and the number of
+        seeded tasks referencing it.
+        """
+        index = self.rng.randrange(options["distinct_photos"])
+        if index not in photos:
+            photos[index] = [self.store_photo(self.make_photo(*options["photo_size"])), 0]
+        stored = photos[index][0]
+        photos[index][1] += 1
+        task.photo.name = stored.name
+        task.photo_status = stored.status
+        task.photo_variants = stored.variants
+
+    def make_photo(self, width, height):
+        """
+        Returns a JPEG of smooth random colors, compressing roughly like a real photo.
+        """
+        noise = self.np_rng.integers(0, 256, (max(height // 40, 2), max(width // 40, 2), 3), dtype=np.uint8)
+        image = cv2.resize(noise, (width, height), interpolation=cv2.INTER_CUBIC)
+        return cv2.imencode(".jpg", image)[1].tobytes()
+
+    def store_photo(self, content):
+        """
+        Returns the stored photo for `content`, holding one reference to it.
+
+        A photo stored before (by an earlier run with the same seed) is reused;
+        a new one is rendered inline, whatever `TASK_PHOTO_ASYNC` says, so the
+        seeded tasks are ready to be served.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        stored = acquire_photo(digest)
+        if stored is not None:
+            return stored
+
+        serializer = TaskSerializer()
+        photo = SimpleUploadedFile(f"{digest}.jpg", content, content_type="image/jpeg")
+        rendered = serializer.render_photo(photo, photo.name)
+        field = Task._meta.get_field("photo")
+        name = field.storage.save(field.generate_filename(None, photo.name), ContentFile(rendered[0]))
+        variants = serializer.store_variants(name, rendered[1:])
+        return register_photo(digest, name, variants, Task.PhotoStatus.DONE)[0]
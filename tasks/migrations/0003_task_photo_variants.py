@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_photo_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='photo_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
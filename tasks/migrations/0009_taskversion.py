@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:39
+
+from django.db import migrations, models
+
+# Triggers bump the single tasks_taskversion row on every insert, update and
+# delete on tasks_task, including bulk queries that skip signals and writes
+# made by other processes. The row is created by the first write, so a flushed
+# table starts over on its own. Like the FTS triggers of migration 0008, the
+# triggers are dropped by SQLite migrations that rebuild tasks_task, so such
+# migrations must create them again.
+BUMP_VERSION = """
+    INSERT INTO tasks_taskversion (id, version, modified)
+    VALUES (1, 1, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+    ON CONFLICT (id) DO UPDATE SET version = version + 1, modified = excluded.modified;
+"""
+
+CREATE_SQL = [
+    f"CREATE TRIGGER tasks_task_version_{event.lower()} AFTER {event} ON tasks_task BEGIN {BUMP_VERSION} END"
+    for event in ("INSERT", "UPDATE", "DELETE")
+]
+
+DROP_SQL = [f"DROP TRIGGER IF EXISTS tasks_task_version_{event}" for event in ("insert", "update", "delete")]
+
+
+def run_on_sqlite(statements):
+    """
+    Returns a migration function that runs `statements` on SQLite databases only.
+
+    Other databases fall back to an aggregate over tasks in `tasks.cache`.
+    """
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('modified', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(run_on_sqlite(CREATE_SQL), run_on_sqlite(DROP_SQL)),
+    ]
@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from django.db import models
 
 class Task(models.Model):
@@ -9,11 +11,31 @@ class Task(models.Model):
         description (str, optional): A description of the task (optional, max 500 characters).
         due_date (date, optional): The optional deadline for the task.
         photo (ImageField, optional): An optional image associated with the task.
+        photo_status (str, optional): Processing state of the photo (pending, processing, done, failed).
+        photo_variants (dict): Storage names of the smaller photo derivatives, keyed by size in px.
+        updated_at (datetime): When the task was last modified.
     """
+
+    class PhotoStatus(models.TextChoices):
+        """Lifecycle of an uploaded photo through the image processing pipeline."""
+
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
     title = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True, max_length=500)
     due_date = models.DateField(blank=True, null=True)
     photo = models.ImageField(upload_to="task_photos/", blank=True, null=True)
+    photo_status = models.CharField(max_length=10, choices=PhotoStatus.choices, blank=True, null=True)
+    photo_variants = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["due_date"], name="task_due_date_idx", condition=models.Q(due_date__isnull=False)),
+        ]
 
     def __str__(self):
         """
@@ -23,3 +45,58 @@ class Task(models.Model):
             str: The title of the task.
         """
         return self.title
+
+
+class StoredPhoto(models.Model):
+    """
+    Model representing a processed photo file shared by tasks.
+
+    Photos are stored under the SHA-256 digest of the uploaded bytes, so every
+    task that uploads the same image points at the same processed file.
+
+    Attributes:
+        digest (str): SHA-256 hex digest of the original upload.
+        name (str): Storage name of the processed photo.
+        variants (dict): Storage names of the photo derivatives, keyed by size in px.
+        status (str): Processing state of the photo (pending, processing, done, failed).
+        ref_count (int): Number of tasks referencing the photo.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, unique=True)
+    variants = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Task.PhotoStatus.choices, default=Task.PhotoStatus.PENDING)
+    ref_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """
+        Returns the string representation of the StoredPhoto model.
+
+        Returns:
+            str: The storage name of the photo.
+        """
+        return self.name
+
+
+class TaskVersion(models.Model):
+    """
+    Model holding the change version of the tasks, in a single row.
+
+    On SQLite, triggers created by migration 0009 create or bump the row on
+    every insert, update and delete on tasks_task, including bulk queries and
+    writes made by other processes.
+
+    Attributes:
+        version (int): Number of task rows written so far.
+        modified (datetime): When a task was last written.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+    modified = models.DateTimeField()
+
+    def __str__(self):
+        """
+        Returns the string representation of the TaskVersion model.
+
+        Returns:
+            str: The version number.
+        """
+        return str(self.version)
@@ -0,0 +1,182 @@
+import base64
+import binascii
+import json
+from datetime import date
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Opt-in keyset pagination for the task list.
+
+    Pagination is only applied when the request carries `cursor` or
+    `page_size`, so plain list requests keep returning every task. Pages are
+    fetched by seeking past the last returned row instead of using OFFSET, so
+    every page costs the same no matter how deep the client pages.
+
+    Supported orderings (`ordering` parameter):
+    - `id` (default)
+    - `due_date`: tasks with a due date first, by (due_date, id), then tasks
+      without one, by id. Each part is read with its own index-friendly query.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering_query_param = "ordering"
+    orderings = ("id", "due_date")
+    page_size = 100
+    max_page_size = 1000
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns one page of tasks, or None when the client did not ask for pagination.
+        """
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.ordering = self.get_ordering(request)
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        rows = self.fetch(queryset, position, self.page_size + 1)
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.next_position = self.position_of(rows[-1]) if self.has_next else None
+        return rows
+
+    def fetch(self, queryset, position, limit):
+        """
+        Fetches up to `limit` tasks following `position` in the current ordering.
+        """
+        if self.ordering == "id":
+            if position:
+                queryset = queryset.filter(id__gt=position[0])
+            return list(queryset.order_by("id")[:limit])
+
+        rows = []
+        if position is None or position[0] is not None:
+            dated = queryset.filter(due_date__isnull=False)
+            if position:
+                due_date, last_id = date.fromisoformat(position[0]), position[1]
+                dated = dated.filter(Q(due_date__gt=due_date) | Q(due_date=due_date, id__gt=last_id))
+            rows = list(dated.order_by("due_date", "id")[:limit])
+
+        if len(rows) < limit:
+            undated = queryset.filter(due_date__isnull=True)
+            if position and position[0] is None:
+                undated = undated.filter(id__gt=position[1])
+            rows += list(undated.order_by("id")[: limit - len(rows)])
+        return rows
+
+    def position_of(self, task):
+        """
+        Returns the keyset position of a task (an instance or a `.values()` row) in the current ordering.
+        """
+        row = task if isinstance(task, dict) else vars(task)
+        if self.ordering == "id":
+            return [row["id"]]
+        return [row["due_date"].isoformat() if row["due_date"] else None, row["id"]]
+
+    def get_ordering(self, request):
+        """
+        Returns the requested ordering, defaulting to `id`.
+        """
+        ordering = request.query_params.get(self.ordering_query_param, self.orderings[0])
+        if ordering not in self.orderings:
+            raise ValidationError({self.ordering_query_param: [f"Must be one of: {', '.join(self.orderings)}."]})
+        return ordering
+
+    def get_page_size(self, request):
+        """
+        Returns the requested page size, capped at `max_page_size`.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        """
+        Returns the position encoded in the `cursor` parameter, or None for the first page.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position = cursor["p"]
+            if cursor["o"] != self.ordering or len(position) != (1 if self.ordering == "id" else 2):
+                raise ValueError
+            if type(position[-1]) is not int:
+                raise ValueError
+            if position[0] is not None and self.ordering == "due_date":
+                date.fromisoformat(position[0])
+        except (binascii.Error, KeyError, TypeError, ValueError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_cursor(self, position):
+        """
+        Encodes a position in the current ordering as an opaque cursor.
+        """
+        cursor = json.dumps({"o": self.ordering, "p": position}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(cursor.encode("ascii")).decode("ascii")
+
+    def get_next_link(self):
+        """
+        Returns the URL of the next page, or None on the last page.
+        """
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page; enables pagination.",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.ordering_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Which field to use when ordering the results.",
+                "schema": {"type": "string", "enum": list(self.orderings)},
+            },
+        ]
@@ -0,0 +1,97 @@
+"""
+Content-addressed storage of task photos.
+
+Uploads are keyed by the SHA-256 digest of their bytes. Tasks that upload the
+same image share one processed file (and its derivatives) through a
+reference-counted `StoredPhoto`, so a repeated upload skips OpenCV entirely and
+the files are only deleted once the last task referencing them lets go.
+"""
+import hashlib
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache import invalidate_task_caches
+from .models import StoredPhoto, Task
+
+FINAL_STATUSES = (Task.PhotoStatus.DONE, Task.PhotoStatus.FAILED)
+
+
+def photo_digest(photo):
+    """
+    Returns the SHA-256 hex digest of an uploaded file.
+    """
+    digest = hashlib.sha256()
+    for chunk in photo.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def acquire_photo(digest):
+    """
+    Takes a reference to the stored photo with the given digest.
+
+    Returns the stored photo, or None if no photo with that digest exists yet.
+    """
+    with transaction.atomic():
+        if not StoredPhoto.objects.filter(digest=digest).update(ref_count=F("ref_count") + 1):
+            return None
+        return StoredPhoto.objects.get(digest=digest)
+
+
+def register_photo(digest, name, variants, status):
+    """
+    Records a freshly stored photo with a single reference.
+
+    If an identical upload registered the digest first, its photo is acquired
+    instead and the files written under `name` are deleted. Returns the stored
+    photo and whether it was created.
+    """
+    stored, created = StoredPhoto.objects.get_or_create(
+        digest=digest,
+        defaults={"name": name, "variants": variants, "status": status, "ref_count": 1},
+    )
+    if created:
+        return stored, True
+
+    delete_photo_files(name, variants)
+    return acquire_photo(digest), False
+
+
+def release_photo(name):
+    """
+    Drops a reference to the stored photo with the given storage name.
+
+    The photo and its derivatives are deleted once no task references them.
+    Photos stored before deduplication have no `StoredPhoto` and are left alone.
+    """
+    with transaction.atomic():
+        StoredPhoto.objects.filter(name=name, ref_count__gt=0).update(ref_count=F("ref_count") - 1)
+        stored = StoredPhoto.objects.filter(name=name, ref_count=0).first()
+        if stored is None:
+            return
+        stored.delete()
+
+    transaction.on_commit(lambda: delete_photo_files(stored.name, stored.variants))
+
+
+def finish_photo(name, status, variants):
+    """
+    Records the outcome of processing a photo on it and on every task sharing it.
+    """
+    with transaction.atomic():
+        StoredPhoto.objects.filter(name=name).update(status=status, variants=variants)
+        Task.objects.filter(photo=name).exclude(photo_status__in=FINAL_STATUSES).update(
+            photo_status=status, photo_variants=variants, updated_at=timezone.now()
+        )
+    invalidate_task_caches()
+
+
+def delete_photo_files(name, variants):
+    """
+    Deletes a stored photo and its derivatives from storage.
+    """
+    storage = Task._meta.get_field("photo").storage
+    for file_name in [name, *variants.values()]:
+        storage.delete(file_name)
@@ -0,0 +1,100 @@
+"""
+Background processing of task photos.
+
+When ``TASK_PHOTO_ASYNC`` is enabled, uploaded photos are stored as-is and the
+task is returned immediately with ``photo_status`` set to ``pending``. The
+grayscale conversion and resizing then run on a local thread pool once the
+surrounding transaction has committed.
+
+The async task views run their writes in threads of their own (see
+`tasks.async_views.run_in_worker`), so image processing never blocks the event
+loop and API writes never wait behind background photo jobs.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .cache import invalidate_task_caches
+from .models import StoredPhoto, Task
+from .photos import finish_photo
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns the process-wide photo worker pool, creating it on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.TASK_PHOTO_WORKERS,
+                thread_name_prefix="task-photo",
+            )
+    return _executor
+
+
+def enqueue_photo(name):
+    """
+    Schedules processing of the stored photo `name` after the current transaction commits.
+    """
+    transaction.on_commit(lambda: get_executor().submit(_run_in_worker, process_stored_photo, name))
+
+
+def _run_in_worker(func, *args, **kwargs):
+    """
+    Photo worker entry point; releases the thread's database connections afterwards.
+    """
+    try:
+        return func(*args, **kwargs)
+    finally:
+        connections.close_all()
+
+
+def process_stored_photo(name):
+    """
+    Processes the pending photo stored as `name` and records the outcome in the
+    `photo_status` of every task using it.
+
+    The photo is claimed with a conditional update on its status, so a photo
+    that was already picked up or finished is skipped and duplicate jobs are
+    harmless. The job does not depend on any particular task: it still runs
+    when the task whose upload queued it has been deleted in the meantime.
+    """
+    from .serializers import TaskSerializer
+
+    if StoredPhoto.objects.filter(name=name).exists():
+        claimed = StoredPhoto.objects.filter(name=name, status=Task.PhotoStatus.PENDING).update(
+            status=Task.PhotoStatus.PROCESSING
+        )
+    else:
+        # Photos stored before deduplication are claimed through their tasks.
+        claimed = Task.objects.filter(photo=name, photo_status=Task.PhotoStatus.PENDING).update(
+            photo_status=Task.PhotoStatus.PROCESSING, updated_at=timezone.now()
+        )
+    if not claimed:
+        return
+
+    Task.objects.filter(photo=name, photo_status=Task.PhotoStatus.PENDING).update(
+        photo_status=Task.PhotoStatus.PROCESSING, updated_at=timezone.now()
+    )
+    invalidate_task_caches()
+
+    # Pending photos have no derivatives yet, so an unsaved task holding the name is enough.
+    task = Task(photo=name)
+    photo_status = Task.PhotoStatus.FAILED
+    try:
+        if TaskSerializer().process_image(task):
+            photo_status = Task.PhotoStatus.DONE
+    except Exception:
+        logger.exception("Failed to process photo %s", name)
+
+    finish_photo(name, photo_status, task.photo_variants)
@@ -0,0 +1,63 @@
+"""
+Full-text search over task titles and descriptions.
+
+On SQLite the search runs against the `tasks_task_fts` FTS5 index created by
+migration 0008, ranked with bm25 (title matches weigh more than description
+matches). Other databases fall back to a case-insensitive scan.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import Task
+
+FTS_TABLE = "tasks_task_fts"
+
+# bm25 weights of the indexed columns, in index order (title, description).
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+TERM_RE = re.compile(r"\w+")
+
+
+def search_terms(query):
+    """
+    Returns the words of a search query, ignoring punctuation and FTS5 syntax.
+    """
+    return TERM_RE.findall(query)
+
+
+def match_expression(terms):
+    """
+    Returns an FTS5 query matching tasks that contain every term.
+
+    Only the last term is matched as a word prefix, as it is the one still
+    being typed; prefixes of earlier terms would widen the set of rows to
+    rank for little benefit. Terms are quoted, so user input can never be read
+    as FTS5 operators.
+    """
+    return " ".join([*(f'"{term}"' for term in terms[:-1]), f'"{terms[-1]}"*'])
+
+
+def search_task_ids(query, limit):
+    """
+    Returns the ids of the best `limit` tasks matching `query`, best match first.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    if connection.vendor != "sqlite":
+        queryset = Task.objects.all()
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return list(queryset.order_by("id").values_list("id", flat=True)[:limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY bm25({FTS_TABLE}, %s, %s) LIMIT %s",
+            [match_expression(terms), TITLE_WEIGHT, DESCRIPTION_WEIGHT, limit],
+        )
+        return [row[0] for row in cursor.fetchall()]
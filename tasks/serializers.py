@@ -1,8 +1,14 @@
-import cv2
 import os
+from datetime import timezone as dt_timezone
 from rest_framework import serializers
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.images import get_image_dimensions
+from django.utils import timezone
+from .images import open_buffer, render_photo, variant_name
 from .models import Task
+from .photos import FINAL_STATUSES, acquire_photo, finish_photo, photo_digest, register_photo, release_photo
+from .processing import enqueue_photo
 
 class TaskSerializer(serializers.ModelSerializer):
     """
@@ -10,9 +16,12 @@ class TaskSerializer(serializers.ModelSerializer):
     Handles validation and image processing.
     """
 
+    photo_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = Task  
         fields = "__all__" 
+        read_only_fields = ("photo_status",)
 
     def validate_title(self, value):
         """
@@ -32,31 +41,127 @@ class TaskSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Description cannot exceed 500 characters.")
         return value
 
+    def get_photo_variants(self, task) -> dict[str, str]:
+        """
+        Returns the URLs of the photo derivatives, keyed by size in px.
+        """
+        request = self.context.get("request")
+        urls = {}
+        for size, name in task.photo_variants.items():
+            url = task.photo.storage.url(name)
+            urls[size] = request.build_absolute_uri(url) if request else url
+        return urls
+
+    def render_photo(self, source, name):
+        """
+        Renders the photo and each of `TASK_PHOTO_DERIVATIVE_SIZES` from a single decode.
+
+        `source` is either an uploaded file or a path on disk. Returns the encoded
+        photo followed by its derivatives, or None if the image could not be read.
+        """
+        sizes = [settings.TASK_PHOTO_MAX_SIZE, *settings.TASK_PHOTO_DERIVATIVE_SIZES]
+        with open_buffer(source) as buffer:
+            return render_photo(buffer, os.path.splitext(name)[1], sizes, get_image_dimensions(source))
+
+    def store_variants(self, name, rendered):
+        """
+        Saves the rendered derivatives next to the photo stored as `name`.
+
+        Returns their storage names, keyed by size in px.
+        """
+        storage = Task._meta.get_field("photo").storage
+        return {
+            str(size): storage.save(variant_name(name, size), ContentFile(data))
+            for size, data in zip(settings.TASK_PHOTO_DERIVATIVE_SIZES, rendered)
+        }
+
     def process_image(self, task):
         """
-        Processes the uploaded image:
+        Processes the stored image of a task:
         - Converts it to grayscale
-        - Resizes it while maintaining aspect ratio (max size: 800x800)
+        - Resizes it while maintaining aspect ratio (max size: `TASK_PHOTO_MAX_SIZE`)
         - Saves it back to the same location
+        - Replaces its derivatives (`TASK_PHOTO_DERIVATIVE_SIZES`)
+
+        Returns True if the image was processed, False if it could not be read.
         """
         if not task.photo:
-            return  
+            return False
 
-        image_path = os.path.join(settings.MEDIA_ROOT, task.photo.name)
-        img = cv2.imread(image_path)
+        image_path = task.photo.path
+        if not os.path.exists(image_path):
+            return False
 
-        if img is None:
-            return  
-        
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        rendered = self.render_photo(image_path, image_path)
+        if rendered is None:
+            return False
 
-        max_size = 800
-        height, width = gray.shape
-        scale = min(max_size / width, max_size / height)
-        new_size = (int(width * scale), int(height * scale))
-        resized = cv2.resize(gray, new_size, interpolation=cv2.INTER_AREA)
+        with open(image_path, "wb") as fh:
+            fh.write(rendered[0])
 
-        cv2.imwrite(image_path, resized)
+        for name in task.photo_variants.values():
+            task.photo.storage.delete(name)
+        task.photo_variants = self.store_variants(task.photo.name, rendered[1:])
+        return True
+
+    def store_photo(self, task, photo, digest):
+        """
+        Stores a photo that has not been uploaded before under its content digest.
+
+        The photo and its derivatives are rendered from the upload itself and
+        each is written to storage once. With `TASK_PHOTO_ASYNC` enabled the
+        original is stored as-is and left `pending` for the background workers.
+        Returns the stored photo and whether this call created it.
+        """
+        field = Task._meta.get_field("photo")
+        name = field.generate_filename(task, digest + os.path.splitext(photo.name)[1].lower())
+        variants = {}
+
+        if settings.TASK_PHOTO_ASYNC:
+            status = Task.PhotoStatus.PENDING
+            name = field.storage.save(name, photo)
+        else:
+            rendered = self.render_photo(photo, photo.name)
+            if rendered is None:
+                status = Task.PhotoStatus.FAILED
+                name = field.storage.save(name, photo)
+            else:
+                status = Task.PhotoStatus.DONE
+                name = field.storage.save(name, ContentFile(rendered[0]))
+                variants = self.store_variants(name, rendered[1:])
+
+        return register_photo(digest, name, variants, status)
+
+    def save_photo(self, task, photo):
+        """
+        Attaches an uploaded photo to the task.
+
+        Identical uploads share one stored photo, so a photo that was uploaded
+        before is reused without being processed again. New photos are
+        processed inline or, with `TASK_PHOTO_ASYNC` enabled, handed to the
+        background worker pool. A reused photo that is still unfinished is
+        queued again, in case its first job was lost (e.g. on a restart);
+        the worker skips photos that were already claimed.
+        """
+        digest = photo_digest(photo)
+        stored, created = acquire_photo(digest), False
+        if stored is None:
+            stored, created = self.store_photo(task, photo, digest)
+
+        task.photo.name = stored.name
+        task.photo_status = stored.status
+        task.photo_variants = stored.variants
+        task.save(update_fields=["photo", "photo_status", "photo_variants"])
+
+        if stored.status in FINAL_STATUSES:
+            return
+        if not created:
+            # The shared photo may have finished processing while the task was saved.
+            stored.refresh_from_db()
+            if stored.status in FINAL_STATUSES:
+                finish_photo(stored.name, stored.status, stored.variants)
+                return
+        enqueue_photo(stored.name)
 
     def create(self, validated_data):
         """
@@ -66,23 +171,144 @@ class TaskSerializer(serializers.ModelSerializer):
         task = Task.objects.create(**validated_data)
 
         if photo:
-            task.photo.save(photo.name, photo, save=False)
-            self.process_image(task)
+            self.save_photo(task, photo)
 
         return task
 
     def update(self, instance, validated_data):
         """
         Updates an existing task and reprocesses the image if updated.
+
+        The reference to a replaced or removed photo is released, also when
+        the same photo is uploaded again (attaching it took a new reference).
         """
-        photo = validated_data.get("photo", None)
+        previous_photo = instance.photo.name
+        photo = validated_data.pop("photo", None) if validated_data.get("photo") else None
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
+        if "photo" in validated_data:
+            instance.photo_status = None
+            instance.photo_variants = {}
+
         instance.save()
 
         if photo:
-            self.process_image(instance)  
+            self.save_photo(instance, photo)
+
+        if previous_photo and (photo or instance.photo.name != previous_photo):
+            release_photo(previous_photo)
 
         return instance
+
+
+class TaskRowSerializer:
+    """
+    Fast, read-only serializer for tasks fetched as `.values()` rows.
+
+    Produces the same representation as `TaskSerializer`, but skips building
+    model instances and running the per-field DRF machinery: every field maps
+    to one column plus an optional converter, resolved once per request.
+    Clients can ask for a subset of the fields (sparse fieldsets).
+    """
+
+    fields = ("id", "photo_variants", "title", "description", "due_date", "photo", "photo_status", "updated_at")
+
+    def __init__(self, fields=None, request=None):
+        if fields:
+            unknown = sorted(set(fields) - set(self.fields))
+            if unknown:
+                raise serializers.ValidationError({"fields": [f"Unknown fields: {', '.join(unknown)}."]})
+            self.fields = tuple(name for name in self.fields if name in fields)
+
+        self.request = request
+        self.storage = Task._meta.get_field("photo").storage
+        self.timezone = timezone.get_current_timezone()
+        # Datetimes come back from the database in UTC, so in a UTC time zone
+        # they only need to be formatted.
+        self.utc = timezone.get_current_timezone_name() == "UTC"
+        converters = {
+            "photo_variants": self.to_variant_urls,
+            "due_date": self.to_date,
+            "photo": self.to_photo_url,
+            "updated_at": self.to_datetime,
+        }
+        self.converters = [(name, converters.get(name)) for name in self.fields]
+
+    @classmethod
+    def from_request(cls, request, param="fields"):
+        """
+        Returns a row serializer for the comma-separated fields in the `param` query parameter.
+        """
+        fields = request.query_params.get(param, "")
+        return cls([name.strip() for name in fields.split(",") if name.strip()], request)
+
+    def select(self, queryset, *columns):
+        """
+        Returns the queryset as `.values()` rows with the requested fields and any extra `columns`.
+        """
+        return queryset.values(*dict.fromkeys([*self.fields, *columns]))
+
+    def to_representation(self, row):
+        """
+        Returns the representation of a single row.
+        """
+        return {name: convert(row[name]) if convert else row[name] for name, convert in self.converters}
+
+    def build_url(self, name):
+        """
+        Returns the (absolute, when serving a request) URL of a stored file.
+        """
+        url = self.storage.url(name)
+        return self.request.build_absolute_uri(url) if self.request else url
+
+    def to_photo_url(self, name):
+        return self.build_url(name) if name else None
+
+    def to_variant_urls(self, variants):
+        return {size: self.build_url(name) for size, name in variants.items()}
+
+    def to_date(self, value):
+        return value.isoformat() if value else None
+
+    def to_datetime(self, value):
+        if not value:
+            return None
+        if self.utc and value.tzinfo is dt_timezone.utc:
+            return value.isoformat()[:-6] + "Z"
+        value = value.astimezone(self.timezone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+class TaskBulkOperationSerializer(serializers.Serializer):
+    """
+    Serializer for a single operation of a bulk request.
+
+    - `create` requires `data`.
+    - `update` requires `id` and `data` (partial update).
+    - `delete` requires `id`.
+    """
+
+    ACTIONS = ("create", "update", "delete")
+
+    action = serializers.ChoiceField(choices=ACTIONS)
+    id = serializers.IntegerField(required=False)
+
+    def get_fields(self):
+        """
+        Adds the `data` field, which as a class attribute would shadow `Serializer.data`.
+        """
+        fields = super().get_fields()
+        fields["data"] = serializers.DictField(required=False)
+        return fields
+
+    def validate(self, attrs):
+        """
+        Ensures each action carries the fields it needs.
+        """
+        if attrs["action"] != "create" and "id" not in attrs:
+            raise serializers.ValidationError({"id": ["This field is required for update and delete."]})
+        if attrs["action"] != "delete" and "data" not in attrs:
+            raise serializers.ValidationError({"data": ["This field is required for create and update."]})
+        return attrs
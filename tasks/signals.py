@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_task_caches
+from .models import Task
+from .photos import release_photo
+
+
+@receiver(post_delete, sender=Task)
+def release_task_photo(sender, instance, **kwargs):
+    """
+    Releases the photo of a deleted task, deleting its files once unused.
+    """
+    if instance.photo:
+        release_photo(instance.photo.name)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_caches_on_write(sender, **kwargs):
+    """
+    Drops cached task reads whenever a task is saved or deleted.
+    """
+    invalidate_task_caches()
@@ -0,0 +1,136 @@
+import os
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from tasks.models import Task
+from tasks.tests.test_processing import encode_test_image
+from tasks.tests.test_views import TASK_PHOTOS_DIR
+
+
+@override_settings(ROOT_URLCONF="todolist.asgi_urls")
+class AsyncTaskViewsTestCase(TransactionTestCase):
+    """
+    Test cases for the async task views served under ASGI.
+
+    Writes run on the worker pool with their own database connection, so the
+    tests cannot be wrapped in a transaction.
+    """
+
+    databases = "__all__"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete test images and clean up the task_photos folder after all tests."""
+        super().tearDownClass()
+        if os.path.exists(TASK_PHOTOS_DIR):
+            for file in os.listdir(TASK_PHOTOS_DIR):
+                os.remove(os.path.join(TASK_PHOTOS_DIR, file))
+            os.rmdir(TASK_PHOTOS_DIR)
+
+    def setUp(self):
+        """Create tasks and a synchronous client to compare responses with."""
+        due_date = timezone.localdate() + timedelta(days=2)
+        self.task = Task.objects.create(title="Task 1", description="First", due_date=due_date)
+        Task.objects.create(title="Task 2")
+        self.sync_client = APIClient()
+
+    def sync_get(self, url, params=None, **headers):
+        """Helper method returning the response of the synchronous view."""
+        with override_settings(ROOT_URLCONF="todolist.urls"):
+            return self.sync_client.get(url, params, **headers)
+
+    def test_views_are_async(self):
+        """Test that the task endpoints resolve to async views under ASGI."""
+        for url in (reverse("task-list"), reverse("task-detail", args=[self.task.id]), reverse("nearest-deadline")):
+            self.assertTrue(resolve(url).func.view_class.view_is_async)
+        self.assertFalse(resolve(reverse("task-bulk")).func.view_class.view_is_async)
+
+    def test_asgi_settings_use_async_urls(self):
+        """Test that the ASGI settings differ from the default ones only in their URL configuration."""
+        from todolist import asgi_settings, settings
+        self.assertEqual(asgi_settings.ROOT_URLCONF, "todolist.asgi_urls")
+        self.assertEqual(settings.ROOT_URLCONF, "todolist.urls")
+        self.assertEqual(asgi_settings.DATABASES, settings.DATABASES)
+
+    async def test_reads_match_sync_views(self):
+        """Test that list, detail and nearest-deadline responses equal the synchronous ones."""
+        cases = [
+            (reverse("task-list"), {}),
+            (reverse("task-list"), {"fields": "id,title"}),
+            (reverse("task-list"), {"page_size": 1, "ordering": "due_date"}),
+            (reverse("task-list"), {"fields": "secret"}),
+            (reverse("task-detail", args=[self.task.id]), {}),
+            (reverse("task-detail", args=[0]), {}),
+            (reverse("nearest-deadline"), {}),
+        ]
+        for url, params in cases:
+            response = await self.async_client.get(url, params)
+            expected = await sync_to_async(self.sync_get)(url, params)
+            self.assertEqual(response.status_code, expected.status_code, url)
+            self.assertEqual(response.content, expected.content, url)
+
+    async def test_stream(self):
+        """Test that the streamed list equals the regular list."""
+        response = await self.async_client.get(reverse("task-list"), {"stream": "true"})
+        streamed = b"".join([chunk async for chunk in response.streaming_content])
+        expected = await sync_to_async(self.sync_get)(reverse("task-list"))
+        self.assertEqual(streamed, expected.content)
+
+    async def test_conditional_get(self):
+        """Test that a matching If-None-Match is answered with 304."""
+        url = reverse("task-detail", args=[self.task.id])
+        etag = (await self.async_client.get(url))["ETag"]
+        response = await self.async_client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_create_with_photo(self):
+        """Test creating a task with a photo, which is processed off the event loop."""
+        photo = SimpleUploadedFile("photo.png", encode_test_image(1600, 1200, ".png"), content_type="image/png")
+        response = await self.async_client.post(reverse("task-list"), {"title": "Upload", "photo": photo})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual(data["photo_status"], Task.PhotoStatus.DONE)
+        self.assertEqual(sorted(data["photo_variants"], key=int), ["64", "256"])
+        self.assertTrue(await Task.objects.filter(pk=data["id"], photo_status=Task.PhotoStatus.DONE).aexists())
+
+    async def test_create_invalid(self):
+        """Test that validation errors are returned like the synchronous view does."""
+        response = await self.async_client.post(reverse("task-list"), {"title": "x" * 101}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {"title": ["Ensure this field has no more than 100 characters."]})
+
+    async def test_writes_skip_photo_pool(self):
+        """Test that writes neither queue on the photo worker pool nor drop persistent connections."""
+        url = reverse("task-detail", args=[self.task.id])
+        with mock.patch("tasks.processing.get_executor") as get_executor, \
+                mock.patch.object(connections, "close_all") as close_all:
+            response = await self.async_client.patch(url, {"title": "Renamed"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        get_executor.assert_not_called()
+        close_all.assert_not_called()
+
+    async def test_update_and_delete(self):
+        """Test updating and deleting a task."""
+        url = reverse("task-detail", args=[self.task.id])
+        response = await self.async_client.patch(url, {"title": "Renamed"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["title"], "Renamed")
+
+        response = await self.async_client.put(url, {"title": "Replaced"}, content_type="application/json")
+        self.assertEqual(response.json()["title"], "Replaced")
+
+        response = await self.async_client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(await Task.objects.filter(pk=self.task.id).aexists())
+
+        response = await self.async_client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,255 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import cv2
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tasks.models import StoredPhoto, Task
+from tasks.tests.test_processing import encode_test_image
+from tasks.tests.test_views import TASK_PHOTOS_DIR
+
+
+class ReprocessPhotosCommandTestCase(APITestCase):
+    """Test cases for the reprocess_photos management command."""
+
+    def setUp(self):
+        """Create two tasks sharing a photo and one task with its own photo."""
+        image = encode_test_image(1600, 1200, ".png")
+        self.shared = [self.upload("Shared 1", image), self.upload("Shared 2", image)]
+        self.single = self.upload("Single", encode_test_image(1200, 1600, ".png"))
+
+    def upload(self, title, content):
+        """Helper method to create a task with a photo through the API."""
+        photo = SimpleUploadedFile("photo.png", content, content_type="image/png")
+        response = self.client.post(reverse("task-list"), {"title": title, "photo": photo}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Task.objects.get(pk=response.data["id"])
+
+    def run_command(self, **options):
+        """Helper method to run the command and return its output."""
+        out = StringIO()
+        call_command("reprocess_photos", workers=1, stdout=out, **options)
+        return out.getvalue()
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400, TASK_PHOTO_DERIVATIVE_SIZES=(32,))
+    def test_reprocess_with_new_settings(self):
+        """Test that every distinct photo is reprocessed once and tasks get the new derivatives."""
+        output = self.run_command()
+
+        self.assertIn("Reprocessed 2 photos of 3 tasks", output)
+        task = Task.objects.get(pk=self.shared[1].pk)
+        self.assertEqual(cv2.imread(task.photo.path, cv2.IMREAD_UNCHANGED).shape, (300, 400))
+        self.assertEqual(set(task.photo_variants), {"32"})
+        self.assertEqual(StoredPhoto.objects.get(name=task.photo.name).variants, task.photo_variants)
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400)
+    def test_dry_run_changes_nothing(self):
+        """Test that a dry run only reports the photos it would reprocess."""
+        output = self.run_command(dry_run=True)
+
+        self.assertIn("Would reprocess 2 photos of 3 tasks", output)
+        self.assertEqual(cv2.imread(self.single.photo.path, cv2.IMREAD_UNCHANGED).shape, (800, 600))
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400)
+    def test_resume_from_checkpoint(self):
+        """Test that tasks up to the checkpointed id are skipped and the checkpoint is removed."""
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.json")
+            with open(checkpoint, "w") as fh:
+                json.dump({"last_id": self.shared[1].pk}, fh)
+
+            output = self.run_command(checkpoint=checkpoint)
+
+            self.assertIn(f"Resuming after task {self.shared[1].pk}", output)
+            self.assertIn("Reprocessed 1 photos of 1 tasks", output)
+            self.assertFalse(os.path.exists(checkpoint))
+        self.assertEqual(cv2.imread(self.shared[0].photo.path, cv2.IMREAD_UNCHANGED).shape, (600, 800))
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400)
+    def test_resume_skips_checkpointed_photos(self):
+        """Test that a photo shared across the checkpoint is not processed again after resuming."""
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.json")
+            with open(checkpoint, "w") as fh:
+                json.dump({"last_id": self.shared[0].pk, "photos": [self.shared[0].photo.name]}, fh)
+
+            output = self.run_command(checkpoint=checkpoint)
+
+        self.assertIn("Reprocessed 1 photos of 2 tasks", output)
+        self.assertEqual(cv2.imread(self.shared[1].photo.path, cv2.IMREAD_UNCHANGED).shape, (600, 800))
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400)
+    def test_checkpoint_records_processed_photos(self):
+        """Test that the checkpoint holds the last task id and every photo processed so far."""
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.json")
+            with mock.patch("os.remove"):
+                self.run_command(checkpoint=checkpoint, chunk_size=2)
+            with open(checkpoint) as fh:
+                recorded = json.load(fh)
+
+        self.assertEqual(recorded["last_id"], self.single.pk)
+        self.assertEqual(recorded["photos"], sorted({self.shared[0].photo.name, self.single.photo.name}))
+
+    @override_settings(TASK_PHOTO_MAX_SIZE=400)
+    def test_reprocess_in_process_pool(self):
+        """Test that worker processes produce the same result as inline reprocessing."""
+        out = StringIO()
+        call_command("reprocess_photos", workers=2, chunk_size=1, stdout=out)
+
+        self.assertIn("Reprocessed 2 photos of 3 tasks", out.getvalue())
+        self.assertEqual(cv2.imread(self.single.photo.path, cv2.IMREAD_UNCHANGED).shape, (400, 300))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete test images and clean up the task_photos folder after all tests."""
+        super().tearDownClass()
+        if os.path.exists(TASK_PHOTOS_DIR):
+            for file in os.listdir(TASK_PHOTOS_DIR):
+                os.remove(os.path.join(TASK_PHOTOS_DIR, file))
+            os.rmdir(TASK_PHOTOS_DIR)
+
+
+class SeedTasksCommandTestCase(APITestCase):
+    """Test cases for the seed_tasks management command."""
+
+    def run_command(self, **options):
+        """Helper method to run the command with small photos and return its output."""
+        out = StringIO()
+        call_command("seed_tasks", photo_size=[400, 300], stdout=out, **options)
+        return out.getvalue()
+
+    def test_seed_tasks_in_batches(self):
+        """Test that the requested number of tasks is created over several batches."""
+        output = self.run_command(count=25, batch_size=10, seed=1)
+
+        self.assertIn("Created 25 tasks (0 with one of 0 photos)", output)
+        self.assertEqual(Task.objects.count(), 25)
+        self.assertTrue(all(task.title for task in Task.objects.all()))
+
+    def test_due_date_distributions(self):
+        """Test that due dates follow the requested distribution and undated fraction."""
+        today = timezone.localdate()
+        self.run_command(count=50, due_dates="overdue", due_days=30, undated_fraction=0, seed=1)
+        self.assertTrue(all(today - timedelta(days=30) <= task.due_date < today for task in Task.objects.all()))
+
+        Task.objects.all().delete()
+        self.run_command(count=50, due_dates="upcoming", due_days=30, undated_fraction=0, seed=1)
+        self.assertTrue(all(today <= task.due_date <= today + timedelta(days=30) for task in Task.objects.all()))
+
+        Task.objects.all().delete()
+        self.run_command(count=50, due_dates="none", seed=1)
+        self.assertFalse(Task.objects.filter(due_date__isnull=False).exists())
+
+    def test_same_seed_gives_same_tasks(self):
+        """Test that seeding twice with the same seed creates the same tasks."""
+        self.run_command(count=20, seed=7)
+        first = list(Task.objects.order_by("id").values_list("title", "description", "due_date"))
+        Task.objects.all().delete()
+        self.run_command(count=20, seed=7)
+
+        self.assertEqual(list(Task.objects.order_by("id").values_list("title", "description", "due_date")), first)
+
+    def test_seeded_photos_are_processed_and_shared(self):
+        """Test that generated photos are processed once and shared by reference."""
+        output = self.run_command(count=20, photo_fraction=1, distinct_photos=2, seed=1)
+
+        self.assertIn("Created 20 tasks (20 with one of 2 photos)", output)
+        self.assertEqual(StoredPhoto.objects.count(), 2)
+        for stored in StoredPhoto.objects.all():
+            self.assertEqual(stored.status, Task.PhotoStatus.DONE)
+            self.assertEqual(stored.ref_count, Task.objects.filter(photo=stored.name).count())
+            task = Task.objects.filter(photo=stored.name).first()
+            self.assertEqual(task.photo_variants, stored.variants)
+            self.assertEqual(cv2.imread(task.photo.path, cv2.IMREAD_UNCHANGED).shape, (600, 800))
+
+        # The same seed generates the same photos, which are reused.
+        self.run_command(count=20, photo_fraction=1, distinct_photos=2, seed=1)
+        self.assertEqual(StoredPhoto.objects.count(), 2)
+        self.assertEqual(sum(StoredPhoto.objects.values_list("ref_count", flat=True)), 40)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete test images and clean up the task_photos folder after all tests."""
+        super().tearDownClass()
+        if os.path.exists(TASK_PHOTOS_DIR):
+            for file in os.listdir(TASK_PHOTOS_DIR):
+                os.remove(os.path.join(TASK_PHOTOS_DIR, file))
+            os.rmdir(TASK_PHOTOS_DIR)
+
+
+class BenchmarkApiCommandTestCase(TransactionTestCase):
+    """
+    Test cases for the benchmark_api management command.
+
+    Requests are sent from other threads with their own database connections,
+    so the tests cannot be wrapped in a transaction. The in-memory test
+    database fails concurrent writes instead of waiting for the lock, so
+    mixes with writes run a single client thread.
+    """
+
+    databases = "__all__"
+
+    def setUp(self):
+        """Seed a few tasks to request."""
+        call_command("seed_tasks", count=30, seed=1, stdout=StringIO())
+
+    def run_command(self, **options):
+        """Helper method to run a short benchmark and return its output."""
+        out = StringIO()
+        options = {"seconds": 0.5, "concurrency": 1, "host": "testserver", "seed": 1, **options}
+        call_command("benchmark_api", stdout=out, **options)
+        return out.getvalue()
+
+    def test_every_endpoint_is_measured(self):
+        """Test that each endpoint of the mix is requested and reported without errors."""
+        output = self.run_command()
+
+        for endpoint in ("list", "detail", "create", "nearest"):
+            self.assertRegex(output, rf"\n{endpoint} +[1-9]")
+        self.assertIn("No errors.", output)
+
+    def test_created_tasks_are_deleted(self):
+        """Test that the tasks created by the benchmark are deleted afterwards."""
+        self.run_command(mix="create=1")
+
+        self.assertEqual(Task.objects.count(), 30)
+
+    def test_results_written_as_json(self):
+        """Test that the results are written to the output file with latency percentiles."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            self.run_command(mix="detail=1,nearest=0", concurrency=2, output=path)
+            with open(path) as fh:
+                results = json.load(fh)
+
+        self.assertEqual(set(results["endpoints"]), {"detail"})
+        detail = results["endpoints"]["detail"]
+        self.assertEqual(detail["errors"], 0)
+        self.assertLessEqual(detail["p50"], detail["p95"])
+        self.assertLessEqual(detail["p95"], detail["p99"])
+        self.assertLessEqual(detail["p99"], detail["max"])
+
+    def test_failed_requests_are_counted(self):
+        """Test that requests answered with an error status are reported as errors."""
+        output = self.run_command(mix="list=1", host="not-allowed.example")
+
+        self.assertRegex(output, r"\d+ x list: HTTP 400")
+        self.assertNotIn("No errors.", output)
+
+    def test_invalid_mix(self):
+        """Test that unknown endpoints and all-zero weights are rejected."""
+        with self.assertRaisesMessage(CommandError, "Unknown endpoint 'search'"):
+            self.run_command(mix="search=1")
+        with self.assertRaisesMessage(CommandError, "at least one endpoint"):
+            self.run_command(mix="list=0")
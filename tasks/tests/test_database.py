@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.db import connection, router, transaction
+from django.test import TestCase
+
+from tasks.models import Task
+
+
+class ReadReplicaRouterTestCase(TestCase):
+    """Test cases for the read/write database routing."""
+
+    def test_reads_go_to_replica(self):
+        """Test that reads outside a transaction use the read-only alias."""
+        # TestCase wraps every test in a transaction, so pretend there is none.
+        with mock.patch.object(connection, "in_atomic_block", False):
+            self.assertEqual(router.db_for_read(Task), "replica")
+        self.assertEqual(router.db_for_write(Task), "default")
+
+    def test_reads_in_transaction_stay_on_default(self):
+        """Test that reads inside a transaction stay on default to see its own writes."""
+        with transaction.atomic():
+            self.assertEqual(router.db_for_read(Task), "default")
+
+    def test_migrations_only_on_default(self):
+        """Test that the read-only alias is never migrated."""
+        self.assertTrue(router.allow_migrate("default", "tasks"))
+        self.assertFalse(router.allow_migrate("replica", "tasks"))
+
+    def test_connection_pragmas(self):
+        """Test that every connection is configured by the init command."""
+        with connection.cursor() as cursor:
+            self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(cursor.execute("PRAGMA temp_store").fetchone()[0], 2)
+            self.assertEqual(cursor.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
@@ -0,0 +1,110 @@
+import io
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from uuid import UUID
+
+import numpy as np
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from tasks.models import Task
+from tasks.serializers import TaskSerializer
+from todolist import parsers, renderers
+from todolist.parsers import FastJSONParser
+from todolist.renderers import FastJSONRenderer
+
+
+class FastJSONTestCase(TestCase):
+    """Test cases for the orjson-backed JSON renderer and parser."""
+
+    def compatibility_cases(self):
+        """Helper returning data covering the types the API renders."""
+        Task.objects.create(title="Tâche  \"1\"", description="Line\nbreak\t\x00\x7f 😀", due_date=date(2025, 1, 2))
+        request = APIRequestFactory().get("/")
+        tasks = TaskSerializer(Task.objects.all(), many=True, context={"request": request}).data
+        return [
+            tasks,
+            {"count": 2, "next": None, "results": tasks},
+            {
+                "datetime": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+                "naive": datetime(2025, 1, 2, 3, 4, 5),
+                "date": date(2025, 1, 2),
+                "time": time(3, 4, 5, 123456),
+                "timedelta": timedelta(hours=1, microseconds=5),
+                "decimal": Decimal("1.50"),
+                "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+                "lazy": gettext_lazy("Not found."),
+                "error": [ErrorDetail("This field is required.", code="required")],
+                "numbers": [0, -1, 2 ** 63 - 1, 1.5, 0.1, True, False, None],
+                "mapping": {1: 6, 2: 5},
+                "array": np.arange(5),
+                "matrix": np.arange(6).reshape(2, 3)[:, ::2],
+                "scalar": np.int64(7),
+                "tuple": (1, "a"),
+            },
+            {"big": 2 ** 70},
+            [],
+            "text",
+        ]
+
+    def test_renders_same_bytes(self):
+        """Test that the output is byte-for-byte identical to DRF's JSONRenderer."""
+        for data in self.compatibility_cases():
+            self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_indent_falls_back(self):
+        """Test that indented output is delegated to DRF's JSONRenderer."""
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=4"
+        self.assertEqual(FastJSONRenderer().render(data, media_type), JSONRenderer().render(data, media_type))
+
+    def test_without_orjson(self):
+        """Test the pure-Python fallback when orjson is not installed."""
+        data = self.compatibility_cases()[0]
+        with mock.patch.object(renderers, "orjson", None), mock.patch.object(parsers, "orjson", None):
+            body = FastJSONRenderer().render(data)
+            self.assertEqual(body, JSONRenderer().render(data))
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+
+    def test_parses_same_data(self):
+        """Test that parsing returns the same data as DRF's JSONParser."""
+        for body in (b'{"nums": [1, -2, 3], "k": 1}', '{"t": "é\\u00e9😀", "f": 1.5e3}'.encode(), b'[18446744073709551616, 1]', b"null"):
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+
+    def test_parses_integers_beyond_int64(self):
+        """Test that integers at the edges of orjson's integer range are parsed exactly."""
+        for number in (-2 ** 63 - 1, -2 ** 63, 2 ** 63 - 1, 2 ** 63, 2 ** 64 - 1, 2 ** 64, -10 ** 30):
+            body = f'{{"nums": [{number}, 1]}}'.encode()
+            data = FastJSONParser().parse(io.BytesIO(body))
+            self.assertEqual(data, JSONParser().parse(io.BytesIO(body)))
+            self.assertIs(type(data["nums"][0]), int)
+
+    def test_parse_errors(self):
+        """Test that invalid JSON gets DRF's error message."""
+        for body in (b'{"a": ', b"[NaN]", b"\xff"):
+            with self.assertRaises(ParseError) as expected:
+                JSONParser().parse(io.BytesIO(body))
+            with self.assertRaises(ParseError) as error:
+                FastJSONParser().parse(io.BytesIO(body))
+            self.assertEqual(str(error.exception), str(expected.exception))
+
+    def test_api_uses_fast_json(self):
+        """Test that the API renders and parses with the fast JSON classes by default."""
+        response = self.client.post(reverse("task-list"), {"title": "New"}, format="json")
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_api_accepts_integers_below_int64(self):
+        """Test that integers below -2**63 are accepted by the leetcode endpoints, as with JSONParser."""
+        data = {"nums": [-2 ** 63 - 1, 1, 2], "k": 1}
+        response = self.client.post(reverse("kth-largest"), data, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["result"], 2)
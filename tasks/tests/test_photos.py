@@ -0,0 +1,126 @@
+import os
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tasks.models import StoredPhoto, Task
+from tasks.processing import process_stored_photo
+from tasks.serializers import TaskSerializer
+from tasks.tests.test_processing import encode_test_image
+from tasks.tests.test_views import TASK_PHOTOS_DIR
+
+
+class DeduplicatedPhotoTestCase(APITestCase):
+    """Test cases for content-addressed, reference-counted photo storage."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Encode one image shared by all tests."""
+        cls.image = encode_test_image(400, 300, ".png")
+        cls.other_image = encode_test_image(300, 400, ".png")
+        cls.url = reverse("task-list")
+
+    def upload(self, title, content=None, name="photo.png"):
+        """Helper method to create a task with a photo."""
+        photo = SimpleUploadedFile(name, content or self.image, content_type="image/png")
+        response = self.client.post(self.url, {"title": title, "photo": photo}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Task.objects.get(pk=response.data["id"])
+
+    def test_identical_uploads_share_one_file(self):
+        """Test that the same image uploaded twice is processed once and stored once."""
+        first = self.upload("First")
+        with mock.patch.object(TaskSerializer, "render_photo", wraps=TaskSerializer().render_photo) as render:
+            second = self.upload("Second", name="renamed.png")
+
+        render.assert_not_called()
+        self.assertEqual(first.photo.name, second.photo.name)
+        self.assertEqual(first.photo_variants, second.photo_variants)
+        self.assertEqual(second.photo_status, Task.PhotoStatus.DONE)
+        self.assertEqual(StoredPhoto.objects.get(name=first.photo.name).ref_count, 2)
+
+    def test_files_deleted_with_last_reference(self):
+        """Test that shared files survive until the last task using them is deleted."""
+        first = self.upload("First")
+        second = self.upload("Second")
+        paths = [first.photo.path] + [first.photo.storage.path(name) for name in first.photo_variants.values()]
+
+        self.client.delete(reverse("task-detail", kwargs={"pk": first.id}))
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("task-detail", kwargs={"pk": second.id}))
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+        self.assertFalse(StoredPhoto.objects.exists())
+
+    def test_replacing_photo_releases_previous(self):
+        """Test that uploading a new photo drops the reference to the old one."""
+        task = self.upload("Replace")
+        previous = task.photo.name
+        photo = SimpleUploadedFile("other.png", self.other_image, content_type="image/png")
+
+        response = self.client.patch(reverse("task-detail", kwargs={"pk": task.id}), {"photo": photo}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(StoredPhoto.objects.filter(name=previous).exists())
+        self.assertEqual(StoredPhoto.objects.get().ref_count, 1)
+
+    def test_reuploading_same_photo_keeps_one_reference(self):
+        """Test that uploading the same photo again does not leak a reference."""
+        task = self.upload("Reupload")
+        paths = [task.photo.path] + [task.photo.storage.path(name) for name in task.photo_variants.values()]
+        photo = SimpleUploadedFile("photo.png", self.image, content_type="image/png")
+
+        response = self.client.put(
+            reverse("task-detail", kwargs={"pk": task.id}), {"title": "Reupload", "photo": photo}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(StoredPhoto.objects.get(name=task.photo.name).ref_count, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("task-detail", kwargs={"pk": task.id}))
+        self.assertFalse(StoredPhoto.objects.exists())
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+
+    @override_settings(TASK_PHOTO_ASYNC=True)
+    def test_pending_photo_shared_by_later_upload(self):
+        """Test that tasks sharing a pending photo all receive the processing outcome."""
+        first = self.upload("First")
+        second = self.upload("Second")
+        self.assertEqual(second.photo_status, Task.PhotoStatus.PENDING)
+
+        process_stored_photo(first.photo.name)
+
+        second.refresh_from_db()
+        self.assertEqual(second.photo_status, Task.PhotoStatus.DONE)
+        self.assertEqual(set(second.photo_variants), {"64", "256"})
+
+    @override_settings(TASK_PHOTO_ASYNC=True)
+    def test_pending_photo_processed_after_first_task_deleted(self):
+        """Test that a pending photo is still processed when the task that queued it is deleted."""
+        first = self.upload("First")
+        with mock.patch("tasks.serializers.enqueue_photo") as enqueue:
+            second = self.upload("Second")
+        enqueue.assert_called_once_with(first.photo.name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("task-detail", kwargs={"pk": first.id}))
+        process_stored_photo(second.photo.name)
+
+        second.refresh_from_db()
+        self.assertEqual(second.photo_status, Task.PhotoStatus.DONE)
+        self.assertEqual(StoredPhoto.objects.get(name=second.photo.name).status, Task.PhotoStatus.DONE)
+        self.assertEqual(self.upload("Third").photo_status, Task.PhotoStatus.DONE)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete test images and clean up the task_photos folder after all tests."""
+        super().tearDownClass()
+        if os.path.exists(TASK_PHOTOS_DIR):
+            for file in os.listdir(TASK_PHOTOS_DIR):
+                os.remove(os.path.join(TASK_PHOTOS_DIR, file))
+            os.rmdir(TASK_PHOTOS_DIR)
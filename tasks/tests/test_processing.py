@@ -0,0 +1,138 @@
+import os
+
+import cv2
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tasks.images import decode_grayscale, process_photo, render_photo
+from tasks.models import Task
+from tasks.processing import process_stored_photo
+from tasks.tests.test_views import TASK_PHOTOS_DIR, create_temp_image
+
+
+def encode_test_image(width, height, extension=".jpg"):
+    """Helper function to encode a random color image of the given size."""
+    image = np.random.randint(0, 256, (height, width, 3), dtype="uint8")
+    return cv2.imencode(extension, image)[1].tobytes()
+
+
+class PhotoPipelineTestCase(APITestCase):
+    """Test cases for the in-memory OpenCV pipeline."""
+
+    def test_large_photo_is_decoded_at_reduced_scale(self):
+        """Test that a photo far above the target size is decoded already downscaled."""
+        data = encode_test_image(4000, 3000)
+        gray = decode_grayscale(data, 800, (4000, 3000))
+        self.assertEqual(gray.shape, (750, 1000))
+
+    def test_small_photo_is_decoded_at_full_scale(self):
+        """Test that reduced decoding never goes below the target size."""
+        data = encode_test_image(1200, 900)
+        gray = decode_grayscale(data, 800, (1200, 900))
+        self.assertEqual(gray.shape, (900, 1200))
+
+    def test_process_photo_output(self):
+        """Test that the pipeline produces a grayscale image that fits in the target size."""
+        processed = process_photo(encode_test_image(4000, 3000, ".png"), ".png", 800, (4000, 3000))
+        image = cv2.imdecode(np.frombuffer(processed, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        self.assertEqual(image.shape, (600, 800))
+
+    def test_render_photo_sizes(self):
+        """Test that all requested sizes are rendered from one decode, in the requested order."""
+        rendered = render_photo(encode_test_image(1000, 500, ".png"), ".png", [800, 64, 256])
+        shapes = [cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED).shape for data in rendered]
+        self.assertEqual(shapes, [(400, 800), (32, 64), (128, 256)])
+
+    def test_process_photo_invalid_data(self):
+        """Test that undecodable data yields None instead of raising."""
+        self.assertIsNone(process_photo(b"Not an image", ".jpg", 800))
+
+
+class PhotoProcessingTestCase(APITestCase):
+    """Test cases for inline and background photo processing."""
+
+    def setUp(self):
+        """Define the URL for the task list endpoint."""
+        self.url = reverse("task-list")
+
+    def test_inline_processing_marks_photo_done(self):
+        """Test that synchronous processing stores the photo and marks it as done."""
+        data = {"title": "Inline", "photo": create_temp_image()}
+        response = self.client.post(self.url, data, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["photo_status"], Task.PhotoStatus.DONE)
+        task = Task.objects.get(pk=response.data["id"])
+        self.assertTrue(task.photo)
+
+    def test_inline_processing_resizes_stored_photo(self):
+        """Test that the stored file is the processed grayscale image."""
+        photo = SimpleUploadedFile("large.png", encode_test_image(1600, 1200, ".png"), content_type="image/png")
+        response = self.client.post(self.url, {"title": "Large", "photo": photo}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = Task.objects.get(pk=response.data["id"])
+        stored = cv2.imread(task.photo.path, cv2.IMREAD_UNCHANGED)
+        self.assertEqual(stored.shape, (600, 800))
+
+    def test_inline_processing_renders_derivatives(self):
+        """Test that each configured derivative is stored and exposed as a URL."""
+        photo = SimpleUploadedFile("thumbs.png", encode_test_image(1600, 1200, ".png"), content_type="image/png")
+        response = self.client.post(self.url, {"title": "Thumbs", "photo": photo}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(set(response.data["photo_variants"]), {"64", "256"})
+        self.assertTrue(response.data["photo_variants"]["64"].startswith("http://testserver/"))
+
+        task = Task.objects.get(pk=response.data["id"])
+        thumbnail = cv2.imread(task.photo.storage.path(task.photo_variants["64"]), cv2.IMREAD_UNCHANGED)
+        self.assertEqual(thumbnail.shape, (48, 64))
+
+    @override_settings(TASK_PHOTO_ASYNC=True)
+    def test_async_processing_returns_pending(self):
+        """Test that async mode returns a pending task and the worker completes it."""
+        data = {"title": "Queued", "photo": create_temp_image()}
+        response = self.client.post(self.url, data, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["photo_status"], Task.PhotoStatus.PENDING)
+
+        task = Task.objects.get(pk=response.data["id"])
+        process_stored_photo(task.photo.name)
+        task.refresh_from_db()
+        self.assertEqual(task.photo_status, Task.PhotoStatus.DONE)
+        self.assertEqual(set(task.photo_variants), {"64", "256"})
+
+    def test_worker_marks_unreadable_photo_failed(self):
+        """Test that a photo OpenCV cannot read ends up as failed."""
+        task = Task.objects.create(title="Broken", photo="task_photos/missing.jpg", photo_status=Task.PhotoStatus.PENDING)
+        process_stored_photo(task.photo.name)
+        task.refresh_from_db()
+        self.assertEqual(task.photo_status, Task.PhotoStatus.FAILED)
+
+    def test_worker_skips_claimed_task(self):
+        """Test that a photo which is not pending is left untouched."""
+        task = Task.objects.create(title="Done", photo="task_photos/missing.jpg", photo_status=Task.PhotoStatus.DONE)
+        process_stored_photo(task.photo.name)
+        task.refresh_from_db()
+        self.assertEqual(task.photo_status, Task.PhotoStatus.DONE)
+
+    def test_photo_status_is_read_only(self):
+        """Test that clients cannot set photo_status directly."""
+        data = {"title": "Sneaky", "photo_status": Task.PhotoStatus.DONE}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNone(response.data["photo_status"])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete test images and clean up the task_photos folder after all tests."""
+        super().tearDownClass()
+        if os.path.exists(TASK_PHOTOS_DIR):
+            for file in os.listdir(TASK_PHOTOS_DIR):
+                os.remove(os.path.join(TASK_PHOTOS_DIR, file))
+            os.rmdir(TASK_PHOTOS_DIR)
@@ -1,13 +1,20 @@
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 from tasks.models import Task
+from tasks.serializers import TaskSerializer
+from tasks.views import TaskListCreateView
 from datetime import timedelta
+from unittest import mock
 from django.utils import timezone
+import json
 import os
 import cv2
 import numpy as np
 from django.conf import settings
+from django.db import connection
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 
@@ -253,3 +260,484 @@ class NearestDeadlineTaskViewTestCase(APITestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertNotEqual(response.data[0]["title"], "Past Task")
+
+
+class TaskListPaginationTestCase(APITestCase):
+    """Test cases for the opt-in keyset pagination of the task list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create tasks with shared, distinct and missing due dates."""
+        due_dates = ["2025-07-01", None, "2025-06-01", "2025-07-01", None, "2025-05-01"]
+        cls.tasks = [Task.objects.create(title=f"Task {i}", due_date=due) for i, due in enumerate(due_dates)]
+        cls.url = reverse("task-list")
+
+    def collect_pages(self, params):
+        """Helper method to follow `next` links and collect the ids of every page."""
+        response = self.client.get(self.url, params)
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([task["id"] for task in response.data["results"]])
+            if not response.data["next"]:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    def test_unpaginated_by_default(self):
+        """Test that the list stays a plain array when no pagination parameter is given."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(self.tasks))
+
+    def test_paginate_by_id(self):
+        """Test that pages ordered by id cover every task exactly once."""
+        pages = self.collect_pages({"page_size": 4})
+        ids = [task.id for task in self.tasks]
+        self.assertEqual(pages, [ids[:4], ids[4:]])
+
+    def test_paginate_by_due_date(self):
+        """Test that due_date pages list dated tasks by (due_date, id) and then undated tasks."""
+        pages = self.collect_pages({"page_size": 2, "ordering": "due_date"})
+        t = self.tasks
+        self.assertEqual(pages, [[t[5].id, t[2].id], [t[0].id, t[3].id], [t[1].id, t[4].id]])
+
+    def test_page_boundary_inside_ties(self):
+        """Test that tasks sharing a due date are not skipped at a page boundary."""
+        pages = self.collect_pages({"page_size": 3, "ordering": "due_date"})
+        self.assertEqual([task_id for page in pages for task_id in page], [self.tasks[i].id for i in (5, 2, 0, 3, 1, 4)])
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor returns 404."""
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_ordering(self):
+        """Test that an unknown ordering returns 400."""
+        response = self.client.get(self.url, {"page_size": 2, "ordering": "title"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskListStreamingTestCase(APITestCase):
+    """Test cases for the streaming mode of the task list."""
+
+    def setUp(self):
+        """Define the URL for the task list endpoint."""
+        self.url = reverse("task-list")
+
+    def test_stream_matches_regular_list(self):
+        """Test that the streamed array is byte-for-byte the regular list response."""
+        for i in range(5):
+            Task.objects.create(title=f"Task {i}", description="Ünïcode", due_date="2025-06-01" if i % 2 else None)
+
+        regular = self.client.get(self.url, HTTP_ACCEPT="application/json")
+        with mock.patch.object(TaskListCreateView, "stream_chunk_size", 2):
+            streamed = self.client.get(self.url, {"stream": "true"})
+
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed["Content-Type"], "application/json")
+        self.assertEqual(b"".join(streamed.streaming_content), regular.content)
+
+    def test_stream_empty_list(self):
+        """Test that streaming an empty table yields an empty array."""
+        response = self.client.get(self.url, {"stream": "true"})
+        self.assertEqual(b"".join(response.streaming_content), b"[]")
+
+
+class TaskListFieldsTestCase(APITestCase):
+    """Test cases for the lean read path and sparse fieldsets of the task list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create tasks with and without due dates and photos."""
+        Task.objects.create(title="Plain", description=None)
+        Task.objects.create(
+            title="With photo",
+            description="Ünïcode",
+            due_date="2025-06-01",
+            photo="task_photos/abc.jpg",
+            photo_status=Task.PhotoStatus.DONE,
+            photo_variants={"64": "task_photos/abc_64.jpg", "256": "task_photos/abc_256.jpg"},
+        )
+        cls.url = reverse("task-list")
+
+    def test_matches_task_serializer(self):
+        """Test that the lean list is identical to the TaskSerializer output."""
+        response = self.client.get(self.url)
+        request = Request(APIRequestFactory().get(self.url))
+        expected = TaskSerializer(Task.objects.all(), many=True, context={"request": request}).data
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+        self.assertEqual(response.data[1]["photo"], "http://testserver/task_photos/abc.jpg")
+
+    def test_single_query(self):
+        """Test that listing tasks runs a single query, besides reading the change version."""
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_sparse_fields(self):
+        """Test that only the requested fields are returned, in the usual order."""
+        response = self.client.get(self.url, {"fields": "due_date,id,title"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data[1]), ["id", "title", "due_date"])
+        self.assertEqual(response.data[1]["due_date"], "2025-06-01")
+
+    def test_sparse_fields_with_pagination_and_streaming(self):
+        """Test that sparse fieldsets combine with pagination and streaming."""
+        response = self.client.get(self.url, {"fields": "title", "page_size": 1, "ordering": "due_date"})
+        self.assertEqual(response.data["results"], [{"title": "With photo"}])
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["results"], [{"title": "Plain"}])
+
+        streamed = self.client.get(self.url, {"fields": "title", "stream": "true"})
+        self.assertEqual(b"".join(streamed.streaming_content), b'[{"title":"Plain"},{"title":"With photo"}]')
+
+    def test_unknown_field(self):
+        """Test that requesting an unknown field returns 400."""
+        response = self.client.get(self.url, {"fields": "id,secret"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.data)
+
+
+class TaskBulkViewTestCase(APITestCase):
+    """Test cases for the bulk create/update/delete endpoint."""
+
+    def setUp(self):
+        """Create tasks to update and delete."""
+        self.task1 = Task.objects.create(title="Task 1", due_date="2025-06-01")
+        self.task2 = Task.objects.create(title="Task 2")
+        self.url = reverse("task-bulk")
+
+    def test_bulk_operations(self):
+        """Test that creates, updates and deletes are applied and reported in order."""
+        data = [
+            {"action": "create", "data": {"title": "Created", "due_date": "2025-08-01"}},
+            {"action": "update", "id": self.task1.id, "data": {"title": "Updated"}},
+            {"action": "delete", "id": self.task2.id},
+            {"action": "create", "data": {"title": "Created 2"}},
+        ]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([result["status"] for result in response.data], [201, 200, 204, 201])
+        self.assertEqual(response.data[0]["data"]["title"], "Created")
+        self.assertEqual(response.data[1]["data"]["due_date"], "2025-06-01")
+        self.assertEqual(
+            sorted(Task.objects.values_list("title", flat=True)), ["Created", "Created 2", "Updated"]
+        )
+        self.assertTrue(Task.objects.filter(pk=response.data[3]["data"]["id"]).exists())
+
+    def test_invalid_operation_applies_nothing(self):
+        """Test that one invalid operation rejects the whole batch with per-item errors."""
+        data = [
+            {"action": "create", "data": {"title": "Created"}},
+            {"action": "update", "id": self.task1.id, "data": {"title": ""}},
+            {"action": "delete", "id": 9999},
+        ]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("title", response.data[1])
+        self.assertIn("id", response.data[2])
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(Task.objects.get(pk=self.task1.id).title, "Task 1")
+
+    def test_malformed_operations(self):
+        """Test that operations missing required fields are rejected."""
+        data = [{"action": "update", "data": {"title": "No id"}}, {"action": "archive", "id": self.task1.id}]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("id", response.data[0])
+        self.assertIn("action", response.data[1])
+
+    def test_task_in_several_operations(self):
+        """Test that updating and deleting the same task in one batch is rejected."""
+        data = [
+            {"action": "update", "id": self.task1.id, "data": {"title": "Updated"}},
+            {"action": "delete", "id": self.task1.id},
+        ]
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_removing_photo_resets_status_and_variants(self):
+        """Test that removing a photo in a bulk update also clears its status and derivatives."""
+        task = Task.objects.create(
+            title="With photo",
+            photo="task_photos/bulk.png",
+            photo_status=Task.PhotoStatus.DONE,
+            photo_variants={"64": "task_photos/bulk_64.png"},
+        )
+        data = [{"action": "update", "id": task.id, "data": {"photo": None}}]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.data[0]["data"]
+        self.assertEqual((result["photo"], result["photo_status"], result["photo_variants"]), (None, None, {}))
+        task.refresh_from_db()
+        self.assertEqual((task.photo_status, task.photo_variants), (None, {}))
+
+    def test_non_list_body(self):
+        """Test that a body which is not a list is rejected."""
+        response = self.client.post(self.url, {"action": "create"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class NearestDeadlineCacheTestCase(APITestCase):
+    """Test cases for the single-query, cached nearest-deadline lookup."""
+
+    def setUp(self):
+        """Create a task with an upcoming due date."""
+        self.task = Task.objects.create(title="Soon", due_date=timezone.now() + timedelta(days=3))
+        self.url = reverse("nearest-deadline")
+
+    def test_single_query_then_cached(self):
+        """Test that the first request queries tasks once and repeated requests only read the change version."""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data[0]["title"], "Soon")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data[0]["title"], "Soon")
+
+    def test_cache_invalidated_by_save(self):
+        """Test that creating and updating tasks is reflected immediately."""
+        self.client.get(self.url)
+        Task.objects.create(title="Sooner", due_date=timezone.now() + timedelta(days=1))
+        self.assertEqual(self.client.get(self.url).data[0]["title"], "Sooner")
+
+        self.task.due_date = timezone.now()
+        self.task.save()
+        self.assertEqual(self.client.get(self.url).data[0]["title"], "Soon")
+
+    def test_cache_invalidated_by_delete(self):
+        """Test that deleting the cached task is reflected immediately."""
+        self.client.get(self.url)
+        self.task.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cache_invalidated_by_bulk_update(self):
+        """Test that bulk operations, which bypass model signals, invalidate the cache."""
+        self.client.get(self.url)
+        data = [{"action": "update", "id": self.task.id, "data": {"title": "Renamed"}}]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("task-bulk"), data, format="json")
+        self.assertEqual(self.client.get(self.url).data[0]["title"], "Renamed")
+
+    def test_query_uses_partial_index(self):
+        """Test that the nearest-deadline query is answered from the due_date index."""
+        queryset = Task.objects.filter(due_date__isnull=False, due_date__gte=timezone.localdate()).order_by("due_date", "id")
+        self.assertIn("task_due_date_idx", queryset[:1].explain())
+
+
+class ConditionalGetTestCase(APITestCase):
+    """Test cases for ETag and Last-Modified support on task reads."""
+
+    def setUp(self):
+        """Create a task and resolve the read endpoints."""
+        self.task = Task.objects.create(title="Polled", due_date=timezone.now() + timedelta(days=3))
+        self.list_url = reverse("task-list")
+        self.detail_url = reverse("task-detail", args=[self.task.id])
+
+    def test_etag_and_last_modified_headers(self):
+        """Test that successful reads carry ETag and Last-Modified headers."""
+        for url in (self.list_url, self.detail_url, reverse("nearest-deadline"), reverse("task-search") + "?q=polled"):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response["ETag"].startswith('"'))
+            self.assertIn("Last-Modified", response)
+
+    def test_if_none_match_skips_the_tasks(self):
+        """Test that a matching If-None-Match is answered with 304 after reading the change version only."""
+        etag = self.client.get(self.list_url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_differs_per_resource(self):
+        """Test that the list and detail representations do not share an ETag."""
+        self.assertNotEqual(self.client.get(self.list_url)["ETag"], self.client.get(self.detail_url)["ETag"])
+
+    def test_write_changes_etag(self):
+        """Test that a write makes a previously returned ETag stale."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.client.patch(self.detail_url, {"title": "Changed"}, format="json")
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Changed")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_bulk_write_changes_etag(self):
+        """Test that bulk operations, which bypass model signals, also change the ETag."""
+        etag = self.client.get(self.list_url)["ETag"]
+        updated_at = self.task.updated_at
+        data = [{"action": "update", "id": self.task.id, "data": {"title": "Renamed"}}]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("task-bulk"), data, format="json")
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "Renamed")
+        self.assertGreater(self.task.updated_at, updated_at)
+
+    def test_idle_tasks_keep_etag(self):
+        """Test that the ETag stays valid for as long as no task is written."""
+        etag = self.client.get(self.list_url)["ETag"]
+        with mock.patch("django.utils.timezone.now", return_value=timezone.now() + timedelta(hours=1)):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unsignaled_write_changes_etag(self):
+        """Test that writes made without signals or cache invalidation (e.g. by another process) change the ETag."""
+        etag = self.client.get(self.list_url)["ETag"]
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE tasks_task SET title = %s WHERE id = %s", ["Elsewhere", self.task.pk])
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["title"], "Elsewhere")
+
+    def test_if_modified_since(self):
+        """Test that If-Modified-Since is compared with the task's updated_at."""
+        last_modified = self.client.get(self.detail_url)["Last-Modified"]
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Task.objects.filter(pk=self.task.pk).update(updated_at=self.task.updated_at + timedelta(minutes=1))
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TaskSearchTestCase(APITestCase):
+    """Test cases for the full-text task search endpoint."""
+
+    def setUp(self):
+        """Create tasks with searchable titles and descriptions."""
+        self.report = Task.objects.create(title="Quarterly report", description="Numbers for the board")
+        self.meeting = Task.objects.create(title="Board meeting", description="Present the quarterly report")
+        self.cafe = Task.objects.create(title="Café visit", description=None)
+        self.url = reverse("task-search")
+
+    def search(self, q, **params):
+        """Helper method returning the ids of the search results."""
+        response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["id"] for task in response.data]
+
+    def test_title_matches_rank_first(self):
+        """Test that a title match ranks above a description match."""
+        self.assertEqual(self.search("report"), [self.report.id, self.meeting.id])
+        self.assertEqual(self.search("board"), [self.meeting.id, self.report.id])
+
+    def test_prefix_and_all_terms(self):
+        """Test that every term must match, and the last one as a word prefix."""
+        self.assertEqual(self.search("quarterly rep"), [self.report.id, self.meeting.id])
+        self.assertEqual(self.search("quarterly numbers"), [self.report.id])
+        self.assertEqual(self.search("port"), [])
+
+    def test_if_none_match(self):
+        """Test that search results carry an ETag and a matching If-None-Match returns 304 until a task changes."""
+        response = self.client.get(self.url, {"q": "report"})
+        self.assertIn("Last-Modified", response)
+        etag = response["ETag"]
+        response = self.client.get(self.url, {"q": "report"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Task.objects.create(title="Annual report")
+        response = self.client.get(self.url, {"q": "report"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+    def test_diacritics_and_case(self):
+        """Test that matching ignores case and diacritics."""
+        self.assertEqual(self.search("CAFE"), [self.cafe.id])
+
+    def test_operators_are_literal(self):
+        """Test that FTS5 syntax in the query is treated as plain words."""
+        self.assertEqual(self.search('report" OR "café'), [])
+        self.assertEqual(self.search("board*) (meeting^"), [self.meeting.id])
+
+    def test_index_follows_writes(self):
+        """Test that updates, deletes and bulk operations are reflected in the results."""
+        self.cafe.title = "Coffee break"
+        self.cafe.save()
+        self.assertEqual(self.search("cafe"), [])
+        self.assertEqual(self.search("coffee"), [self.cafe.id])
+
+        self.report.delete()
+        self.assertEqual(self.search("numbers"), [])
+
+        Task.objects.filter(pk=self.meeting.pk).update(description="Agenda")
+        Task.objects.bulk_create([Task(title="Agenda draft")])
+        self.assertEqual(len(self.search("agenda")), 2)
+
+    def test_fields_and_limit(self):
+        """Test that results can be limited and restricted to some fields."""
+        response = self.client.get(self.url, {"q": "report", "limit": 1, "fields": "id,title"})
+        self.assertEqual(response.data, [{"id": self.report.id, "title": "Quarterly report"}])
+
+    def test_empty_query(self):
+        """Test that a query without words returns 400."""
+        response = self.client.get(self.url, {"q": " *\"() "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskDeadlineFilterTestCase(APITestCase):
+    """Test cases for the due date filters, ordering and limit of the task list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create overdue, upcoming and undated tasks."""
+        today = timezone.localdate()
+        cls.today = today
+        cls.tasks = {
+            offset: Task.objects.create(title=f"Task {offset}", due_date=today + timedelta(days=offset))
+            for offset in (5, -3, 0, 2, -1, 3)
+        }
+        cls.undated = Task.objects.create(title="Undated")
+        cls.url = reverse("task-list")
+
+    def ids(self, **params):
+        """Helper method returning the ids of the listed tasks."""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["id"] for task in response.data]
+
+    def test_due_window(self):
+        """Test that due_after and due_before select an inclusive window."""
+        ids = self.ids(due_after=str(self.today), due_before=str(self.today + timedelta(days=2)), ordering="due_date")
+        dated = Task.objects.filter(due_date__range=(self.today, self.today + timedelta(days=2)))
+        self.assertEqual(ids, list(dated.order_by("due_date", "id").values_list("id", flat=True)))
+
+    def test_overdue_and_upcoming(self):
+        """Test the overdue and upcoming shortcuts."""
+        self.assertEqual(self.ids(overdue="true", ordering="due_date"), [self.tasks[-3].id, self.tasks[-1].id])
+        self.assertEqual(self.ids(upcoming="true", ordering="due_date", limit=2), [self.tasks[0].id, self.tasks[2].id])
+
+    def test_due_date_ordering_puts_undated_last(self):
+        """Test that unfiltered due_date ordering lists undated tasks last."""
+        ids = self.ids(ordering="due_date")
+        self.assertEqual(ids[0], self.tasks[-3].id)
+        self.assertEqual(ids[-1], self.undated.id)
+
+    def test_filters_combine_with_pagination_and_streaming(self):
+        """Test that filters also apply to paginated and streamed lists."""
+        response = self.client.get(self.url, {"upcoming": "true", "ordering": "due_date", "page_size": 10})
+        self.assertEqual([task["title"] for task in response.data["results"]], ["Task 0", "Task 2", "Task 3", "Task 5"])
+        streamed = self.client.get(self.url, {"overdue": "1", "stream": "true", "fields": "title", "limit": 1})
+        self.assertEqual(len(json.loads(b"".join(streamed.streaming_content))), 1)
+
+    def test_invalid_parameters(self):
+        """Test that malformed dates, orderings and limits return 400."""
+        for params in ({"due_after": "tomorrow"}, {"ordering": "title"}, {"limit": "0"}, {"limit": "ten"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn(next(iter(params)), response.data)
+
+    def test_window_queries_use_index(self):
+        """Test that deadline window queries are answered from the due_date index, in order."""
+        queryset = Task.objects.filter(due_date__isnull=False, due_date__gte=self.today, due_date__lte=self.today)
+        plan = queryset.order_by("due_date", "id")[:10].explain()
+        self.assertIn("task_due_date_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -1,8 +1,10 @@
 from django.urls import path
-from .views import TaskListCreateView, TaskDetailUpdateDeleteView, NearestDeadlineTaskView
+from .views import TaskListCreateView, TaskDetailUpdateDeleteView, NearestDeadlineTaskView, TaskBulkView, TaskSearchView
 
 urlpatterns = [
     path("tasks", TaskListCreateView.as_view(), name="task-list"),
     path("tasks/<int:pk>", TaskDetailUpdateDeleteView.as_view(), name="task-detail"),
     path("tasks/nearest-deadline", NearestDeadlineTaskView.as_view(), name="nearest-deadline"),
+    path("tasks/bulk", TaskBulkView.as_view(), name="task-bulk"),
+    path("tasks/search", TaskSearchView.as_view(), name="task-search"),
 ]
\ No newline at end of file
@@ -1,23 +1,127 @@
+from collections import Counter
 from rest_framework import generics
 from .models import Task
 from rest_framework import status
-from .serializers import TaskSerializer
-from django.utils.timezone import now
+from .serializers import TaskBulkOperationSerializer, TaskRowSerializer, TaskSerializer
+from .filters import TaskDeadlineFilter
+from .pagination import TaskCursorPagination
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.timezone import localdate, now
 from rest_framework.response import Response
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from todolist.renderers import FastJSONRenderer
+from .cache import get_nearest_deadline_task, invalidate_task_caches, nearest_deadline_queryset
+from .conditional import ConditionalGetMixin
+from .photos import release_photo
+from .search import search_task_ids, search_terms
 
-class TaskListCreateView(generics.ListCreateAPIView):
+
+class JSONArrayChunks:
+    """
+    Renders rows into a JSON array, `chunk_size` rows per chunk.
+
+    Rows are fed one at a time with `add`, so the same chunking serves both
+    synchronous and asynchronous row iterators. The joined chunks are
+    identical to the JSON array of all rows.
+    """
+
+    renderer = FastJSONRenderer()
+
+    def __init__(self, serializer, chunk_size):
+        self.serializer = serializer
+        self.chunk_size = chunk_size
+        self.separator = b"["
+        self.chunk = []
+
+    def add(self, row):
+        """Renders `row` and returns the chunk it completes, or None."""
+        self.chunk.append(self.separator + self.renderer.render(self.serializer.to_representation(row)))
+        self.separator = b","
+        if len(self.chunk) < self.chunk_size:
+            return None
+        chunk, self.chunk = b"".join(self.chunk), []
+        return chunk
+
+    def close(self):
+        """Returns the last chunk, which ends the array."""
+        return b"".join(self.chunk) + (b"]" if self.separator == b"," else b"[]")
+
+class TaskListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
     """
     API endpoint that handles listing and creating tasks.
 
     - Required: `title` (max 100 chars).  
     - Optional: `description` (max 500 chars), `due_date`, `photo`.  
     - If `photo` is uploaded, it's converted to grayscale and resized (max 800x800 px).  
+    - Smaller derivatives (thumbnails) are exposed as `photo_variants`, keyed by size in px.
+    - With `TASK_PHOTO_ASYNC` enabled, the photo is processed in the background and
+      `photo_status` reports its progress (`pending`, `processing`, `done`, `failed`).
     - Returns `201 Created` on success or `400 Bad Request` on validation errors.
+    - **GET** returns all tasks, unless `page_size` or `cursor` is given: then the
+      response is one page (`{"next": ..., "results": [...]}`) in `ordering`
+      (`id` or `due_date`), and `next` links to the following page.
+    - **GET** with `stream=true` streams the full JSON array while reading the
+      tasks in chunks, so memory use does not grow with the number of tasks.
+    - **GET** with `fields=id,title,...` returns only the listed fields.
+    - **GET** filters: `due_after` / `due_before` (inclusive dates), `overdue=true`,
+      `upcoming=true`; `ordering` (`id` or `due_date`) and `limit` give e.g. the
+      next N tasks due: `?upcoming=true&ordering=due_date&limit=N`.
+    - **GET** responses carry `ETag` and `Last-Modified`; conditional requests
+      return `304 Not Modified` while no task has changed.
     """
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+    filter_backends = (TaskDeadlineFilter,)
+    pagination_class = TaskCursorPagination
+    stream_chunk_size = 1000
+    # Columns the keyset pagination reads from every row.
+    row_key_fields = ("id", "due_date")
+
+    @extend_schema(parameters=[
+        OpenApiParameter("fields", str, description="Comma-separated list of fields to return, e.g. `id,title,due_date`."),
+        OpenApiParameter("stream", bool, description="Stream the full list instead of returning it at once."),
+    ])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists tasks through the lean row serializer.
+
+        Rows are read with `.values()` instead of as model instances; the output
+        is identical to `TaskSerializer`, restricted to `fields` when given.
+        """
+        serializer = TaskRowSerializer.from_request(request)
+        queryset = serializer.select(self.filter_queryset(self.get_queryset()), *self.row_key_fields)
 
-class TaskDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
+        limit = TaskDeadlineFilter().get_limit(request)
+        if request.query_params.get("stream") in ("true", "1"):
+            return self.stream_list(queryset[:limit], serializer)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([serializer.to_representation(row) for row in page])
+        return Response([serializer.to_representation(row) for row in queryset[:limit]])
+
+    def stream_list(self, queryset, serializer):
+        """
+        Returns a streaming response that renders the JSON array chunk by chunk.
+
+        The output is identical to the regular (unpaginated) list response.
+        """
+        chunks = JSONArrayChunks(serializer, self.stream_chunk_size)
+
+        def render():
+            for row in queryset.iterator(chunk_size=self.stream_chunk_size):
+                chunk = chunks.add(row)
+                if chunk is not None:
+                    yield chunk
+            yield chunks.close()
+
+        return StreamingHttpResponse(render(), content_type="application/json")
+
+class TaskDetailUpdateDeleteView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API endpoint to handle retrieving, updating, and deleting a single task.
 
@@ -28,29 +132,220 @@ class TaskDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
 
     **Behavior:**
     - Image processing (grayscale & resizing) is handled in the serializer.
+    - **GET** responses carry `ETag` and `Last-Modified` (the task's `updated_at`);
+      conditional requests return `304 Not Modified` while no task has changed.
     """
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+    def get_last_modified(self):
+        """Returns when the requested task was last updated."""
+        return Task.objects.filter(pk=self.kwargs["pk"]).values_list("updated_at", flat=True).first()
 
-class NearestDeadlineTaskView(generics.ListAPIView):
+
+class TaskBulkView(generics.GenericAPIView):
+    """
+    API endpoint that creates, updates and deletes many tasks in one request.
+
+    - **Input**: JSON array of operations:
+      ```json
+      [
+        {"action": "create", "data": {"title": "New task"}},
+        {"action": "update", "id": 1, "data": {"due_date": "2025-08-01"}},
+        {"action": "delete", "id": 2}
+      ]
+      ```
+    - Every operation is validated with the regular task rules first; updates are partial.
+    - If all operations are valid they are applied in a single transaction with
+      bulk inserts and updates, and a list of per-operation results is returned.
+    - Otherwise nothing is applied and `400 Bad Request` returns a list of
+      per-operation errors (empty for valid operations).
+    - Photos cannot be uploaded through this endpoint.
+    """
+    queryset = Task.objects.all()
+    serializer_class = TaskBulkOperationSerializer
+    max_operations = 10000
+    batch_size = 500
+
+    def post(self, request, *args, **kwargs):
+        """Validate all operations, then apply them atomically."""
+        if not isinstance(request.data, list):
+            return Response({"detail": "Expected a list of operations."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(request.data) > self.max_operations:
+            return Response(
+                {"detail": f"At most {self.max_operations} operations are allowed per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        operations = self.get_serializer(data=request.data, many=True)
+        if not operations.is_valid():
+            return Response(operations.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        task_serializers, errors = self.validate_operations(operations.validated_data)
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            results = self.apply_operations(operations.validated_data, task_serializers)
+            transaction.on_commit(invalidate_task_caches)
+        return Response(results)
+
+    def validate_operations(self, operations):
+        """
+        Validates the payload of every operation against `TaskSerializer` in one pass.
+
+        Returns the task serializer of each operation (the task itself for
+        deletes) and the list of per-operation errors.
+        """
+        ids = [operation["id"] for operation in operations if "id" in operation]
+        instances = self.get_queryset().in_bulk(ids)
+        context = self.get_serializer_context()
+        repeated = {task_id for task_id, count in Counter(ids).items() if count > 1}
+
+        task_serializers, errors = [], []
+        for operation in operations:
+            serializer, error = None, {}
+            instance = instances.get(operation.get("id"))
+            if operation["action"] != "create" and instance is None:
+                error = {"id": ["Not found."]}
+            elif operation.get("id") in repeated:
+                error = {"id": ["A task can only appear in one operation."]}
+            elif operation["action"] == "create":
+                serializer = TaskSerializer(data=operation["data"], context=context)
+            elif operation["action"] == "update":
+                serializer = TaskSerializer(instance, data=operation["data"], partial=True, context=context)
+            else:
+                serializer = instance
+
+            if isinstance(serializer, TaskSerializer) and not serializer.is_valid():
+                error = serializer.errors
+            task_serializers.append(serializer)
+            errors.append(error)
+        return task_serializers, errors
+
+    def apply_operations(self, operations, task_serializers):
+        """
+        Applies validated operations with one bulk query per action.
+
+        Returns the per-operation results in request order.
+        """
+        created, updated, deleted, released = [], [], [], []
+        update_fields = {"updated_at"}
+        updated_at = now()
+        for operation, serializer in zip(operations, task_serializers):
+            if operation["action"] == "create":
+                created.append(Task(**serializer.validated_data))
+            elif operation["action"] == "update":
+                instance = serializer.instance
+                if "photo" in serializer.validated_data and instance.photo:
+                    released.append(instance.photo.name)
+                for attr, value in serializer.validated_data.items():
+                    setattr(instance, attr, value)
+                if "photo" in serializer.validated_data:
+                    instance.photo_status = None
+                    instance.photo_variants = {}
+                    update_fields.update(("photo_status", "photo_variants"))
+                instance.updated_at = updated_at
+                update_fields.update(serializer.validated_data)
+                updated.append(instance)
+            else:
+                deleted.append(serializer.pk)
+
+        Task.objects.bulk_create(created, batch_size=self.batch_size)
+        if updated:
+            Task.objects.bulk_update(updated, sorted(update_fields), batch_size=self.batch_size)
+        if deleted:
+            Task.objects.filter(pk__in=deleted).delete()
+        for name in released:
+            release_photo(name)
+
+        context = self.get_serializer_context()
+        created = iter(created)
+        results = []
+        for operation, serializer in zip(operations, task_serializers):
+            if operation["action"] == "create":
+                data = TaskSerializer(next(created), context=context).data
+                results.append({"action": "create", "status": status.HTTP_201_CREATED, "data": data})
+            elif operation["action"] == "update":
+                data = TaskSerializer(serializer.instance, context=context).data
+                results.append({"action": "update", "status": status.HTTP_200_OK, "data": data})
+            else:
+                results.append({"action": "delete", "status": status.HTTP_204_NO_CONTENT, "id": operation["id"]})
+        return results
+
+
+class NearestDeadlineTaskView(ConditionalGetMixin, generics.ListAPIView):
     """
     API endpoint to retrieve the task with the nearest upcoming due_date.
 
     - **GET**: Returns the task with the closest due_date (excluding null values).
     - **Response**: JSON with task details, or `404 Not Found` if no tasks have a due date.
+    - The lookup runs a single indexed query and is cached in-process until the next write.
+    - Responses carry `ETag` and `Last-Modified` for conditional requests.
     """
     serializer_class = TaskSerializer
 
     def get_queryset(self):
         """Filter tasks to get the one with the nearest due_date."""
-        return Task.objects.filter(due_date__isnull=False, due_date__gte=now()).order_by("due_date")[:1]
+        return nearest_deadline_queryset(localdate())[:1]
 
     def list(self, request, *args, **kwargs):
-        """Override list method to return 404 if no tasks are found."""
-        queryset = self.get_queryset()
-        if not queryset.exists():
+        """Return the cached nearest task, or 404 if no tasks are found."""
+        task = get_nearest_deadline_task()
+        if task is None:
             return Response({"detail": "No tasks with a due date found."}, status=status.HTTP_404_NOT_FOUND)
-        return super().list(request, *args, **kwargs)
+        serializer = self.get_serializer([task], many=True)
+        return Response(serializer.data)
+
+
+class TaskSearchView(ConditionalGetMixin, generics.ListAPIView):
+    """
+    API endpoint for full-text search over task titles and descriptions.
+
+    - **GET** `?q=...`: Returns the best matching tasks, best match first.
+      Every word of `q` must match; the last one also matches as a prefix
+      (`quarterly rep` finds "Quarterly report").
+      Matches in the title rank above matches in the description.
+    - `limit` caps the number of results (default 20, max 100).
+    - `fields=id,title,...` returns only the listed fields.
+    - Returns `400 Bad Request` if `q` contains no words.
+    - Backed by an SQLite FTS5 index kept in sync by triggers.
+    - Responses carry `ETag` and `Last-Modified` for conditional requests.
+    """
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    default_limit = 20
+    max_limit = 100
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", str, required=True, description="Words to search for."),
+            OpenApiParameter("limit", int, description="Maximum number of results (default 20, max 100)."),
+            OpenApiParameter("fields", str, description="Comma-separated list of fields to return."),
+        ],
+        responses=TaskSerializer(many=True),
+    )
+    def get(self, request, *args, **kwargs):
+        """Return the tasks matching `q`, ranked by relevance."""
+        return super().get(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """Runs the search; called by `get` unless a conditional request is answered first."""
+        query = request.query_params.get("q", "")
+        if not search_terms(query):
+            return Response({"q": ["Enter at least one word to search for."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = TaskRowSerializer.from_request(request)
+        ids = search_task_ids(query, self.get_limit())
+        rows = {row["id"]: row for row in serializer.select(self.get_queryset().filter(pk__in=ids), "id")}
+        return Response([serializer.to_representation(rows[pk]) for pk in ids if pk in rows])
 
-    
\ No newline at end of file
+    def get_limit(self):
+        """Returns the requested number of results, capped at `max_limit`."""
+        try:
+            limit = int(self.request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
@@ -11,6 +11,7 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
+# Serve the task API with its native async views.
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.asgi_settings')
 
 application = get_asgi_application()
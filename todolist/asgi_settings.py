@@ -0,0 +1,9 @@
+"""
+Django settings for serving todolist under ASGI (see `todolist.asgi`).
+
+Identical to `todolist.settings`, except that the task API is served with its
+native async views.
+"""
+from .settings import *
+
+ROOT_URLCONF = 'todolist.asgi_urls'
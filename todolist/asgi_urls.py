@@ -0,0 +1,14 @@
+"""
+URL configuration used under ASGI (see `todolist.asgi_settings`).
+
+The task endpoints with native async implementations come first; every other
+route is resolved by `todolist.urls`.
+"""
+from django.urls import include, path
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path("api/", include("tasks.async_urls")),
+    *sync_urlpatterns,
+]
@@ -0,0 +1,47 @@
+"""
+JSON renderer backed by orjson.
+
+Renders the same bytes as DRF's `JSONRenderer` for the data this API returns,
+several times faster on large responses. Falls back to `JSONRenderer` when
+orjson is not installed, for indented output, for non-compact or ASCII-only
+settings, and for data orjson cannot encode (e.g. integers beyond 64 bits).
+
+Known difference: floats needing an exponent are written as `1e16` rather
+than `1e+16` (the same number); the API's serializers return no such floats.
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Dates and times go through DRF's encoder, which formats them differently from orjson.
+    ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` producing the same output with orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped by `JSONRenderer` so the output is a strict JavaScript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -0,0 +1,29 @@
+from django.db import transaction
+
+
+class ReadReplicaRouter:
+    """
+    Sends reads to the read-only `replica` connection and writes to `default`.
+
+    Both aliases point at the same SQLite file in WAL mode, so reads see every
+    committed write and are never blocked by a writer. Reads made inside a
+    transaction on `default` stay on `default`, so they see the transaction's
+    own uncommitted writes. Migrations only run on `default`.
+    """
+
+    read_alias = "replica"
+    write_alias = "default"
+
+    def db_for_read(self, model, **hints):
+        if transaction.get_connection(self.write_alias).in_atomic_block:
+            return self.write_alias
+        return self.read_alias
+
+    def db_for_write(self, model, **hints):
+        return self.write_alias
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == self.write_alias
@@ -78,13 +78,53 @@ WSGI_APPLICATION = 'todolist.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# SQLite is tuned for concurrent use:
+# - WAL journaling, so readers never wait for a writer (and vice versa);
+# - synchronous=NORMAL, which is durable across application crashes in WAL mode;
+# - a memory-mapped read path and a larger page cache (in KiB when negative);
+# - writes take the lock up front (IMMEDIATE) and wait up to `timeout` seconds
+#   for it instead of failing with "database is locked";
+# - connections are kept open between requests.
+# `replica` is a second, read-only connection to the same file; see
+# `todolist.routers.ReadReplicaRouter`.
+
+SQLITE_INIT_COMMAND = (
+    'PRAGMA journal_mode=WAL;'
+    'PRAGMA synchronous=NORMAL;'
+    'PRAGMA mmap_size=268435456;'
+    'PRAGMA cache_size=-65536;'
+    'PRAGMA temp_store=MEMORY;'
+)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': SQLITE_INIT_COMMAND,
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 5,
+        },
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': SQLITE_INIT_COMMAND + 'PRAGMA query_only=ON;',
+            'timeout': 5,
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
 }
 
+DATABASE_ROUTERS = ['todolist.routers.ReadReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -127,6 +167,67 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# REST framework
+# JSON is rendered and parsed with orjson (todolist.renderers / todolist.parsers),
+# with the same output as DRF's JSONRenderer / JSONParser, which they fall back to
+# when orjson is not installed.
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': [
+        'todolist.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'todolist.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Task photo processing
+# Uploaded photos are converted to grayscale and resized to fit in
+# TASK_PHOTO_MAX_SIZE x TASK_PHOTO_MAX_SIZE pixels. Smaller derivatives for
+# each of TASK_PHOTO_DERIVATIVE_SIZES are rendered from the same decode.
+# With TASK_PHOTO_ASYNC enabled, uploads are returned immediately with a
+# `pending` photo_status and processed by a local pool of TASK_PHOTO_WORKERS threads.
+
+TASK_PHOTO_MAX_SIZE = 800
+
+TASK_PHOTO_DERIVATIVE_SIZES = (64, 256)
+
+TASK_PHOTO_ASYNC = False
+
+TASK_PHOTO_WORKERS = 2
+
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Task read caches
+# Cached reads are dropped on every write made by this process; the TTL (in
+# seconds) bounds how long writes made by other processes can go unnoticed.
+# The change version behind the ETag/Last-Modified headers is not cached: it
+# is read from a row that database triggers keep up to date.
+
+TASK_NEAREST_DEADLINE_CACHE_TTL = 5
+
+# Leetcode result cache
+# Results of identical leetcode requests are kept in an in-process LRU of up to
+# MAX_ENTRIES results holding MAX_TOTAL_SIZE items (ints) in total; results with
+# more than MAX_RESULT_SIZE items are not cached. Set CACHE_ALIAS to a key of
+# CACHES to also share results between processes (entries expire after TIMEOUT
+# seconds there).
+
+LEETCODE_RESULT_CACHE = {
+    'MAX_ENTRIES': 1024,
+    'MAX_RESULT_SIZE': 100_000,
+    'MAX_TOTAL_SIZE': 1_000_000,
+    'CACHE_ALIAS': None,
+    'TIMEOUT': 3600,
 }